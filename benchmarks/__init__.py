@@ -0,0 +1,25 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Django
+from django.db import connection
+
+
+# ==============================================================================
+# HELPERS
+# ==============================================================================
+_created_models = set()
+
+
+def create_tables(*models):
+    """Creates the tables of the models in the (in-memory) benchmark
+    database, once per process.
+
+    """
+    with connection.schema_editor() as schema_editor:
+        for model in models:
+            if model in _created_models:
+                continue
+
+            schema_editor.create_model(model)
+            _created_models.add(model)
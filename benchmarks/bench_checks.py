@@ -0,0 +1,30 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# App
+from timezone_utils.choices import PRETTY_ALL_TIMEZONES_CHOICES
+from timezone_utils.fields import TimeZoneField
+
+
+# ==============================================================================
+# BENCHMARKS
+# ==============================================================================
+FIELDS = 300
+
+
+def bench_check_300_fields_with_all_choices():
+    """TimeZoneField system checks for a project with 300 time zone fields
+    whose choices are every pytz time zone.
+
+    """
+    fields = [
+        TimeZoneField(choices=PRETTY_ALL_TIMEZONES_CHOICES)
+        for _ in range(FIELDS)
+    ]
+
+    def run():
+        for field in fields:
+            field._check_timezone_max_length_attribute()
+            field._check_choices_attribute()
+
+    return run
@@ -0,0 +1,60 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+import importlib
+import pytz
+
+# App
+from timezone_utils import choices
+
+
+# ==============================================================================
+# BENCHMARKS
+# ==============================================================================
+def bench_import_choices():
+    """Time to (re-)execute the timezone_utils.choices module."""
+
+    def run():
+        importlib.reload(choices)
+
+    return run
+
+
+def bench_import_choices_and_evaluate():
+    """Time to import the choices module and evaluate every constant, which
+    is what importing the module cost before the constants became lazy.
+
+    """
+
+    def run():
+        module = importlib.reload(choices)
+        for name in module.__all__:
+            constant = getattr(module, name)
+            if isinstance(constant, module.LazyChoices):
+                len(constant)
+
+    return run
+
+
+def bench_get_choices_all_timezones():
+    """Builds the pretty choices of every pytz time zone."""
+
+    def run():
+        choices.get_choices.cache_clear()
+        choices.get_choices(pytz.all_timezones)
+
+    return run
+
+
+def bench_get_choices_memoized():
+    """Retrieves the memoized pretty choices of a list of time zones, as a
+    form's __init__ does.
+
+    """
+    timezones = pytz.country_timezones('US')
+
+    def run():
+        choices.get_choices(timezones)
+
+    return run
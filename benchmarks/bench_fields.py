@@ -0,0 +1,205 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from datetime import datetime, timedelta
+import pytz
+
+# Django
+from django.db import connection
+
+# App
+from benchmarks import create_tables
+from tests.models import (LocationTimeZone, LocationTimeZoneID,
+                          ModelWithDateTimeOnly, ModelWithLocalTimeZone,
+                          ModelWithRelatedTimeZonePath, StaticTimeStampedModel,
+                          TZTimeFramedModel, TZWithGoodStringDefault)
+
+
+# ==============================================================================
+# BENCHMARKS
+# ==============================================================================
+ROWS = 10000
+ZONES = ('US/Eastern', 'US/Pacific', 'Europe/London', 'Europe/Paris',
+         'Asia/Tokyo', 'Asia/Kolkata', 'Australia/Sydney', 'America/Sao_Paulo',
+         'Africa/Cairo', 'UTC')
+VALUE = pytz.utc.localize(datetime(2014, 6, 1, 12, 30))
+
+
+def bench_timezonefield_from_db_value():
+    """TimeZoneField.from_db_value for 10,000 time zone names."""
+    field = LocationTimeZone._meta.get_field('timezone')
+    values = [ZONES[i % len(ZONES)] for i in range(ROWS)]
+
+    def run():
+        for value in values:
+            field.from_db_value(value, None, connection)
+
+    return run
+
+
+def bench_timezonefield_db_converter():
+    """The TimeZoneField database converter for 10,000 time zone names."""
+    field = LocationTimeZone._meta.get_field('timezone')
+    values = [ZONES[i % len(ZONES)] for i in range(ROWS)]
+
+    def run():
+        convert, = field.get_db_converters(connection)
+        for value in values:
+            convert(value, None, connection)
+
+    return run
+
+
+def bench_timezonefield_queryset():
+    """Loads 10,000 TimeZoneField values from SQLite."""
+    create_tables(LocationTimeZone)
+
+    if not LocationTimeZone.objects.exists():
+        LocationTimeZone.objects.bulk_create([
+            LocationTimeZone(timezone=ZONES[i % len(ZONES)])
+            for i in range(ROWS)
+        ])
+
+    queryset = LocationTimeZone.objects.values_list('timezone', flat=True)
+
+    def run():
+        list(queryset.all())
+
+    return run
+
+
+def _create_location_rows():
+    create_tables(LocationTimeZoneID)
+
+    if not LocationTimeZoneID.objects.exists():
+        LocationTimeZoneID.objects.bulk_create([
+            LocationTimeZoneID(timezone=ZONES[i % len(ZONES)])
+            for i in range(ROWS)
+        ])
+
+
+def bench_filter_utcoffset_python():
+    """Finds the rows at UTC-04:00 among 10,000 TimeZoneIDField values by
+    loading every row and computing its offset.
+
+    """
+    _create_location_rows()
+    offset = timedelta(hours=-4)
+
+    def run():
+        [
+            location
+            for location in LocationTimeZoneID.objects.all()
+            if VALUE.astimezone(location.timezone).utcoffset() == offset
+        ]
+
+    return run
+
+
+def bench_filter_utcoffset_lookup():
+    """Finds the rows at UTC-04:00 among 10,000 TimeZoneIDField values with
+    the utcoffset lookup.
+
+    """
+    _create_location_rows()
+
+    def run():
+        list(LocationTimeZoneID.objects.filter(
+            timezone__utcoffset=(-240, VALUE)
+        ))
+
+    return run
+
+
+def _bench_pre_save(model, attname, **kwargs):
+    instance = model(**kwargs)
+    field = model._meta.get_field(attname)
+
+    def run():
+        setattr(instance, attname, VALUE)
+        field.pre_save(instance, add=False)
+
+    return run
+
+
+def bench_pre_save():
+    """LinkedTZDateTimeField.pre_save without populate_from or
+    time_override.
+
+    """
+    return _bench_pre_save(ModelWithDateTimeOnly, 'timestamp')
+
+
+def bench_pre_save_populate_from():
+    """LinkedTZDateTimeField.pre_save with populate_from (a field name)."""
+    return _bench_pre_save(
+        ModelWithLocalTimeZone,
+        'timestamp',
+        timezone='US/Pacific'
+    )
+
+
+def bench_pre_save_time_override():
+    """LinkedTZDateTimeField.pre_save with time_override."""
+    return _bench_pre_save(StaticTimeStampedModel, 'start')
+
+
+def bench_pre_save_populate_from_time_override():
+    """LinkedTZDateTimeField.pre_save with populate_from (a callable) and
+    time_override.
+
+    """
+    return _bench_pre_save(
+        TZTimeFramedModel,
+        'start',
+        other_model=TZWithGoodStringDefault(timezone='US/Pacific')
+    )
+
+
+def _create_related_rows():
+    create_tables(TZWithGoodStringDefault, ModelWithRelatedTimeZonePath)
+
+    if not ModelWithRelatedTimeZonePath.objects.exists():
+        locations = TZWithGoodStringDefault.objects.bulk_create([
+            TZWithGoodStringDefault(timezone=tz_name) for tz_name in ZONES
+        ])
+        ModelWithRelatedTimeZonePath.objects.bulk_create([
+            ModelWithRelatedTimeZonePath(
+                other_model=locations[i % len(locations)]
+            )
+            for i in range(ROWS)
+        ])
+
+
+def bench_linked_queryset_select_related():
+    """Loads 10,000 LinkedTZDateTimeField values whose populate_from is a
+    related field, with select_related and astimezone.
+
+    """
+    _create_related_rows()
+    queryset = ModelWithRelatedTimeZonePath.objects.select_related(
+        'other_model'
+    )
+
+    def run():
+        for instance in queryset.all():
+            instance.timestamp = instance.timestamp.astimezone(
+                instance.other_model.timezone
+            )
+
+    return run
+
+
+def bench_linked_queryset_localized():
+    """Loads 10,000 LinkedTZDateTimeField values whose populate_from is a
+    related field, with LinkedTZQuerySet.localized().
+
+    """
+    _create_related_rows()
+    queryset = ModelWithRelatedTimeZonePath.objects.localized()
+
+    def run():
+        list(queryset.all())
+
+    return run
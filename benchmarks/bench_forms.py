@@ -0,0 +1,109 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Django
+from django.core.exceptions import ValidationError
+from django.forms import Select
+
+# App
+from tests.models import LocationTimeZoneChoices
+from timezone_utils.choices import (GROUPED_ALL_TIMEZONES_CHOICES,
+                                    PRETTY_ALL_TIMEZONES_CHOICES)
+from timezone_utils.forms import TimeZoneField
+from timezone_utils.search import search_timezones
+from timezone_utils.widgets import TimeZoneSearchInput, TimeZoneSelect
+
+
+# ==============================================================================
+# BENCHMARKS
+# ==============================================================================
+def bench_clean():
+    """forms.TimeZoneField.clean of a valid time zone name."""
+    field = TimeZoneField()
+
+    def run():
+        field.clean('US/Eastern')
+
+    return run
+
+
+def bench_clean_invalid():
+    """forms.TimeZoneField.clean of an invalid time zone name."""
+    field = TimeZoneField()
+
+    def run():
+        try:
+            field.clean('Bad/Worse')
+        except ValidationError:
+            pass
+
+    return run
+
+
+def bench_formfield_clean_with_choices():
+    """Form field of a model TimeZoneField with every pytz time zone as
+    choices.
+
+    """
+    field = LocationTimeZoneChoices._meta.get_field('timezone').formfield()
+    len(PRETTY_ALL_TIMEZONES_CHOICES)
+
+    def run():
+        field.clean('US/Eastern')
+
+    return run
+
+
+def bench_render_select():
+    """Renders a <select> with every pytz time zone as an option."""
+    widget = Select(choices=PRETTY_ALL_TIMEZONES_CHOICES)
+    len(PRETTY_ALL_TIMEZONES_CHOICES)
+
+    def run():
+        widget.render('timezone', 'US/Eastern')
+
+    return run
+
+
+def bench_render_grouped_select():
+    """Renders a Select of GROUPED_ALL_TIMEZONES_CHOICES."""
+    widget = Select(choices=GROUPED_ALL_TIMEZONES_CHOICES)
+
+    def run():
+        widget.render('timezone', 'US/Eastern')
+
+    return run
+
+
+def bench_render_grouped_timezone_select():
+    """Renders a TimeZoneSelect of GROUPED_ALL_TIMEZONES_CHOICES, whose
+    options are cached after the first render.
+
+    """
+    widget = TimeZoneSelect(choices=GROUPED_ALL_TIMEZONES_CHOICES)
+    widget.render('timezone', 'US/Eastern')
+
+    def run():
+        widget.render('timezone', 'US/Eastern')
+
+    return run
+
+
+def bench_render_search_input():
+    """Renders a TimeZoneSearchInput."""
+    widget = TimeZoneSearchInput(url='/timezones/search/')
+
+    def run():
+        widget.render('timezone', 'US/Eastern')
+
+    return run
+
+
+def bench_search_timezones():
+    """Searches every pytz time zone for a name segment."""
+    search_timezones('york')
+
+    def run():
+        search_timezones('york')
+
+    return run
@@ -0,0 +1,44 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+import importlib
+import sys
+
+
+# ==============================================================================
+# BENCHMARKS
+# ==============================================================================
+# In dependency order
+MODULES = (
+    'timezone_utils.zones',
+    'timezone_utils.cache',
+    'timezone_utils.zone_ids',
+    'timezone_utils.offsets',
+    'timezone_utils.choices',
+    'timezone_utils.forms',
+    'timezone_utils.fields',
+)
+
+
+def bench_import_timezone_utils():
+    """Time to import the timezone_utils modules from scratch (Django and
+    pytz are already imported).
+
+    """
+    package = sys.modules['timezone_utils']
+
+    def run():
+        originals = {name: sys.modules.pop(name) for name in MODULES}
+
+        try:
+            for name in MODULES:
+                importlib.import_module(name)
+        finally:
+            # Put the original modules back, so that the other benchmarks
+            #   keep sharing their caches
+            sys.modules.update(originals)
+            for name, module in originals.items():
+                setattr(package, name.rpartition('.')[2], module)
+
+    return run
@@ -0,0 +1,90 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from datetime import datetime, timedelta
+import pytz
+
+# App
+from tests.models import ModelWithLocalTimeZone, StaticTimeStampedModel
+from timezone_utils.providers import PytzProvider, ZoneInfoProvider, zoneinfo
+
+
+# ==============================================================================
+# BENCHMARKS
+# ==============================================================================
+ROWS = 1000
+VALUES = [
+    pytz.utc.localize(datetime(2014, 1, 1) + timedelta(hours=7 * i))
+    for i in range(ROWS)
+]
+
+
+def _bench_get(provider_class):
+    provider = provider_class()
+
+    def run():
+        provider.get('US/Eastern')
+
+    return run
+
+
+def _bench_convert_values(provider_class, model, attname):
+    field = model._meta.get_field(attname)
+    tz = provider_class().get('US/Eastern')
+
+    def run():
+        field._convert_values(values=VALUES, tz=tz, add=False)
+
+    return run
+
+
+def bench_pytz_get():
+    """PytzProvider.get of a time zone name."""
+    return _bench_get(PytzProvider)
+
+
+def bench_pytz_convert_values():
+    """Converts 1,000 aware values to a pytz time zone."""
+    return _bench_convert_values(
+        PytzProvider,
+        ModelWithLocalTimeZone,
+        'timestamp'
+    )
+
+
+def bench_pytz_convert_values_time_override():
+    """Converts 1,000 aware values to a pytz time zone, with a time
+    override.
+
+    """
+    return _bench_convert_values(
+        PytzProvider,
+        StaticTimeStampedModel,
+        'start'
+    )
+
+
+if zoneinfo is not None:
+    def bench_zoneinfo_get():
+        """ZoneInfoProvider.get of a time zone name."""
+        return _bench_get(ZoneInfoProvider)
+
+    def bench_zoneinfo_convert_values():
+        """Converts 1,000 aware values to a zoneinfo time zone."""
+        return _bench_convert_values(
+            ZoneInfoProvider,
+            ModelWithLocalTimeZone,
+            'timestamp'
+        )
+
+    def bench_zoneinfo_convert_values_time_override():
+        """Converts 1,000 aware values to a zoneinfo time zone, with a time
+        override.
+
+        """
+        return _bench_convert_values(
+            ZoneInfoProvider,
+            StaticTimeStampedModel,
+            'start'
+        )
@@ -0,0 +1,118 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from datetime import datetime, time, timedelta
+import pytz
+
+# App
+from benchmarks import create_tables
+from benchmarks.bench_fields import ZONES
+from tests.models import ReminderModel
+from timezone_utils.cache import get_timezone
+from timezone_utils.scheduling import next_occurrences
+
+ROWS = 100000
+AFTER = pytz.utc.localize(datetime(2014, 6, 1, 12, 30))
+TIMES = [time(hour, minute) for hour in range(24) for minute in (0, 30)]
+
+
+# ==============================================================================
+# BENCHMARKS
+# ==============================================================================
+def _rows():
+    return (
+        [ZONES[i % len(ZONES)] for i in range(ROWS)],
+        [TIMES[i % len(TIMES)] for i in range(ROWS)],
+    )
+
+
+def bench_next_occurrence_per_row():
+    """Next UTC occurrence of 100,000 local times, each combined with its
+    local date and localized.
+
+    """
+    zones, times = _rows()
+
+    def run():
+        for zone, value in zip(zones, times):
+            tz = get_timezone(zone)
+            local_date = AFTER.astimezone(tz).date()
+            occurrence = tz.localize(datetime.combine(local_date, value))
+
+            if occurrence <= AFTER:
+                occurrence = tz.localize(datetime.combine(
+                    local_date + timedelta(days=1),
+                    value
+                ))
+
+            occurrence.astimezone(pytz.utc)
+
+    return run
+
+
+def bench_next_occurrences():
+    """Next UTC occurrence of 100,000 local times with
+    scheduling.next_occurrences.
+
+    """
+    zones, times = _rows()
+
+    def run():
+        next_occurrences(zones, times, after=AFTER)
+
+    return run
+
+
+def _create_reminder_rows():
+    create_tables(ReminderModel)
+
+    if not ReminderModel.objects.exists():
+        zones, times = _rows()
+        ReminderModel.objects.bulk_create([
+            ReminderModel(timezone=zone, remind_at=value)
+            for zone, value in zip(zones[:10000], times[:10000])
+        ])
+
+
+def bench_due_python():
+    """Finds the reminders due in the next 15 minutes among 10,000 rows by
+    loading every row and computing its next occurrence.
+
+    """
+    _create_reminder_rows()
+    end = AFTER + timedelta(minutes=15)
+
+    def run():
+        reminders = list(ReminderModel.objects.all())
+        occurrences = next_occurrences(
+            [reminder.timezone for reminder in reminders],
+            [reminder.remind_at for reminder in reminders],
+            after=AFTER - timedelta(microseconds=1)
+        )
+        [
+            reminder
+            for reminder, occurrence in zip(reminders, occurrences)
+            if occurrence < end
+        ]
+
+    return run
+
+
+def bench_due_queryset():
+    """Finds the reminders due in the next 15 minutes among 10,000 rows with
+    LinkedTZQuerySet.due.
+
+    """
+    _create_reminder_rows()
+    end = AFTER + timedelta(minutes=15)
+
+    def run():
+        list(ReminderModel.objects.due(
+            'remind_at',
+            AFTER,
+            end,
+            timezone='timezone'
+        ))
+
+    return run
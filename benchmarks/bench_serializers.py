@@ -0,0 +1,83 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# App
+from benchmarks.bench_fields import _create_related_rows
+from tests.models import ModelWithRelatedTimeZonePath
+
+try:
+    from rest_framework import serializers
+    from timezone_utils.serializers import TimeZoneModelSerializer
+except ImportError:     # pragma: no cover
+    serializers = None
+
+
+# ==============================================================================
+# BENCHMARKS
+# ==============================================================================
+if serializers is not None:
+    class StockSerializer(serializers.ModelSerializer):
+        """Serializes the values in the current time zone."""
+
+        class Meta:
+            model = ModelWithRelatedTimeZonePath
+            fields = ('id', 'timestamp')
+
+    class MethodFieldSerializer(serializers.ModelSerializer):
+        """Localizes the values per object, as a SerializerMethodField."""
+        timestamp = serializers.SerializerMethodField()
+
+        class Meta:
+            model = ModelWithRelatedTimeZonePath
+            fields = ('id', 'timestamp')
+
+        def get_timestamp(self, obj):
+            return obj.timestamp.astimezone(
+                obj.other_model.timezone
+            ).isoformat()
+
+    class LinkedSerializer(TimeZoneModelSerializer):
+        class Meta:
+            model = ModelWithRelatedTimeZonePath
+            fields = ('id', 'timestamp')
+
+    def _bench_list(serializer_class, queryset):
+        _create_related_rows()
+        instances = list(queryset)
+
+        def run():
+            serializer_class(instances, many=True).data
+
+        return run
+
+    def bench_serialize_list_stock():
+        """Serializes 10,000 objects with a stock ModelSerializer (in the
+        current time zone, not the linked one).
+
+        """
+        return _bench_list(
+            StockSerializer,
+            ModelWithRelatedTimeZonePath.objects.all()
+        )
+
+    def bench_serialize_list_method_field():
+        """Serializes 10,000 objects in their linked (related) time zones
+        with a SerializerMethodField and select_related.
+
+        """
+        return _bench_list(
+            MethodFieldSerializer,
+            ModelWithRelatedTimeZonePath.objects.select_related(
+                'other_model'
+            )
+        )
+
+    def bench_serialize_list_linked():
+        """Serializes 10,000 objects in their linked (related) time zones
+        with serializers.LinkedTZDateTimeField, without select_related.
+
+        """
+        return _bench_list(
+            LinkedSerializer,
+            ModelWithRelatedTimeZonePath.objects.all()
+        )
@@ -0,0 +1,67 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from datetime import datetime, timedelta
+import pytz
+
+# App
+from tests.models import ModelWithLocalTimeZone
+from timezone_utils.vectorized import localize_epochs, numpy
+
+
+# ==============================================================================
+# BENCHMARKS
+# ==============================================================================
+ROWS = 10000
+ZONES = ('US/Eastern', 'US/Pacific', 'Europe/London', 'Europe/Paris',
+         'Asia/Tokyo', 'Asia/Kolkata', 'Australia/Sydney', 'America/Sao_Paulo',
+         'Africa/Cairo', 'UTC')
+START = datetime(2014, 1, 1)
+
+
+def get_rows():
+    epochs = [int(1388534400 + i * 3163) for i in range(ROWS)]
+    zones = [ZONES[i % len(ZONES)] for i in range(ROWS)]
+    return epochs, zones
+
+
+def bench_localize_epochs_python():
+    """Pure-Python localization of 10,000 timestamps in 10 time zones."""
+    epochs, zones = get_rows()
+
+    def run():
+        localize_epochs(epochs, zones, use_numpy=False)
+
+    return run
+
+
+if numpy is not None:
+    def bench_localize_epochs_numpy():
+        """numpy localization of 10,000 timestamps in 10 time zones."""
+        epochs, zones = get_rows()
+        epochs, zones = numpy.asarray(epochs), numpy.asarray(zones)
+
+        def run():
+            localize_epochs(epochs, zones)
+
+        return run
+
+
+def bench_convert_value_per_row():
+    """LinkedTZDateTimeField._convert_value for the same 10,000 rows."""
+    field = ModelWithLocalTimeZone._meta.get_field('timestamp')
+    epochs, zones = get_rows()
+    rows = [
+        (
+            pytz.utc.localize(START + timedelta(seconds=epoch - 1388534400)),
+            ModelWithLocalTimeZone(timezone=zone),
+        )
+        for epoch, zone in zip(epochs, zones)
+    ]
+
+    def run():
+        for value, instance in rows:
+            field._convert_value(value, instance, add=False)
+
+    return run
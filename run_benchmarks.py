@@ -0,0 +1,205 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+import platform
+import sys
+import timeit
+import tracemalloc
+
+# Django
+import django
+
+# Reuse the test settings
+import run_tests    # noqa
+
+# App
+import benchmarks
+
+
+# ==============================================================================
+# BENCHMARK RUNNER
+# ==============================================================================
+BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    'benchmarks',
+    'baseline.json'
+)
+
+# A benchmark regresses when it is this much slower than its baseline
+DEFAULT_THRESHOLD = 0.5
+
+
+def iter_benchmarks(selected=None):
+    """Yields (name, function) for every `bench_*` function found in the
+    `bench_*` modules of the benchmarks package.
+
+    """
+    for module_info in sorted(pkgutil.iter_modules(benchmarks.__path__)):
+        if not module_info.name.startswith('bench_'):
+            continue
+
+        module = importlib.import_module(
+            'benchmarks.{0}'.format(module_info.name)
+        )
+
+        for name, function in sorted(vars(module).items()):
+            if not name.startswith('bench_') or not callable(function):
+                continue
+
+            full_name = '{0}.{1}'.format(module_info.name, name)
+            if selected and not any(s in full_name for s in selected):
+                continue
+
+            yield full_name, function
+
+
+def time_benchmark(function, repeat=5):
+    """Returns the best time per call (in seconds) of the callable returned
+    by the benchmark function.
+
+    """
+    timer = timeit.Timer(function())
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def measure_memory(function, warmup=100):
+    """Returns the peak memory (in bytes) allocated by a single call of the
+    callable returned by the benchmark function, after warming up its
+    caches.
+
+    """
+    run = function()
+
+    for _ in range(warmup):
+        run()
+
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        run()
+        return tracemalloc.get_traced_memory()[1] - start
+    finally:
+        tracemalloc.stop()
+
+
+def load_baseline(path):
+    """Loads the stored per-call times (in seconds) by benchmark name."""
+    if not os.path.exists(path):
+        return {}
+
+    with open(path) as baseline_file:
+        return json.load(baseline_file)['results']
+
+
+def save_baseline(path, results):
+    """Stores the per-call times (in seconds) by benchmark name, merged into
+    the existing baseline.
+
+    """
+    baseline = load_baseline(path)
+    baseline.update(results)
+
+    with open(path, 'w') as baseline_file:
+        json.dump(
+            {
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'machine': platform.machine(),
+                'results': baseline,
+            },
+            baseline_file,
+            indent=2,
+            sort_keys=True
+        )
+        baseline_file.write('\n')
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description='Runs the benchmarks found in the benchmarks package.'
+    )
+    parser.add_argument(
+        'selected',
+        nargs='*',
+        help='Only run the benchmarks whose name contains one of these.'
+    )
+    parser.add_argument(
+        '--save',
+        action='store_true',
+        help='Store the results as the new baseline.'
+    )
+    parser.add_argument(
+        '--compare',
+        action='store_true',
+        help='Exit with an error if a benchmark regressed from the baseline.'
+    )
+    parser.add_argument(
+        '--memory',
+        action='store_true',
+        help='Report the peak memory allocated per call instead of timing.'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help='Relative slowdown which counts as a regression '
+             '(default: %(default)s).'
+    )
+    parser.add_argument(
+        '--baseline',
+        default=BASELINE_PATH,
+        help='Path of the baseline file (default: benchmarks/baseline.json).'
+    )
+    return parser.parse_args(argv)
+
+
+def runbenchmarks(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    django.setup()
+
+    if args.memory:
+        for name, function in iter_benchmarks(args.selected):
+            print('{0:<60} {1:>14} B'.format(name, measure_memory(function)))
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    results = {}
+    regressions = []
+
+    for name, function in iter_benchmarks(args.selected):
+        result = results[name] = time_benchmark(function)
+        line = '{0:<60} {1:>14.2f} us'.format(name, result * 1e6)
+
+        if name in baseline:
+            change = result / baseline[name] - 1
+            line += ' {0:>+8.1%}'.format(change)
+
+            if change > args.threshold:
+                regressions.append(name)
+                line += ' REGRESSION'
+
+        print(line)
+
+    if args.save:
+        save_baseline(args.baseline, results)
+
+    if args.compare and regressions:
+        print('{0} benchmark(s) regressed by more than {1:.0%}: {2}'.format(
+            len(regressions),
+            args.threshold,
+            ', '.join(regressions)
+        ))
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(runbenchmarks())
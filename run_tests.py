@@ -3,6 +3,7 @@
 # ==============================================================================
 # Python
 from datetime import datetime
+import os
 import pytz
 import sys
 
@@ -40,6 +41,12 @@ if not settings.configured:
         USE_I18N=True,
         USE_L10N=True,
         SITE_ID=1,
+        # Run the tests (and benchmarks) against another time zone provider
+        #   with e.g. TIMEZONE_UTILS_PROVIDER=zoneinfo
+        TIMEZONE_UTILS_PROVIDER=os.environ.get(
+            'TIMEZONE_UTILS_PROVIDER',
+            'pytz'
+        ),
         TEST_DATETIME=timezone.make_aware(
             datetime(2014, 1, 1), pytz.timezone('UTC')
         ),
@@ -18,11 +18,19 @@ setup(
     author="Michael Barr",
     author_email="micbarr+developer@gmail.com",
     license="MIT",
-    packages=['timezone_utils'],
+    packages=[
+        'timezone_utils',
+        'timezone_utils.management',
+        'timezone_utils.management.commands',
+    ],
     install_requires=[
         'pytz',
         'django>=1.11'
     ],
+    extras_require={
+        'numpy': ['numpy'],
+        'rest_framework': ['djangorestframework'],
+    },
     zip_safe=False,
     platforms='any',
     include_package_data=True,
@@ -15,8 +15,11 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 # App
-from timezone_utils.fields import LinkedTZDateTimeField, TimeZoneField
-from timezone_utils.choices import PRETTY_ALL_TIMEZONES_CHOICES
+from timezone_utils.fields import (LinkedTZDateTimeField, TimeZoneField,
+                                   TimeZoneIDField)
+from timezone_utils.choices import (PRETTY_ALL_TIMEZONES_CHOICES,
+                                    PRETTY_COMMON_TIMEZONES_CHOICES)
+from timezone_utils.managers import LinkedTZManager
 
 
 # ==============================================================================
@@ -113,6 +116,26 @@ class LocationTimeZoneBadChoices(models.Model):
     )
 
 
+class LocationTimeZoneManyBadChoices(models.Model):
+    id = models.AutoField(primary_key=True)
+    timezone = TimeZoneField(
+        verbose_name=_('timezone'),
+        max_length=64,
+        null=True,
+        blank=True,
+        choices=[
+            ('', 'No time zone'),
+            ('Bad/Worse', 'Bad Choice'),
+            ('US/Eastern', 'Eastern'),
+            ('Europe', [
+                ('Europe/London', 'London'),
+                ('Europe/Nowhere', 'Nowhere'),
+                ('Bad/Worse', 'Bad Choice'),
+            ]),
+        ],
+    )
+
+
 class TZWithGoodStringDefault(models.Model):
     id = models.AutoField(primary_key=True)
     """Test should validate that"""
@@ -205,6 +228,38 @@ class ModelWithLocalTZCharField(models.Model):
     )
 
 
+class ModelWithRelatedTimeZonePath(models.Model):
+    id = models.AutoField(primary_key=True)
+    other_model = models.ForeignKey(
+        to='tests.TZWithGoodStringDefault',
+        related_name='related_tz_path',
+        on_delete=models.CASCADE,
+        null=True,
+    )
+    timestamp = LinkedTZDateTimeField(
+        default=settings.TEST_DATETIME,
+        populate_from='other_model__timezone',
+    )
+
+    objects = LinkedTZManager()
+
+
+class ModelWithDeepTimeZonePath(models.Model):
+    id = models.AutoField(primary_key=True)
+    parent = models.ForeignKey(
+        to='tests.ModelWithRelatedTimeZonePath',
+        related_name='children',
+        on_delete=models.CASCADE,
+    )
+    start = LinkedTZDateTimeField(
+        default=settings.TEST_DATETIME,
+        populate_from='parent__other_model__timezone',
+        time_override=datetime.min.time()
+    )
+
+    objects = LinkedTZManager()
+
+
 class TZTimeFramedModel(models.Model):
     id = models.AutoField(primary_key=True)
     other_model = models.ForeignKey(
@@ -222,3 +277,67 @@ class TZTimeFramedModel(models.Model):
         populate_from=get_other_model_timezone,
         time_override=datetime.max.time()
     )
+
+
+class BulkLinkedTZModel(models.Model):
+    id = models.AutoField(primary_key=True)
+    timezone = TimeZoneField(default='US/Eastern')
+    timestamp = LinkedTZDateTimeField(
+        default=settings.TEST_DATETIME,
+        populate_from='timezone'
+    )
+    start = LinkedTZDateTimeField(
+        default=settings.TEST_DATETIME,
+        populate_from='timezone',
+        time_override=datetime.min.time()
+    )
+
+    objects = LinkedTZManager()
+
+
+async def aget_timezone(obj):
+    return obj.timezone
+
+
+class AsyncLinkedTZModel(models.Model):
+    id = models.AutoField(primary_key=True)
+    timezone = TimeZoneField(default='US/Eastern')
+    timestamp = LinkedTZDateTimeField(
+        default=settings.TEST_DATETIME,
+        populate_from='timezone',
+        apopulate_from=aget_timezone,
+    )
+    start = LinkedTZDateTimeField(
+        default=settings.TEST_DATETIME,
+        populate_from='timezone',
+        apopulate_from=aget_timezone,
+        time_override=datetime.min.time()
+    )
+
+    objects = LinkedTZManager()
+
+
+class LocationTimeZoneID(models.Model):
+    id = models.AutoField(primary_key=True)
+    timezone = TimeZoneIDField(
+        verbose_name=_('timezone'),
+        null=True,
+        blank=True,
+        db_index=True,
+    )
+
+
+class LocationTimeZoneIDChoices(models.Model):
+    id = models.AutoField(primary_key=True)
+    timezone = TimeZoneIDField(
+        default='US/Eastern',
+        choices=PRETTY_COMMON_TIMEZONES_CHOICES,
+    )
+
+
+class ReminderModel(models.Model):
+    id = models.AutoField(primary_key=True)
+    timezone = TimeZoneField(null=True, db_index=True)
+    remind_at = models.TimeField(null=True)
+
+    objects = LinkedTZManager()
@@ -0,0 +1,150 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+import asyncio
+from datetime import datetime
+from unittest import skipIf
+
+# Django
+import django
+from django.conf import settings
+from django.test import TestCase
+
+# App
+from tests.models import (AsyncLinkedTZModel, BulkLinkedTZModel,
+                          ModelWithForeignKeyToTimeZone,
+                          TZWithGoodStringDefault)
+from timezone_utils.cache import get_timezone
+from timezone_utils.fields import LinkedTZDateTimeField
+from timezone_utils.managers import abulk_pre_save
+from timezone_utils.providers import zone_name
+
+try:
+    from asgiref.sync import sync_to_async
+except ImportError:     # pragma: no cover
+    sync_to_async = None
+
+
+# ==============================================================================
+# TESTS
+# ==============================================================================
+# Async test methods need Django 3.1+
+@skipIf(
+    sync_to_async is None or django.VERSION < (3, 1),
+    'async tests need Django 3.1 or later'
+)
+class AsyncConversionTestCase(TestCase):
+    TIMEZONES = ('US/Eastern', 'Europe/Paris', 'Asia/Tokyo', 'Australia/ACT',
+                 'America/Sao_Paulo', 'Asia/Kolkata', 'Pacific/Auckland',
+                 'Africa/Cairo')
+
+    def assertConverted(self, instance):
+        tz = get_timezone(str(instance.timezone))
+        self.assertEqual(instance.timestamp, settings.TEST_DATETIME)
+        self.assertEqual(zone_name(instance.timestamp.tzinfo), zone_name(tz))
+        self.assertEqual(
+            instance.start.replace(tzinfo=None),
+            datetime.combine(
+                settings.TEST_DATETIME.astimezone(tz).date(),
+                datetime.min.time()
+            )
+        )
+
+    async def test_apopulate_from(self):
+        instances = await abulk_pre_save([
+            AsyncLinkedTZModel(timezone=tz_name) for tz_name in self.TIMEZONES
+        ])
+
+        for instance in instances:
+            self.assertConverted(instance)
+
+    async def test_populate_from_without_apopulate_from(self):
+        instances = await abulk_pre_save([
+            BulkLinkedTZModel(timezone=tz_name) for tz_name in self.TIMEZONES
+        ])
+
+        for instance in instances:
+            self.assertConverted(instance)
+
+    async def test_populate_from_querying_the_database(self):
+        """populate_from callables may query the database, which would raise
+        SynchronousOnlyOperation if they were called in the event loop.
+
+        """
+        location = await sync_to_async(TZWithGoodStringDefault.objects.create)(
+            timezone='Asia/Tokyo'
+        )
+
+        # Only the ID is set, so get_other_model_timezone queries the database
+        instance = ModelWithForeignKeyToTimeZone(other_model_id=location.pk)
+        await abulk_pre_save([instance])
+
+        self.assertEqual(zone_name(instance.timestamp.tzinfo), 'Asia/Tokyo')
+
+    async def test_concurrent_tasks(self):
+        """Conversions from many concurrent tasks never mix up the time zones
+        of different model instances.
+
+        """
+        batches = [
+            [
+                AsyncLinkedTZModel(timezone=tz_name)
+                for tz_name in self.TIMEZONES[index % 3:]
+            ]
+            for index in range(50)
+        ]
+        batches += [
+            [BulkLinkedTZModel(timezone=tz_name) for tz_name in self.TIMEZONES]
+            for _ in range(10)
+        ]
+
+        results = await asyncio.gather(*(
+            abulk_pre_save(batch) for batch in batches
+        ))
+
+        for instances in results:
+            for instance in instances:
+                self.assertConverted(instance)
+
+    async def test_abulk_create(self):
+        await AsyncLinkedTZModel.objects.abulk_create([
+            AsyncLinkedTZModel(timezone=tz_name) for tz_name in self.TIMEZONES
+        ])
+
+        instances = await sync_to_async(list)(
+            AsyncLinkedTZModel.objects.order_by('pk')
+        )
+        self.assertEqual(len(instances), len(self.TIMEZONES))
+
+        for instance in instances:
+            tz = get_timezone(str(instance.timezone))
+            self.assertEqual(
+                instance.start.astimezone(tz).replace(tzinfo=None),
+                datetime.combine(
+                    settings.TEST_DATETIME.astimezone(tz).date(),
+                    datetime.min.time()
+                )
+            )
+
+    async def test_abulk_update(self):
+        instances = await AsyncLinkedTZModel.objects.abulk_create([
+            AsyncLinkedTZModel(timezone='Europe/Paris')
+        ])
+        instances[0].start = datetime(2014, 7, 1, 15)
+
+        await AsyncLinkedTZModel.objects.abulk_update(instances, ['start'])
+
+        instance = await sync_to_async(AsyncLinkedTZModel.objects.get)()
+        self.assertEqual(
+            instance.start.astimezone(get_timezone('Europe/Paris')).replace(
+                tzinfo=None
+            ),
+            datetime(2014, 7, 1)
+        )
+
+
+class AsyncPopulateFromValidationTestCase(TestCase):
+    def test_apopulate_from_requires_populate_from(self):
+        with self.assertRaises(ValueError):
+            LinkedTZDateTimeField(apopulate_from=lambda obj: obj.timezone)
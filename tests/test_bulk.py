@@ -0,0 +1,127 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from datetime import datetime
+from unittest import mock
+
+# Django
+from django.conf import settings
+from django.test import TestCase
+
+# App
+from tests.models import BulkLinkedTZModel
+from timezone_utils.cache import get_timezone, timezone_cache
+from timezone_utils.fields import LinkedTZDateTimeField
+from timezone_utils.managers import bulk_pre_save
+from timezone_utils.providers import zone_name
+
+
+# ==============================================================================
+# TESTS
+# ==============================================================================
+class BulkPreSaveTestCase(TestCase):
+    TIMEZONES = ('US/Eastern', 'Europe/Paris', 'Asia/Tokyo')
+
+    def get_instances(self, count=30):
+        return [
+            BulkLinkedTZModel(timezone=self.TIMEZONES[i % len(self.TIMEZONES)])
+            for i in range(count)
+        ]
+
+    def test_bulk_pre_save_converts_values(self):
+        instances = bulk_pre_save(self.get_instances())
+
+        for instance in instances:
+            tz = get_timezone(str(instance.timezone))
+            self.assertEqual(instance.timestamp, settings.TEST_DATETIME)
+            self.assertEqual(
+                zone_name(instance.timestamp.tzinfo),
+                zone_name(tz)
+            )
+            self.assertEqual(
+                instance.start.replace(tzinfo=None),
+                datetime.combine(
+                    settings.TEST_DATETIME.astimezone(tz).date(),
+                    datetime.min.time()
+                )
+            )
+
+    def test_timezones_resolved_once_per_group(self):
+        with mock.patch.object(
+            timezone_cache,
+            'get',
+            wraps=timezone_cache.get
+        ) as get_timezone:
+            bulk_pre_save(self.get_instances(), field_names=['timestamp'])
+
+        self.assertEqual(
+            sorted(call[0][0] for call in get_timezone.call_args_list),
+            sorted(self.TIMEZONES)
+        )
+
+    def test_bulk_create_does_not_convert_twice(self):
+        with mock.patch.object(
+            LinkedTZDateTimeField,
+            '_convert_value',
+            side_effect=AssertionError('Converted row by row.')
+        ):
+            BulkLinkedTZModel.objects.bulk_create(self.get_instances())
+
+        self.assertEqual(BulkLinkedTZModel.objects.count(), 30)
+
+        for instance in BulkLinkedTZModel.objects.all():
+            self.assertEqual(
+                instance.start.astimezone(instance.timezone).time(),
+                datetime.min.time()
+            )
+
+    def test_bulk_update_converts_values(self):
+        BulkLinkedTZModel.objects.bulk_create(self.get_instances(3))
+        instances = list(BulkLinkedTZModel.objects.order_by('pk'))
+
+        for instance in instances:
+            instance.start = datetime(2015, 6, 1, 12, 30)
+        BulkLinkedTZModel.objects.bulk_update(instances, ['start'])
+
+        for instance in BulkLinkedTZModel.objects.order_by('pk'):
+            local_start = instance.start.astimezone(instance.timezone)
+            self.assertEqual(local_start.date(), datetime(2015, 6, 1).date())
+            self.assertEqual(local_start.time(), datetime.min.time())
+
+    def test_save_after_bulk_pre_save(self):
+        instance, = bulk_pre_save(self.get_instances(1))
+        instance.save()
+        instance.timestamp = datetime(2015, 1, 1)
+        instance.save()
+
+        self.assertEqual(
+            str(instance.timestamp),
+            '2015-01-01 00:00:00-05:00'
+        )
+
+    def test_save_after_bulk_update_with_another_time_zone(self):
+        BulkLinkedTZModel.objects.bulk_create(self.get_instances(1))
+        instance = BulkLinkedTZModel.objects.get()
+        instance.start = datetime(2015, 6, 1, 12, 30)
+        BulkLinkedTZModel.objects.bulk_update([instance], ['start'])
+
+        instance.timezone = 'Asia/Tokyo'
+        instance.save()
+        instance.refresh_from_db()
+
+        local_start = instance.start.astimezone(get_timezone('Asia/Tokyo'))
+        self.assertEqual(local_start.time(), datetime.min.time())
+
+    def test_save_after_bulk_create_with_another_time_zone(self):
+        instance, = BulkLinkedTZModel.objects.bulk_create(
+            self.get_instances(1)
+        )
+        instance.timezone = 'Asia/Tokyo'
+        instance.save()
+
+        local_start = instance.start.astimezone(get_timezone('Asia/Tokyo'))
+        self.assertEqual(local_start.time(), datetime.min.time())
+
+    def test_empty_list(self):
+        self.assertEqual(bulk_pre_save([]), [])
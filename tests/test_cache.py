@@ -0,0 +1,102 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+import pytz
+
+# Django
+from django.test import TestCase
+
+# App
+from tests.models import LocationTimeZone
+from timezone_utils.cache import TimeZoneCache, get_timezone, timezone_cache
+
+
+# ==============================================================================
+# TESTS
+# ==============================================================================
+class TimeZoneCacheTestCase(TestCase):
+    def setUp(self):
+        self.cache = TimeZoneCache(max_unknown=2, provider='pytz')
+
+    def test_get_returns_pytz_instance(self):
+        self.assertIs(
+            self.cache.get('US/Eastern'),
+            pytz.timezone('US/Eastern')
+        )
+
+    def test_hits_and_misses(self):
+        self.cache.get('US/Eastern')
+        self.cache.get('US/Eastern')
+        self.cache.get('US/Eastern')
+
+        info = self.cache.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 2)
+        self.assertEqual(info.size, 1)
+
+    def test_unknown_timezone(self):
+        with self.assertRaises(pytz.UnknownTimeZoneError):
+            self.cache.get('Bad/Worse')
+
+        # The second lookup is answered from the cache
+        with self.assertRaises(pytz.UnknownTimeZoneError):
+            self.cache.get('Bad/Worse')
+
+        info = self.cache.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.unknown, 1)
+
+    def test_case_insensitive_name(self):
+        self.assertIs(
+            self.cache.get('us/eastern'),
+            pytz.timezone('US/Eastern')
+        )
+        self.assertEqual(self.cache.cache_info().unknown, 1)
+
+    def test_lru_eviction(self):
+        for name in ('Bad/One', 'Bad/Two', 'Bad/One', 'Bad/Three'):
+            with self.assertRaises(pytz.UnknownTimeZoneError):
+                self.cache.get(name)
+
+        self.assertEqual(list(self.cache._unknown), ['Bad/One', 'Bad/Three'])
+
+    def test_fifo_eviction(self):
+        cache = TimeZoneCache(max_unknown=2, eviction='fifo')
+        for name in ('Bad/One', 'Bad/Two', 'Bad/One', 'Bad/Three'):
+            with self.assertRaises(pytz.UnknownTimeZoneError):
+                cache.get(name)
+
+        self.assertEqual(list(cache._unknown), ['Bad/Two', 'Bad/Three'])
+
+    def test_unknown_caching_disabled(self):
+        cache = TimeZoneCache(max_unknown=0)
+        with self.assertRaises(pytz.UnknownTimeZoneError):
+            cache.get('Bad/Worse')
+        self.assertEqual(cache.cache_info().unknown, 0)
+
+    def test_invalid_eviction_policy(self):
+        with self.assertRaises(ValueError):
+            TimeZoneCache(eviction='random')
+
+    def test_cache_clear(self):
+        self.cache.get('US/Eastern')
+        self.cache.cache_clear()
+
+        info = self.cache.cache_info()
+        self.assertEqual((info.hits, info.misses, info.size), (0, 0, 0))
+
+    def test_get_timezone(self):
+        self.assertIs(get_timezone('UTC'), timezone_cache.provider.get('UTC'))
+
+    def test_fields_use_shared_cache(self):
+        LocationTimeZone.objects.create(timezone='Europe/Paris')
+        hits = timezone_cache.cache_info().hits
+
+        location = LocationTimeZone.objects.get()
+        self.assertIs(
+            location.timezone,
+            timezone_cache.provider.get('Europe/Paris')
+        )
+        self.assertGreater(timezone_cache.cache_info().hits, hits)
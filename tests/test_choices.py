@@ -4,8 +4,11 @@
 # Python
 from datetime import datetime
 from operator import itemgetter
+from unittest import mock
 import pytz
 import re
+import threading
+import time
 
 # Django
 from django.core import checks
@@ -19,7 +22,9 @@ from timezone_utils.choices import (ALL_TIMEZONES_CHOICES,
                                     GROUPED_COMMON_TIMEZONES_CHOICES,
                                     PRETTY_ALL_TIMEZONES_CHOICES,
                                     PRETTY_COMMON_TIMEZONES_CHOICES,
-                                    TIMEZONE_OFFSET_REGEX, get_choices)
+                                    TIMEZONE_OFFSET_REGEX, ChoicesCacheInfo,
+                                    LazyChoices, TimeZoneChoices, get_choices)
+from timezone_utils import choices as choices_module
 
 
 # ==============================================================================
@@ -190,3 +195,238 @@ class TimeZoneChoicesTestCase(TestCase):
                 obj=models.LocationTimeZoneBadChoices._meta.get_field('timezone'),
             ),
         ])
+
+    def test_check_choices_attribute_reports_every_bad_value(self):
+        field = models.LocationTimeZoneManyBadChoices._meta.get_field(
+            'timezone'
+        )
+        self.assertEqual(
+            models.LocationTimeZoneManyBadChoices.check(),
+            [
+                checks.Warning(
+                    msg=(
+                        "'choices' contains an invalid time zone value "
+                        "'{value}' which was not found as a supported time "
+                        "zone by pytz {version}.".format(
+                            value=value,
+                            version=pytz.__version__
+                        )
+                    ),
+                    hint='Values must be found in pytz.all_timezones.',
+                    obj=field,
+                )
+                for value in ('Bad/Worse', 'Europe/Nowhere')
+            ]
+        )
+
+
+class LazyChoicesTestCase(TestCase):
+    def test_not_evaluated_until_accessed(self):
+        calls = []
+
+        def get_test_choices():
+            calls.append(None)
+            return (('UTC', 'UTC'), )
+
+        choices = LazyChoices(get_test_choices)
+        self.assertFalse(choices.evaluated)
+        self.assertEqual(calls, [])
+
+        self.assertEqual(len(choices), 1)
+        self.assertEqual(choices[0], ('UTC', 'UTC'))
+        self.assertTrue(choices.evaluated)
+
+        # The choices are memoized
+        list(choices)
+        self.assertEqual(len(calls), 1)
+
+    def test_sequence_behaviour(self):
+        choices = LazyChoices(get_choices, timezones=['UTC'])
+        self.assertEqual(choices, (('UTC', '(GMT+00:00) UTC'), ))
+        self.assertIn(('UTC', '(GMT+00:00) UTC'), choices)
+        self.assertEqual(
+            [('', 'None')] + list(choices),
+            [('', 'None'), ('UTC', '(GMT+00:00) UTC')]
+        )
+        self.assertEqual(
+            (('', 'None'), ) + choices,
+            (('', 'None'), ('UTC', '(GMT+00:00) UTC'))
+        )
+
+    def test_constants_are_lazy(self):
+        self.assertIsInstance(PRETTY_ALL_TIMEZONES_CHOICES, LazyChoices)
+        self.assertIsInstance(GROUPED_ALL_TIMEZONES_CHOICES, LazyChoices)
+        self.assertEqual(
+            PRETTY_COMMON_TIMEZONES_CHOICES,
+            get_choices(pytz.common_timezones)
+        )
+
+
+class GetChoicesCacheTestCase(TestCase):
+    def setUp(self):
+        get_choices.cache_clear()
+        self.addCleanup(get_choices.cache_clear)
+
+    def test_memoized(self):
+        timezones = ['US/Eastern', 'Europe/Paris', 'UTC']
+        choices = get_choices(timezones)
+
+        with mock.patch.object(
+            choices_module,
+            '_get_offset',
+            wraps=choices_module._get_offset
+        ) as get_offset:
+            # Any iterable of the same time zones is a hit
+            self.assertIs(get_choices(iter(timezones)), choices)
+            self.assertEqual(get_offset.call_count, 0)
+
+        self.assertEqual(
+            get_choices.cache_info(),
+            ChoicesCacheInfo(hits=1, misses=1, maxsize=32, currsize=1)
+        )
+
+    def test_key(self):
+        get_choices(['US/Eastern', 'UTC'])
+        get_choices(['US/Eastern', 'UTC'], grouped=True)
+        get_choices(['UTC', 'US/Eastern'])
+
+        self.assertEqual(get_choices.cache_info().misses, 3)
+        self.assertNotEqual(
+            get_choices(['US/Eastern', 'UTC']),
+            get_choices(['US/Eastern', 'UTC'], grouped=True)
+        )
+
+    def test_expires_with_offset_epoch(self):
+        winter = datetime(2014, 1, 1)
+
+        with mock.patch.object(choices_module, '_utcnow', return_value=winter):
+            self.assertEqual(
+                get_choices(['US/Eastern'])[0][1],
+                '(GMT-05:00) US/Eastern'
+            )
+
+        summer = datetime(2014, 7, 1)
+
+        with mock.patch.object(choices_module, '_utcnow', return_value=summer):
+            self.assertEqual(
+                get_choices(['US/Eastern'])[0][1],
+                '(GMT-04:00) US/Eastern'
+            )
+
+        self.assertEqual(get_choices.cache_info().hits, 1)
+
+    def test_least_recently_used_are_evicted(self):
+        with mock.patch.object(choices_module, 'CHOICES_CACHE_SIZE', 2):
+            get_choices(['UTC'])
+            get_choices(['US/Eastern'])
+            get_choices(['UTC'])
+            get_choices(['Europe/Paris'])
+
+            self.assertEqual(get_choices.cache_info().currsize, 2)
+            get_choices(['UTC'])
+            self.assertEqual(get_choices.cache_info().hits, 2)
+            get_choices(['US/Eastern'])
+            self.assertEqual(get_choices.cache_info().misses, 4)
+
+    def test_cache_clear(self):
+        get_choices(['UTC'])
+        get_choices.cache_clear()
+
+        self.assertEqual(
+            get_choices.cache_info(),
+            ChoicesCacheInfo(hits=0, misses=0, maxsize=32, currsize=0)
+        )
+
+
+class TimeZoneChoicesRefreshTestCase(TestCase):
+    WINTER = datetime(2014, 1, 1)
+    SUMMER = datetime(2014, 7, 1)
+
+    def get_choices_at(self, choices, now):
+        with mock.patch.object(choices_module, '_utcnow', return_value=now):
+            return tuple(choices)
+
+    def test_expires_at_next_transition(self):
+        choices = TimeZoneChoices(['US/Eastern', 'UTC'])
+        self.assertEqual(
+            self.get_choices_at(choices, self.WINTER),
+            (
+                ('US/Eastern', '(GMT-05:00) US/Eastern'),
+                ('UTC', '(GMT+00:00) UTC'),
+            )
+        )
+        # US/Eastern switches to daylight saving time on 2014-03-09 at 2am
+        self.assertEqual(choices.expires, datetime(2014, 3, 9, 7))
+
+    def test_refreshes_after_transition(self):
+        choices = TimeZoneChoices(['US/Eastern', 'UTC'], grouped=True)
+        self.get_choices_at(choices, self.WINTER)
+
+        self.assertEqual(
+            self.get_choices_at(choices, self.SUMMER),
+            (
+                ('GMT-04:00', (('US/Eastern', 'US/Eastern'), )),
+                ('GMT+00:00', (('UTC', 'UTC'), )),
+            )
+        )
+        self.assertEqual(choices.expires, datetime(2014, 11, 2, 6))
+
+    def test_only_transitioned_zones_are_recomputed(self):
+        choices = TimeZoneChoices(['US/Eastern', 'Europe/London', 'UTC'])
+        self.get_choices_at(choices, self.WINTER)
+
+        with mock.patch.object(
+            choices_module,
+            '_get_offset',
+            wraps=choices_module._get_offset
+        ) as get_offset:
+            # Before the transition, nothing is recomputed
+            self.get_choices_at(choices, datetime(2014, 3, 9, 6))
+            self.assertEqual(get_offset.call_count, 0)
+
+            # US/Eastern (2014-03-09) changes before Europe/London (2014-03-30)
+            self.get_choices_at(choices, datetime(2014, 3, 10))
+            get_offset.assert_called_once_with(
+                'US/Eastern',
+                datetime(2014, 3, 10)
+            )
+
+    def test_static_timezones_never_expire(self):
+        choices = TimeZoneChoices(['UTC', 'Etc/GMT+5'])
+        self.get_choices_at(choices, self.WINTER)
+        self.assertIsNone(choices.expires)
+
+    def test_first_use_from_many_threads(self):
+        choices = TimeZoneChoices(['US/Eastern', 'Europe/London', 'UTC'])
+        barrier = threading.Barrier(4)
+        results = []
+        errors = []
+        original = choices_module._get_next_transition
+
+        def get_next_transition(tz, now):
+            # Widen the window between the two halves of the first refresh
+            time.sleep(0.01)
+            return original(tz, now)
+
+        def target():
+            barrier.wait()
+            try:
+                results.append(tuple(choices))
+            except Exception as e:    # pragma: no cover
+                errors.append(e)
+
+        with mock.patch.object(
+            choices_module,
+            '_get_next_transition',
+            side_effect=get_next_transition
+        ) as next_transition:
+            threads = [threading.Thread(target=target) for _i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(set(results)), 1)
+        # The time zones were localized once
+        self.assertEqual(next_transition.call_count, 3)
@@ -0,0 +1,186 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from datetime import date, datetime, time
+from unittest import mock
+import pytz
+
+# Django
+from django.db import NotSupportedError, connection
+from django.test import TestCase
+
+# App
+from tests.models import (ModelWithDeepTimeZonePath, ModelWithLocalTimeZone,
+                          ModelWithRelatedTimeZonePath,
+                          TZWithGoodStringDefault)
+from timezone_utils import functions
+from timezone_utils.functions import LocalDate, LocalizedTo, LocalTime
+
+
+# ==============================================================================
+# TESTS
+# ==============================================================================
+class LocalizedExpressionsTestCase(TestCase):
+    def setUp(self):
+        # 09:00 local time in each time zone
+        for tz_name, value in (
+            ('US/Eastern', datetime(2014, 1, 1, 14, 0)),
+            ('Asia/Tokyo', datetime(2014, 1, 1, 0, 0)),
+            ('Europe/Paris', datetime(2014, 7, 1, 7, 0)),
+            ('Europe/London', datetime(2014, 7, 1, 17, 0)),
+        ):
+            ModelWithLocalTimeZone.objects.create(
+                timezone=tz_name,
+                timestamp=pytz.utc.localize(value)
+            )
+
+    def test_localized_to(self):
+        queryset = ModelWithLocalTimeZone.objects.annotate(
+            local=LocalizedTo('timestamp', tz_field='timezone')
+        )
+        values = {
+            str(tz): local
+            for tz, local in queryset.values_list('timezone', 'local')
+        }
+        self.assertEqual(values['US/Eastern'], datetime(2014, 1, 1, 9, 0))
+        self.assertEqual(values['Asia/Tokyo'], datetime(2014, 1, 1, 9, 0))
+        self.assertEqual(values['Europe/Paris'], datetime(2014, 7, 1, 9, 0))
+        self.assertEqual(values['Europe/London'], datetime(2014, 7, 1, 18, 0))
+
+    def test_local_date_and_time(self):
+        queryset = ModelWithLocalTimeZone.objects.annotate(
+            local_date=LocalDate('timestamp', tz_field='timezone'),
+            local_time=LocalTime('timestamp', tz_field='timezone'),
+        )
+        values = {
+            str(row[0]): row[1:]
+            for row in queryset.values_list(
+                'timezone',
+                'local_date',
+                'local_time'
+            )
+        }
+        self.assertEqual(
+            values['Asia/Tokyo'],
+            (date(2014, 1, 1), time(9, 0))
+        )
+        self.assertEqual(
+            values['Europe/London'],
+            (date(2014, 7, 1), time(18, 0))
+        )
+
+    def test_filter_on_local_time(self):
+        queryset = ModelWithLocalTimeZone.objects.annotate(
+            local_time=LocalTime('timestamp', tz_field='timezone')
+        ).filter(local_time=time(9, 0))
+
+        self.assertEqual(
+            sorted(map(str, queryset.values_list('timezone', flat=True))),
+            ['Asia/Tokyo', 'Europe/Paris', 'US/Eastern']
+        )
+
+    def test_filter_on_localized_hour(self):
+        queryset = ModelWithLocalTimeZone.objects.annotate(
+            local=LocalizedTo('timestamp', tz_field='timezone')
+        ).filter(local__hour=18)
+
+        self.assertEqual(
+            list(map(str, queryset.values_list('timezone', flat=True))),
+            ['Europe/London']
+        )
+
+    def test_tz_field_inferred_from_populate_from(self):
+        self.assertEqual(
+            ModelWithLocalTimeZone.objects.filter(
+                timezone='US/Eastern'
+            ).annotate(
+                local=LocalizedTo('timestamp')
+            ).get().local,
+            datetime(2014, 1, 1, 9, 0)
+        )
+
+    def test_tz_field_inferred_through_relations(self):
+        location = TZWithGoodStringDefault.objects.create(
+            timezone='Asia/Tokyo'
+        )
+        parent = ModelWithRelatedTimeZonePath.objects.create(
+            other_model=location
+        )
+        ModelWithDeepTimeZonePath.objects.create(parent=parent)
+
+        # The parent's populate_from is other_model__timezone
+        self.assertEqual(
+            ModelWithDeepTimeZonePath.objects.annotate(
+                local=LocalizedTo('parent__timestamp')
+            ).get().local,
+            datetime(2014, 1, 1, 9, 0)
+        )
+
+    def test_constant_tzinfo(self):
+        self.assertEqual(
+            ModelWithLocalTimeZone.objects.filter(
+                timezone='Asia/Tokyo'
+            ).annotate(
+                local=LocalizedTo(
+                    'timestamp',
+                    tzinfo=pytz.timezone('America/Sao_Paulo')
+                )
+            ).get().local,
+            datetime(2013, 12, 31, 22, 0)
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            LocalizedTo('timestamp', tz_field='timezone', tzinfo=pytz.utc)
+
+        for name in ('id', 'missing', 'timezone__timestamp',
+                     'parent__missing'):
+            with self.assertRaises(ValueError):
+                list(ModelWithDeepTimeZonePath.objects.annotate(
+                    local=LocalizedTo(name)
+                ))
+
+    def test_sqlite_functions_registered_once(self):
+        queryset = ModelWithLocalTimeZone.objects.annotate(
+            local=LocalizedTo('timestamp', tz_field='timezone')
+        )
+        list(queryset)
+
+        with mock.patch.object(
+            functions,
+            'register_sqlite_functions',
+            wraps=functions.register_sqlite_functions
+        ) as register:
+            list(queryset)
+            list(queryset.filter(local__hour=9))
+
+        self.assertEqual(register.call_count, 0)
+
+    def test_unsupported_backends(self):
+        query = ModelWithLocalTimeZone.objects.annotate(
+            local=LocalizedTo('timestamp', tz_field='timezone')
+        ).query
+        compiler = query.get_compiler(connection=connection)
+
+        for method in ('as_mysql', 'as_oracle'):
+            with self.assertRaises(NotSupportedError):
+                getattr(query.annotations['local'], method)(
+                    compiler,
+                    connection
+                )
+
+    def test_postgresql_sql(self):
+        query = ModelWithLocalTimeZone.objects.annotate(
+            local_date=LocalDate('timestamp', tz_field='timezone')
+        ).query
+        compiler = query.get_compiler(connection=connection)
+        sql, params = query.annotations['local_date'].as_sql(
+            compiler,
+            connection
+        )
+        self.assertEqual(
+            sql,
+            '("tests_modelwithlocaltimezone"."timestamp" AT TIME ZONE '
+            '"tests_modelwithlocaltimezone"."timezone")::date'
+        )
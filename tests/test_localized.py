@@ -0,0 +1,124 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from datetime import datetime
+
+# Django
+from django.conf import settings
+from django.test import TestCase
+
+# App
+from tests.models import (BulkLinkedTZModel, ModelWithDeepTimeZonePath,
+                          ModelWithRelatedTimeZonePath, TZTimeFramedModel,
+                          TZWithGoodStringDefault)
+from timezone_utils.managers import LinkedTZQuerySet
+from timezone_utils.providers import zone_name
+
+
+# ==============================================================================
+# TESTS
+# ==============================================================================
+class LocalizedQuerySetTestCase(TestCase):
+    TIMEZONES = ('US/Eastern', 'Europe/Paris', 'Asia/Tokyo')
+
+    def setUp(self):
+        BulkLinkedTZModel.objects.bulk_create([
+            BulkLinkedTZModel(timezone=self.TIMEZONES[i % 3])
+            for i in range(9)
+        ])
+        self.locations = [
+            TZWithGoodStringDefault.objects.create(timezone=tz_name)
+            for tz_name in self.TIMEZONES
+        ]
+
+    def assertLocalized(self, value, tz):
+        self.assertEqual(zone_name(value.tzinfo), zone_name(tz))
+        self.assertEqual(value.utcoffset(), value.astimezone(tz).utcoffset())
+
+    def test_local_time_zone(self):
+        with self.assertNumQueries(1):
+            instances = list(BulkLinkedTZModel.objects.localized())
+
+        self.assertEqual(len(instances), 9)
+        for instance in instances:
+            self.assertLocalized(instance.timestamp, instance.timezone)
+            self.assertLocalized(instance.start, instance.timezone)
+            self.assertEqual(instance.timestamp, settings.TEST_DATETIME)
+            self.assertEqual(instance.start.time(), datetime.min.time())
+            self.assertFalse(hasattr(instance, 'timezone_utils_timestamp_tz'))
+
+    def test_field_names(self):
+        instance = BulkLinkedTZModel.objects.localized('start').filter(
+            timezone='Asia/Tokyo'
+        ).first()
+
+        self.assertLocalized(instance.start, instance.timezone)
+        self.assertNotEqual(
+            zone_name(instance.timestamp.tzinfo),
+            zone_name(instance.timezone)
+        )
+
+    def test_chained(self):
+        queryset = BulkLinkedTZModel.objects.localized().order_by('-pk')
+        instance = queryset.localized()[0]
+
+        self.assertLocalized(instance.timestamp, instance.timezone)
+        self.assertEqual(
+            len(queryset.query.annotations),
+            len(BulkLinkedTZModel.objects.localized().query.annotations)
+        )
+
+    def test_deferred_fields(self):
+        instance = BulkLinkedTZModel.objects.localized().only(
+            'timezone', 'timestamp'
+        ).first()
+
+        self.assertLocalized(instance.timestamp, instance.timezone)
+
+        # Deferred values are loaded later, in the default time zone
+        self.assertEqual(
+            instance.start.utcoffset(),
+            settings.TEST_DATETIME.utcoffset()
+        )
+
+    def test_related_path_in_a_single_query(self):
+        ModelWithRelatedTimeZonePath.objects.bulk_create([
+            ModelWithRelatedTimeZonePath(other_model=location)
+            for location in self.locations
+        ])
+        ModelWithRelatedTimeZonePath.objects.filter(
+            other_model__timezone='Asia/Tokyo'
+        ).update(other_model=None)
+
+        with self.assertNumQueries(1):
+            instances = list(ModelWithRelatedTimeZonePath.objects.localized())
+
+        for instance in instances:
+            if instance.other_model_id is None:
+                # Without a time zone the value is left as it was loaded
+                self.assertEqual(instance.timestamp, settings.TEST_DATETIME)
+            else:
+                self.assertLocalized(
+                    instance.timestamp,
+                    instance.other_model.timezone
+                )
+
+    def test_deep_path(self):
+        parent = ModelWithRelatedTimeZonePath.objects.create(
+            other_model=self.locations[2]
+        )
+        ModelWithDeepTimeZonePath.objects.create(parent=parent)
+
+        with self.assertNumQueries(1):
+            instance = ModelWithDeepTimeZonePath.objects.localized().get()
+
+        self.assertEqual(zone_name(instance.start.tzinfo), 'Asia/Tokyo')
+        self.assertEqual(
+            instance.start.replace(tzinfo=None),
+            datetime(2014, 1, 1)
+        )
+
+    def test_callable_populate_from(self):
+        with self.assertRaises(ValueError):
+            LinkedTZQuerySet(model=TZTimeFramedModel).localized()
@@ -0,0 +1,132 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from datetime import datetime, timedelta
+from unittest import mock
+import pytz
+
+# Django
+from django.test import TestCase
+
+# App
+from tests.models import LocationTimeZone, LocationTimeZoneID
+from timezone_utils import offsets
+
+WINTER = datetime(2014, 1, 1)
+SUMMER = datetime(2014, 7, 1)
+
+
+# ==============================================================================
+# TESTS
+# ==============================================================================
+class OffsetLookupTestCase(TestCase):
+    model = LocationTimeZone
+    TIMEZONES = ('US/Eastern', 'US/Pacific', 'Europe/Paris', 'Asia/Kolkata',
+                 'UTC')
+
+    def setUp(self):
+        for tz_name in self.TIMEZONES + (None, ):
+            self.model.objects.create(timezone=tz_name)
+
+    def get_names(self, **lookups):
+        return sorted(
+            str(instance.timezone)
+            for instance in self.model.objects.filter(**lookups)
+        )
+
+    def test_utcoffset(self):
+        self.assertEqual(
+            self.get_names(timezone__utcoffset=(-300, WINTER)),
+            ['US/Eastern']
+        )
+        self.assertEqual(
+            self.get_names(timezone__utcoffset=(-300, SUMMER)),
+            []
+        )
+        self.assertEqual(
+            self.get_names(timezone__utcoffset=(timedelta(hours=2), SUMMER)),
+            ['Europe/Paris']
+        )
+        self.assertEqual(
+            self.get_names(timezone__utcoffset=(330, WINTER)),
+            ['Asia/Kolkata']
+        )
+
+    def test_utcoffset_defaults_to_now(self):
+        with mock.patch.object(
+            offsets,
+            '_utcnow',
+            return_value=pytz.utc.localize(SUMMER)
+        ):
+            self.assertEqual(
+                self.get_names(timezone__utcoffset=-240),
+                ['US/Eastern']
+            )
+
+    def test_offset_between(self):
+        self.assertEqual(
+            self.get_names(timezone__offset_between=(-480, -300, WINTER)),
+            ['US/Eastern', 'US/Pacific']
+        )
+        self.assertEqual(
+            self.get_names(timezone__offset_between=(0, 120, WINTER)),
+            ['Europe/Paris', 'UTC']
+        )
+        self.assertEqual(
+            self.get_names(timezone__offset_between=(
+                timedelta(hours=5),
+                timedelta(hours=6),
+                SUMMER
+            )),
+            ['Asia/Kolkata']
+        )
+
+    def test_compiles_to_in(self):
+        queryset = self.model.objects.filter(
+            timezone__utcoffset=(-300, WINTER)
+        )
+        sql, params = queryset.query.sql_with_params()
+
+        self.assertIn(' IN (', sql)
+        self.assertIn(
+            self.model._meta.get_field('timezone').get_prep_value(
+                'US/Eastern'
+            ),
+            params
+        )
+
+    def test_exclude(self):
+        # As with the in lookup, rows without a time zone are not excluded
+        self.assertEqual(
+            sorted(
+                str(instance.timezone)
+                for instance in self.model.objects.exclude(
+                    timezone__offset_between=(-600, 0, WINTER)
+                )
+            ),
+            ['Asia/Kolkata', 'Europe/Paris', 'None']
+        )
+
+    def test_no_matching_time_zone(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                self.get_names(timezone__utcoffset=(24 * 60, WINTER)),
+                []
+            )
+
+    def test_invalid_values(self):
+        for lookups in (
+            {'timezone__utcoffset': 'US/Eastern'},
+            {'timezone__utcoffset': (-300, '2014-01-01')},
+            {'timezone__utcoffset': (-300, -240, WINTER)},
+            {'timezone__offset_between': -300},
+            {'timezone__offset_between': (-300, -240, '2014-01-01')},
+            {'timezone__offset_between': (-300, None)},
+        ):
+            with self.assertRaises(ValueError):
+                self.model.objects.filter(**lookups)
+
+
+class OffsetLookupIDFieldTestCase(OffsetLookupTestCase):
+    model = LocationTimeZoneID
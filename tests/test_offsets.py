@@ -0,0 +1,193 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from datetime import datetime, timedelta
+from unittest import mock
+import pytz
+
+# Django
+from django.test import TestCase
+
+# App
+from timezone_utils import offsets
+from timezone_utils.offsets import (get_zone_offsets, next_transition,
+                                    offsets_at, utc_from_local, utcoffset_at,
+                                    zones_with_offset)
+
+
+# ==============================================================================
+# TESTS
+# ==============================================================================
+class OffsetIndexTestCase(TestCase):
+    def test_utcoffset_at(self):
+        self.assertEqual(
+            utcoffset_at('US/Eastern', datetime(2014, 1, 1)),
+            timedelta(hours=-5)
+        )
+        self.assertEqual(
+            utcoffset_at('US/Eastern', datetime(2014, 7, 1)),
+            timedelta(hours=-4)
+        )
+        self.assertEqual(
+            utcoffset_at('Asia/Kolkata', datetime(2014, 7, 1)),
+            timedelta(hours=5, minutes=30)
+        )
+
+    def test_utcoffset_at_transition(self):
+        # US/Eastern switched to daylight saving time at 2014-03-09 07:00 UTC
+        self.assertEqual(
+            utcoffset_at('US/Eastern', datetime(2014, 3, 9, 6, 59, 59)),
+            timedelta(hours=-5)
+        )
+        self.assertEqual(
+            utcoffset_at('US/Eastern', datetime(2014, 3, 9, 7)),
+            timedelta(hours=-4)
+        )
+
+    def test_aware_instant(self):
+        instant = pytz.timezone('Asia/Tokyo').localize(datetime(2014, 3, 9, 16))
+        self.assertEqual(
+            utcoffset_at(pytz.timezone('US/Eastern'), instant),
+            timedelta(hours=-4)
+        )
+
+    def test_matches_pytz(self):
+        instant = datetime(2014, 10, 26, 1, 30)
+        for zone in pytz.common_timezones:
+            self.assertEqual(
+                utcoffset_at(zone, instant),
+                pytz.utc.localize(instant).astimezone(
+                    pytz.timezone(zone)
+                ).utcoffset(),
+                zone
+            )
+
+    def test_static_timezones(self):
+        self.assertEqual(utcoffset_at('UTC'), timedelta(0))
+        self.assertEqual(utcoffset_at('Etc/GMT+5'), timedelta(hours=-5))
+        self.assertIsNone(next_transition('Etc/GMT+5'))
+
+    def test_offsets_at(self):
+        self.assertEqual(
+            offsets_at(['UTC', 'Europe/Paris', 'US/Pacific'],
+                       datetime(2014, 7, 1)),
+            [timedelta(0), timedelta(hours=2), timedelta(hours=-7)]
+        )
+
+    def test_next_transition(self):
+        self.assertEqual(
+            next_transition('US/Eastern', datetime(2014, 1, 1)),
+            pytz.utc.localize(datetime(2014, 3, 9, 7))
+        )
+        self.assertEqual(
+            next_transition('US/Eastern', datetime(2014, 3, 9, 7)),
+            pytz.utc.localize(datetime(2014, 11, 2, 6))
+        )
+
+    def test_index_only_holds_offset_changes(self):
+        zone_offsets = get_zone_offsets('US/Eastern')
+        self.assertEqual(
+            zone_offsets.transitions,
+            sorted(zone_offsets.transitions)
+        )
+        for previous, offset in zip(
+            zone_offsets.offsets,
+            zone_offsets.offsets[1:]
+        ):
+            self.assertNotEqual(previous, offset)
+
+    def test_index_is_built_once(self):
+        self.assertIs(
+            get_zone_offsets('Europe/Paris'),
+            get_zone_offsets(pytz.timezone('Europe/Paris'))
+        )
+
+    def test_unknown_timezone(self):
+        with self.assertRaises(pytz.UnknownTimeZoneError):
+            utcoffset_at('Bad/Worse')
+
+    def test_utc_from_local(self):
+        for local, expected in (
+            (datetime(2014, 1, 1, 9), datetime(2014, 1, 1, 14)),
+            (
+                datetime(2014, 7, 1, 9, 0, 0, 5),
+                datetime(2014, 7, 1, 13, 0, 0, 5)
+            ),
+            # Skipped: moved forward by the length of the transition
+            (datetime(2014, 3, 9, 2, 30), datetime(2014, 3, 9, 7, 30)),
+            # Repeated: the first of them
+            (datetime(2014, 11, 2, 1, 30), datetime(2014, 11, 2, 5, 30)),
+        ):
+            self.assertEqual(
+                utc_from_local('US/Eastern', local),
+                pytz.utc.localize(expected)
+            )
+
+
+class ZonesWithOffsetTestCase(TestCase):
+    ZONES = ('US/Eastern', 'US/Pacific', 'Europe/Paris', 'Asia/Kolkata', 'UTC')
+
+    def setUp(self):
+        self.addCleanup(offsets.offset_cache_clear)
+
+    def test_exact_offset(self):
+        self.assertEqual(
+            zones_with_offset(
+                timedelta(hours=-5),
+                instant=datetime(2014, 1, 1),
+                zones=self.ZONES
+            ),
+            ['US/Eastern']
+        )
+        self.assertEqual(
+            zones_with_offset(
+                timedelta(hours=-5),
+                instant=datetime(2014, 7, 1),
+                zones=self.ZONES
+            ),
+            []
+        )
+
+    def test_range(self):
+        self.assertEqual(
+            zones_with_offset(
+                timedelta(0),
+                timedelta(hours=6),
+                instant=datetime(2014, 7, 1),
+                zones=self.ZONES
+            ),
+            ['Asia/Kolkata', 'Europe/Paris', 'UTC']
+        )
+
+    def test_defaults_to_now(self):
+        with mock.patch.object(
+            offsets,
+            '_utcnow',
+            return_value=pytz.utc.localize(datetime(2014, 7, 1))
+        ):
+            self.assertEqual(
+                zones_with_offset(timedelta(hours=-4), zones=self.ZONES),
+                ['US/Eastern']
+            )
+
+    def test_groups_are_reused_until_the_next_transition(self):
+        with mock.patch.object(
+            offsets,
+            '_build_offset_groups',
+            wraps=offsets._build_offset_groups
+        ) as build:
+            for instant in (
+                datetime(2014, 1, 1),
+                datetime(2014, 3, 9, 6, 59, 59),
+                # US/Eastern switches to daylight saving time
+                datetime(2014, 3, 9, 7),
+                datetime(2014, 3, 9, 8),
+            ):
+                zones_with_offset(
+                    timedelta(0),
+                    instant=instant,
+                    zones=self.ZONES
+                )
+
+        self.assertEqual(build.call_count, 2)
@@ -0,0 +1,155 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from datetime import datetime
+
+# Django
+from django.conf import settings
+from django.test import TestCase
+
+# App
+from tests.models import (ModelWithDeepTimeZonePath,
+                          ModelWithRelatedTimeZonePath,
+                          TZWithGoodStringDefault)
+from timezone_utils.cache import get_timezone
+from timezone_utils.functions import LocalizedTo
+from timezone_utils.managers import bulk_pre_save, prefetch_populate_from
+from timezone_utils.providers import zone_name
+
+
+# ==============================================================================
+# TESTS
+# ==============================================================================
+class PopulateFromPathTestCase(TestCase):
+    TIMEZONES = ('US/Eastern', 'Europe/Paris', 'Asia/Tokyo')
+
+    def setUp(self):
+        self.locations = [
+            TZWithGoodStringDefault.objects.create(timezone=tz_name)
+            for tz_name in self.TIMEZONES
+        ]
+
+    def get_instances(self, count=30):
+        # Only set the IDs, so the related objects are not loaded
+        return [
+            ModelWithRelatedTimeZonePath(
+                other_model_id=self.locations[i % len(self.locations)].pk
+            )
+            for i in range(count)
+        ]
+
+    def test_path(self):
+        field = ModelWithRelatedTimeZonePath._meta.get_field('timestamp')
+        self.assertEqual(
+            field.get_populate_from_path(),
+            ('other_model', 'timezone')
+        )
+
+        instance = ModelWithRelatedTimeZonePath.objects.create(
+            other_model=self.locations[2]
+        )
+        self.assertEqual(zone_name(instance.timestamp.tzinfo), 'Asia/Tokyo')
+        self.assertEqual(instance.timestamp, settings.TEST_DATETIME)
+
+    def test_null_relation(self):
+        with self.assertRaisesMessage(
+            ValueError,
+            'tests.ModelWithRelatedTimeZonePath.timestamp has no time zone to '
+            'convert to: its populate_from (other_model__timezone) is None'
+        ):
+            ModelWithRelatedTimeZonePath.objects.create(other_model=None)
+
+    def test_null_relation_on_save(self):
+        instance = ModelWithRelatedTimeZonePath.objects.create(
+            other_model=self.locations[0]
+        )
+        instance.other_model = None
+
+        with self.assertRaisesMessage(ValueError, 'other_model__timezone'):
+            instance.save()
+
+        # Further along the path
+        child = ModelWithDeepTimeZonePath(parent=instance)
+        with self.assertRaisesMessage(
+            ValueError,
+            'tests.ModelWithDeepTimeZonePath.start has no time zone'
+        ):
+            child.save()
+
+    def test_null_relation_in_bulk(self):
+        instances = self.get_instances(3)
+        instances[1].other_model_id = None
+
+        with self.assertRaisesMessage(ValueError, 'other_model__timezone'):
+            ModelWithRelatedTimeZonePath.objects.bulk_create(instances)
+
+        self.assertFalse(ModelWithRelatedTimeZonePath.objects.exists())
+
+    def test_select_related_is_used(self):
+        ModelWithRelatedTimeZonePath.objects.bulk_create(self.get_instances())
+        instances = list(
+            ModelWithRelatedTimeZonePath.objects.select_related('other_model')
+        )
+        field = ModelWithRelatedTimeZonePath._meta.get_field('timestamp')
+
+        with self.assertNumQueries(0):
+            field.pre_save_bulk(instances, add=False)
+
+    def test_prefetch_populate_from(self):
+        instances = self.get_instances()
+
+        with self.assertNumQueries(1):
+            prefetch_populate_from(instances)
+
+        # Already loaded related objects are not queried again
+        with self.assertNumQueries(0):
+            prefetch_populate_from(instances)
+            bulk_pre_save(instances)
+
+        for instance in instances:
+            self.assertEqual(
+                zone_name(instance.timestamp.tzinfo),
+                zone_name(instance.other_model.timezone)
+            )
+
+    def test_bulk_create_without_n_plus_one_queries(self):
+        # One query for the locations and one for the insert
+        with self.assertNumQueries(2):
+            ModelWithRelatedTimeZonePath.objects.bulk_create(
+                self.get_instances()
+            )
+
+    def test_deep_path_in_a_single_query(self):
+        parents = ModelWithRelatedTimeZonePath.objects.bulk_create(
+            self.get_instances(count=3)
+        )
+        instances = [
+            ModelWithDeepTimeZonePath(parent_id=parents[i % 3].pk)
+            for i in range(12)
+        ]
+
+        with self.assertNumQueries(1):
+            bulk_pre_save(instances)
+
+        for instance in instances:
+            tz = get_timezone(str(instance.parent.other_model.timezone))
+            self.assertEqual(
+                instance.start.replace(tzinfo=None),
+                datetime.combine(
+                    settings.TEST_DATETIME.astimezone(tz).date(),
+                    datetime.min.time()
+                )
+            )
+
+    def test_localized_to_follows_the_path(self):
+        instance = ModelWithRelatedTimeZonePath.objects.create(
+            other_model=self.locations[2]
+        )
+
+        self.assertEqual(
+            ModelWithRelatedTimeZonePath.objects.annotate(
+                local=LocalizedTo('timestamp')
+            ).get(pk=instance.pk).local,
+            datetime(2014, 1, 1, 9)
+        )
@@ -0,0 +1,129 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from datetime import datetime
+from unittest import skipIf
+import pytz
+
+# Django
+from django.test import TestCase, override_settings
+
+# App
+from tests.models import LocationTimeZone, StaticTimeStampedModel
+from timezone_utils.cache import timezone_cache
+from timezone_utils.providers import (PytzProvider, ZoneInfoProvider,
+                                      get_provider, zone_name, zoneinfo)
+
+
+# ==============================================================================
+# TESTS
+# ==============================================================================
+class PytzProviderTestCase(TestCase):
+    def test_get(self):
+        self.assertIs(
+            PytzProvider().get('US/Eastern'),
+            pytz.timezone('US/Eastern')
+        )
+
+    def test_unknown(self):
+        with self.assertRaises(pytz.UnknownTimeZoneError):
+            PytzProvider().get('Bad/Worse')
+
+
+@skipIf(zoneinfo is None, 'zoneinfo is not installed.')
+class ZoneInfoProviderTestCase(TestCase):
+    def setUp(self):
+        self.provider = ZoneInfoProvider()
+
+    def test_get(self):
+        self.assertIs(
+            self.provider.get('US/Eastern'),
+            zoneinfo.ZoneInfo('US/Eastern')
+        )
+
+    def test_case_insensitive_name(self):
+        self.assertIs(
+            self.provider.get('us/eastern'),
+            zoneinfo.ZoneInfo('US/Eastern')
+        )
+
+    def test_unknown(self):
+        for name in ('Bad/Worse', '', '../etc/passwd', None, 1):
+            with self.assertRaises(pytz.UnknownTimeZoneError):
+                self.provider.get(name)
+
+
+@skipIf(zoneinfo is None, 'zoneinfo is not installed.')
+class GetProviderTestCase(TestCase):
+    def test_alias(self):
+        self.assertIsInstance(get_provider('pytz'), PytzProvider)
+        self.assertIsInstance(get_provider('zoneinfo'), ZoneInfoProvider)
+
+    def test_dotted_path(self):
+        self.assertIsInstance(
+            get_provider('timezone_utils.providers.ZoneInfoProvider'),
+            ZoneInfoProvider
+        )
+
+    def test_instance(self):
+        provider = ZoneInfoProvider()
+        self.assertIs(get_provider(provider), provider)
+
+    def test_invalid(self):
+        with self.assertRaises(ImportError):
+            get_provider('nowhere')
+
+    @override_settings(TIMEZONE_UTILS_PROVIDER='zoneinfo')
+    def test_setting(self):
+        self.assertIsInstance(get_provider(), ZoneInfoProvider)
+
+    def test_zone_name(self):
+        self.assertEqual(zone_name(pytz.timezone('US/Eastern')), 'US/Eastern')
+        self.assertEqual(
+            zone_name(zoneinfo.ZoneInfo('US/Eastern')),
+            'US/Eastern'
+        )
+
+
+@skipIf(zoneinfo is None, 'zoneinfo is not installed.')
+class FieldProviderTestCase(TestCase):
+    def test_setting_switches_the_cache(self):
+        for provider, tz_class in (('pytz', pytz.BaseTzInfo),
+                                   ('zoneinfo', zoneinfo.ZoneInfo)):
+            with override_settings(TIMEZONE_UTILS_PROVIDER=provider):
+                location = LocationTimeZone.objects.create(
+                    timezone='Europe/Paris'
+                )
+                self.assertIsInstance(
+                    LocationTimeZone.objects.get(pk=location.pk).timezone,
+                    tz_class
+                )
+
+        self.assertIsInstance(timezone_cache.provider, get_provider().__class__)
+
+    def test_zoneinfo_instances_are_saved_by_name(self):
+        location = LocationTimeZone.objects.create(
+            timezone=zoneinfo.ZoneInfo('Asia/Tokyo')
+        )
+        self.assertTrue(
+            LocationTimeZone.objects.filter(
+                pk=location.pk,
+                timezone='Asia/Tokyo'
+            ).exists()
+        )
+
+    def test_time_override_in_zoneinfo(self):
+        field = StaticTimeStampedModel._meta.get_field('end')
+        tz = zoneinfo.ZoneInfo('US/Eastern')
+
+        value, = field._convert_values(
+            values=[datetime(2014, 7, 1, 12)],
+            tz=tz,
+            add=True
+        )
+        self.assertEqual(
+            value,
+            datetime(2014, 7, 1, 23, 59, 59, 999999, tzinfo=tz)
+        )
+        self.assertEqual(value.utcoffset().total_seconds(), -4 * 3600)
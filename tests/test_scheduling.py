@@ -0,0 +1,378 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from datetime import datetime, time, timedelta
+from unittest import mock
+import pytz
+
+# Django
+from django.test import TestCase
+
+# App
+from tests.models import BulkLinkedTZModel, ReminderModel
+from timezone_utils import scheduling
+from timezone_utils.cache import get_timezone
+from timezone_utils.fields import LinkedTZDateTimeField
+from timezone_utils.scheduling import (due_filter, due_intervals,
+                                       next_occurrence, next_occurrences)
+
+
+def utc(*args):
+    return pytz.utc.localize(datetime(*args))
+
+
+# ==============================================================================
+# TESTS
+# ==============================================================================
+class NextOccurrenceTestCase(TestCase):
+    def test_next_occurrence(self):
+        self.assertEqual(
+            next_occurrence('US/Eastern', time(9), after=utc(2014, 1, 1)),
+            utc(2014, 1, 1, 14)
+        )
+        # Today's time has passed
+        self.assertEqual(
+            next_occurrence('US/Eastern', time(9), after=utc(2014, 1, 1, 14)),
+            utc(2014, 1, 2, 14)
+        )
+        self.assertEqual(
+            next_occurrence('Asia/Tokyo', time(9), after=utc(2014, 1, 1)),
+            utc(2014, 1, 2)
+        )
+        self.assertEqual(
+            next_occurrence(
+                get_timezone('Asia/Kolkata'),
+                time(9, 0, 0, 500),
+                after=datetime(2014, 1, 1, 3, 30)
+            ),
+            utc(2014, 1, 1, 3, 30, 0, 500)
+        )
+
+    def test_same_as_time_override(self):
+        after = utc(2014, 6, 30, 23)
+
+        for tz_name in ('US/Eastern', 'Europe/London', 'Australia/Sydney'):
+            tz = get_timezone(tz_name)
+
+            for hour in range(24):
+                field = LinkedTZDateTimeField(time_override=time(hour))
+                expected, = field._convert_values([after], tz, add=False)
+
+                if expected <= after:
+                    expected, = field._convert_values(
+                        [after + timedelta(days=1)],
+                        tz,
+                        add=False
+                    )
+
+                self.assertEqual(
+                    next_occurrence(tz_name, time(hour), after=after),
+                    expected
+                )
+
+    def test_same_as_time_override_across_transitions(self):
+        # US/Eastern skipped 02:00 to 03:00 on 2014-03-09, and repeated 01:00
+        #   to 02:00 on 2014-11-02
+        for day, value in (
+            ((2014, 3, 9), time(2, 30)),
+            ((2014, 11, 2), time(1, 30)),
+        ):
+            field = LinkedTZDateTimeField(time_override=value)
+            expected, = field._convert_values(
+                [utc(*day + (12, ))],
+                get_timezone('US/Eastern'),
+                add=False
+            )
+
+            # zoneinfo keeps a skipped wall time (with fold=0), which only
+            #   compares equal in UTC
+            self.assertEqual(
+                next_occurrence('US/Eastern', value, after=utc(*day)),
+                expected.astimezone(pytz.utc)
+            )
+
+    def test_skipped_local_time(self):
+        # US/Eastern skipped from 02:00 to 03:00 on 2014-03-09
+        self.assertEqual(
+            next_occurrence('US/Eastern', time(2, 30), after=utc(2014, 3, 9)),
+            utc(2014, 3, 9, 7, 30)
+        )
+        self.assertEqual(
+            next_occurrence('US/Eastern', time(3, 30), after=utc(2014, 3, 9)),
+            utc(2014, 3, 9, 7, 30)
+        )
+
+    def test_repeated_local_time(self):
+        # US/Eastern repeated 01:00 to 02:00 on 2014-11-02
+        self.assertEqual(
+            next_occurrence('US/Eastern', time(1, 30), after=utc(2014, 11, 2)),
+            utc(2014, 11, 2, 5, 30)
+        )
+        # The second 01:30 is not another occurrence
+        self.assertEqual(
+            next_occurrence(
+                'US/Eastern',
+                time(1, 30),
+                after=utc(2014, 11, 2, 5, 30)
+            ),
+            utc(2014, 11, 3, 6, 30)
+        )
+
+    def test_batch(self):
+        zones = ['US/Eastern', 'Asia/Tokyo', None, 'US/Eastern',
+                 get_timezone('Asia/Tokyo')]
+        times = [time(9), time(9), time(9), None, time(10)]
+
+        with mock.patch.object(
+            scheduling,
+            'utcoffset_at',
+            wraps=scheduling.utcoffset_at
+        ) as utcoffset_at:
+            occurrences = next_occurrences(
+                zones,
+                times,
+                after=utc(2014, 1, 1)
+            )
+
+        self.assertEqual(occurrences, [
+            utc(2014, 1, 1, 14),
+            utc(2014, 1, 2),
+            None,
+            None,
+            utc(2014, 1, 1, 1),
+        ])
+        # The local date of each time zone is found once
+        self.assertEqual(utcoffset_at.call_count, 2)
+
+    def test_single_time(self):
+        self.assertEqual(
+            next_occurrences(
+                ('UTC', 'Europe/Paris'),
+                time(12),
+                after=utc(2014, 1, 1)
+            ),
+            [utc(2014, 1, 1, 12), utc(2014, 1, 1, 11)]
+        )
+
+    def test_defaults_to_now(self):
+        with mock.patch.object(
+            scheduling,
+            '_utcnow',
+            return_value=utc(2014, 1, 1, 12)
+        ):
+            self.assertEqual(
+                next_occurrence('UTC', time(6)),
+                utc(2014, 1, 2, 6)
+            )
+
+    def test_lengths_differ(self):
+        with self.assertRaises(ValueError):
+            next_occurrences(['UTC', 'UTC'], [time(6)])
+
+
+class DueIntervalsTestCase(TestCase):
+    def test_window(self):
+        self.assertEqual(
+            due_intervals(
+                'US/Eastern',
+                utc(2014, 1, 1, 14),
+                utc(2014, 1, 1, 15)
+            ),
+            ((9 * 3600, 10 * 3600), )
+        )
+
+    def test_window_across_local_midnight(self):
+        self.assertEqual(
+            due_intervals(
+                'Asia/Tokyo',
+                utc(2014, 1, 1, 14),
+                utc(2014, 1, 1, 16)
+            ),
+            ((0, 3600), (23 * 3600, 24 * 3600))
+        )
+
+    def test_skipped_local_times_are_due_after_the_transition(self):
+        self.assertEqual(
+            due_intervals(
+                'US/Eastern',
+                utc(2014, 3, 9, 7, 15),
+                utc(2014, 3, 9, 7, 45)
+            ),
+            (
+                (2 * 3600 + 15 * 60, 2 * 3600 + 45 * 60),
+                (3 * 3600 + 15 * 60, 3 * 3600 + 45 * 60),
+            )
+        )
+
+    def test_repeated_local_times_are_due_once(self):
+        self.assertEqual(
+            due_intervals(
+                'US/Eastern',
+                utc(2014, 11, 2, 5),
+                utc(2014, 11, 2, 7)
+            ),
+            ((3600, 2 * 3600), )
+        )
+
+    def test_long_and_empty_windows(self):
+        self.assertEqual(
+            due_intervals('UTC', utc(2014, 1, 1), utc(2014, 1, 3)),
+            ((0, 24 * 3600), )
+        )
+        self.assertEqual(
+            due_intervals('UTC', utc(2014, 1, 1), utc(2014, 1, 1)),
+            ()
+        )
+
+    def test_agrees_with_next_occurrences(self):
+        times = [time(hour, minute) for hour in range(24)
+                 for minute in range(0, 60, 15)]
+
+        for tz_name, start in (
+            ('US/Eastern', utc(2014, 3, 9, 5)),
+            ('US/Eastern', utc(2014, 11, 2, 4)),
+            ('Australia/Lord_Howe', utc(2014, 4, 5, 14)),
+        ):
+            end = start + timedelta(hours=5)
+            intervals = due_intervals(tz_name, start, end)
+            occurrences = next_occurrences(
+                [tz_name] * len(times),
+                times,
+                after=start - timedelta(microseconds=1)
+            )
+
+            for value, occurrence in zip(times, occurrences):
+                seconds = value.hour * 3600 + value.minute * 60
+                self.assertEqual(
+                    any(low <= seconds < high for low, high in intervals),
+                    occurrence < end,
+                    (tz_name, value, occurrence)
+                )
+
+
+class DueQuerySetTestCase(TestCase):
+    def setUp(self):
+        for tz_name, remind_at in (
+            ('US/Eastern', time(9)),
+            ('US/Eastern', time(10)),
+            ('US/Pacific', time(9)),
+            ('Europe/Paris', time(15)),
+            ('Asia/Tokyo', time(23, 30)),
+            ('Asia/Tokyo', None),
+            (None, time(9)),
+        ):
+            ReminderModel.objects.create(
+                timezone=tz_name,
+                remind_at=remind_at
+            )
+
+    def get_due(self, *args, **kwargs):
+        return sorted(
+            (str(reminder.timezone), reminder.remind_at)
+            for reminder in ReminderModel.objects.due(*args, **kwargs)
+        )
+
+    def test_time_field(self):
+        self.assertEqual(
+            self.get_due(
+                'remind_at',
+                utc(2014, 1, 1, 14),
+                utc(2014, 1, 1, 15),
+                timezone='timezone'
+            ),
+            [('Asia/Tokyo', time(23, 30)), ('Europe/Paris', time(15)),
+             ('US/Eastern', time(9))]
+        )
+
+    def test_constant_time(self):
+        self.assertEqual(
+            self.get_due(
+                time(9),
+                utc(2014, 1, 1, 16),
+                utc(2014, 1, 1, 18),
+                timezone='timezone'
+            ),
+            [('US/Pacific', time(9))]
+        )
+
+    def test_long_window(self):
+        self.assertEqual(
+            len(self.get_due(
+                'remind_at',
+                utc(2014, 1, 1),
+                utc(2014, 1, 2),
+                timezone='timezone'
+            )),
+            5
+        )
+
+    def test_zones(self):
+        self.assertEqual(
+            self.get_due(
+                'remind_at',
+                utc(2014, 1, 1, 14),
+                utc(2014, 1, 1, 15),
+                timezone='timezone',
+                zones=('US/Eastern', 'US/Pacific')
+            ),
+            [('US/Eastern', time(9))]
+        )
+
+    def test_nothing_due(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                self.get_due(
+                    time(9, 30),
+                    utc(2014, 1, 1, 14),
+                    utc(2014, 1, 1, 14, 15),
+                    timezone='timezone',
+                    zones=('US/Eastern', )
+                ),
+                []
+            )
+
+    def test_linked_field_time_override(self):
+        BulkLinkedTZModel.objects.bulk_create([
+            BulkLinkedTZModel(timezone=tz_name)
+            for tz_name in ('US/Eastern', 'Europe/Paris', 'Asia/Tokyo')
+        ])
+
+        # Midnight in Paris
+        due = BulkLinkedTZModel.objects.due(
+            'start',
+            utc(2014, 1, 1, 22, 30),
+            utc(2014, 1, 1, 23, 30)
+        )
+
+        self.assertEqual(
+            [str(instance.timezone) for instance in due],
+            ['Europe/Paris']
+        )
+
+    def test_invalid_fields(self):
+        with self.assertRaises(ValueError):
+            BulkLinkedTZModel.objects.due(
+                'timestamp',
+                utc(2014, 1, 1),
+                utc(2014, 1, 2)
+            )
+
+        with self.assertRaises(ValueError):
+            ReminderModel.objects.due(
+                'remind_at',
+                utc(2014, 1, 1),
+                utc(2014, 1, 2)
+            )
+
+    def test_due_filter(self):
+        self.assertEqual(
+            ReminderModel.objects.filter(due_filter(
+                'timezone',
+                'remind_at',
+                utc(2014, 1, 1, 17),
+                utc(2014, 1, 1, 18),
+                zones=('US/Pacific', 'US/Eastern')
+            )).get().timezone,
+            get_timezone('US/Pacific')
+        )
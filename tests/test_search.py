@@ -0,0 +1,178 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+import pytz
+
+# Django
+from django import forms
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+# App
+from tests.models import LocationTimeZoneChoices
+from timezone_utils.cache import get_timezone
+from timezone_utils.choices import PRETTY_ALL_TIMEZONES_CHOICES
+from timezone_utils.search import (TimeZoneIndex, get_timezone_index,
+                                   search_timezones)
+from timezone_utils.widgets import TimeZoneSearchInput
+
+
+# ==============================================================================
+# TESTS
+# ==============================================================================
+class TimeZoneIndexTestCase(TestCase):
+    def get_names(self, term, **kwargs):
+        results, _ = search_timezones(term, **kwargs)
+        return [name for name, _ in results]
+
+    def test_prefix_of_any_segment(self):
+        self.assertIn('America/New_York', self.get_names('america/new'))
+        self.assertIn('America/New_York', self.get_names('york'))
+        self.assertIn('America/New_York', self.get_names('New York'))
+        self.assertEqual(self.get_names('los_angeles', limit=100), [
+            'America/Los_Angeles'
+        ])
+
+    def test_prefix_matches_come_first(self):
+        index = TimeZoneIndex(['Asia/Kolkata', 'Europe/Paris', 'US/Eastern'])
+        results, more = index.search('as')
+
+        # "Asia/Kolkata" starts with the term, "US/Eastern" only contains it
+        self.assertEqual([name for name, _ in results], [
+            'Asia/Kolkata',
+            'US/Eastern',
+        ])
+        self.assertFalse(more)
+
+    def test_offset_labels(self):
+        self.assertIn('Asia/Kolkata', self.get_names('GMT+05:30'))
+
+        results, _ = search_timezones('kolkata')
+        self.assertEqual(results, [
+            ('Asia/Kolkata', '(GMT+05:30) Asia/Kolkata'),
+        ])
+
+    def test_empty_term_and_pagination(self):
+        results, more = search_timezones('', limit=10)
+        self.assertEqual(results, list(PRETTY_ALL_TIMEZONES_CHOICES[:10]))
+        self.assertTrue(more)
+
+        results, more = search_timezones(
+            '',
+            offset=len(pytz.all_timezones) - 5,
+            limit=10
+        )
+        self.assertEqual(len(results), 5)
+        self.assertFalse(more)
+
+    def test_no_matches(self):
+        self.assertEqual(search_timezones('Nowhere'), ([], False))
+
+    def test_shared_index(self):
+        self.assertIs(
+            get_timezone_index(pytz.common_timezones),
+            get_timezone_index(list(pytz.common_timezones))
+        )
+
+
+@override_settings(ROOT_URLCONF='tests.urls')
+class TimeZoneSearchViewTestCase(TestCase):
+    def setUp(self):
+        self.url = reverse('timezone_utils:timezone_search')
+
+    def test_results(self):
+        response = self.client.get(self.url, {'term': 'kolkata'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'results': [
+                {'id': 'Asia/Kolkata', 'text': '(GMT+05:30) Asia/Kolkata'},
+            ],
+            'pagination': {'more': False},
+        })
+
+    def test_pages(self):
+        first = self.client.get(self.url, {'term': 'america'}).json()
+        second = self.client.get(
+            self.url,
+            {'term': 'america', 'page': 2}
+        ).json()
+
+        self.assertEqual(len(first['results']), 20)
+        self.assertTrue(first['pagination']['more'])
+        self.assertNotEqual(first['results'], second['results'])
+
+        # Invalid pages are the first page
+        for page in ('0', 'last'):
+            self.assertEqual(
+                self.client.get(
+                    self.url,
+                    {'term': 'america', 'page': page}
+                ).json(),
+                first
+            )
+
+
+@override_settings(ROOT_URLCONF='tests.urls')
+class TimeZoneSearchInputTestCase(TestCase):
+    def test_renders_a_single_input(self):
+        html = TimeZoneSearchInput().render(
+            'timezone',
+            get_timezone('US/Eastern'),
+            attrs={'id': 'id_timezone'}
+        )
+
+        self.assertInHTML(
+            '<input type="text" name="timezone" value="US/Eastern" '
+            'id="id_timezone" list="id_timezone_list" autocomplete="off" '
+            'data-timezone-search-url="/timezones/search/" '
+            'data-timezone-search-min-length="1">',
+            html
+        )
+        self.assertInHTML('<datalist id="id_timezone_list"></datalist>', html)
+        self.assertNotIn('<option', html)
+
+    def test_options(self):
+        html = TimeZoneSearchInput(
+            attrs={'autocomplete': 'on'},
+            url='/zones/',
+            min_length=3
+        ).render('timezone', None)
+
+        self.assertIn('data-timezone-search-url="/zones/"', html)
+        self.assertIn('data-timezone-search-min-length="3"', html)
+        self.assertIn('autocomplete="on"', html)
+        self.assertIn('list="timezone_list"', html)
+
+    def test_media(self):
+        self.assertEqual(
+            TimeZoneSearchInput().media._js,
+            ['timezone_utils/js/timezone-search.js']
+        )
+
+    def test_model_form(self):
+        class LocationForm(forms.ModelForm):
+            class Meta:
+                model = LocationTimeZoneChoices
+                fields = ('timezone', )
+                widgets = {'timezone': TimeZoneSearchInput()}
+
+        form = LocationForm(data={'timezone': 'Europe/Paris'})
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(
+            form.cleaned_data['timezone'],
+            get_timezone('Europe/Paris')
+        )
+        self.assertFalse(
+            LocationForm(data={'timezone': 'Bad/Worse'}).is_valid()
+        )
+
+        # Far smaller than a <select> with an <option> for each time zone
+        self.assertLess(
+            len(str(LocationForm()['timezone'])) * 100,
+            len(str(forms.Select(choices=PRETTY_ALL_TIMEZONES_CHOICES).render(
+                'timezone',
+                None
+            )))
+        )
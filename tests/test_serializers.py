@@ -0,0 +1,279 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from unittest import mock, skipIf
+
+# Django
+from django.test import TestCase
+
+# App
+from tests.models import (BulkLinkedTZModel, LocationTimeZoneID,
+                          ModelWithDeepTimeZonePath,
+                          ModelWithForeignKeyToTimeZone,
+                          ModelWithRelatedTimeZonePath,
+                          TZWithGoodStringDefault, get_other_model_timezone)
+from timezone_utils.cache import get_timezone, timezone_cache
+from timezone_utils.providers import zone_name
+
+try:
+    from rest_framework import serializers
+    from timezone_utils import serializers as tz_serializers
+except ImportError:     # pragma: no cover
+    serializers = None
+
+
+# ==============================================================================
+# TESTS
+# ==============================================================================
+@skipIf(serializers is None, 'djangorestframework is not installed')
+class TimeZoneFieldTestCase(TestCase):
+    def setUp(self):
+        self.field = tz_serializers.TimeZoneField(max_length=32)
+
+    def test_to_representation(self):
+        self.assertEqual(
+            self.field.to_representation(get_timezone('US/Eastern')),
+            'US/Eastern'
+        )
+        self.assertEqual(
+            self.field.to_representation('Asia/Tokyo'),
+            'Asia/Tokyo'
+        )
+
+    def test_to_internal_value(self):
+        self.assertIs(
+            self.field.run_validation('US/Eastern'),
+            get_timezone('US/Eastern')
+        )
+
+    def test_invalid(self):
+        with self.assertRaises(serializers.ValidationError) as context:
+            self.field.run_validation('Bad/Worse')
+
+        self.assertEqual(
+            context.exception.detail,
+            ["'Bad/Worse' is not a valid time zone."]
+        )
+
+        with self.assertRaises(serializers.ValidationError) as context:
+            self.field.run_validation('Bad/' * 10)
+
+        self.assertEqual(context.exception.detail[0].code, 'max_length')
+
+
+@skipIf(serializers is None, 'djangorestframework is not installed')
+class LinkedTZDateTimeFieldTestCase(TestCase):
+    TIMEZONES = ('US/Eastern', 'Europe/Paris', 'Asia/Tokyo')
+
+    def setUp(self):
+        self.locations = [
+            TZWithGoodStringDefault.objects.create(timezone=tz_name)
+            for tz_name in self.TIMEZONES
+        ]
+
+    def get_serializer_class(self, model, **attrs):
+        meta = type('Meta', (), {'model': model, 'fields': '__all__'})
+        return type(
+            '{0}Serializer'.format(model.__name__),
+            (tz_serializers.TimeZoneModelSerializer, ),
+            dict(attrs, Meta=meta)
+        )
+
+    def test_field_mapping(self):
+        fields = self.get_serializer_class(BulkLinkedTZModel)().fields
+
+        self.assertIsInstance(fields['timezone'], tz_serializers.TimeZoneField)
+        self.assertIsInstance(
+            fields['timestamp'],
+            tz_serializers.LinkedTZDateTimeField
+        )
+        self.assertEqual(fields['timestamp'].populate_from, 'timezone')
+
+    def test_local_time_zone(self):
+        BulkLinkedTZModel.objects.bulk_create([
+            BulkLinkedTZModel(timezone=tz_name) for tz_name in self.TIMEZONES
+        ])
+        serializer_class = self.get_serializer_class(BulkLinkedTZModel)
+
+        data = serializer_class(
+            BulkLinkedTZModel.objects.order_by('pk'),
+            many=True
+        ).data
+
+        self.assertEqual(
+            [(row['timezone'], row['start']) for row in data],
+            [
+                ('US/Eastern', '2013-12-31T00:00:00-05:00'),
+                ('Europe/Paris', '2014-01-01T00:00:00+01:00'),
+                ('Asia/Tokyo', '2014-01-01T00:00:00+09:00'),
+            ]
+        )
+
+    def test_related_path_query_per_related_object(self):
+        ModelWithRelatedTimeZonePath.objects.bulk_create([
+            ModelWithRelatedTimeZonePath(other_model=self.locations[i % 3])
+            for i in range(9)
+        ])
+        ModelWithRelatedTimeZonePath.objects.filter(
+            other_model=self.locations[2]
+        ).update(other_model=None)
+        serializer_class = self.get_serializer_class(
+            ModelWithRelatedTimeZonePath
+        )
+        instances = list(ModelWithRelatedTimeZonePath.objects.order_by('pk'))
+
+        # One query per related object rather than one per object
+        with self.assertNumQueries(2):
+            data = serializer_class(instances, many=True).data
+
+        self.assertEqual(
+            [row['timestamp'] for row in data[:3]],
+            [
+                '2013-12-31T19:00:00-05:00',
+                '2014-01-01T01:00:00+01:00',
+                # Without a time zone the value is in the current time zone
+                '2014-01-01T00:00:00Z',
+            ]
+        )
+
+    def test_zones_are_resolved_once_per_response(self):
+        BulkLinkedTZModel.objects.bulk_create([
+            BulkLinkedTZModel(timezone=self.TIMEZONES[i % 3])
+            for i in range(9)
+        ])
+        # The time zones are loaded as names
+        instances = list(BulkLinkedTZModel.objects.all())
+        for instance in instances:
+            instance.timezone = zone_name(instance.timezone)
+
+        serializer_class = self.get_serializer_class(BulkLinkedTZModel)
+
+        with mock.patch.object(
+            timezone_cache,
+            'get',
+            wraps=timezone_cache.get
+        ) as get:
+            serializer = serializer_class(instances, many=True)
+            serializer.data
+
+        self.assertEqual(get.call_count, 3)
+        self.assertEqual(
+            set(serializer.context[tz_serializers.ZONES_CONTEXT_KEY]),
+            set(self.TIMEZONES)
+        )
+
+    def test_nested_fields_with_the_same_name(self):
+        eastern, tokyo = (
+            TZWithGoodStringDefault.objects.create(id=pk, timezone=tz_name)
+            for pk, tz_name in ((101, 'US/Eastern'), (102, 'Asia/Tokyo'))
+        )
+        # The key of each parent is that of the other parent's location
+        parents = [
+            ModelWithRelatedTimeZonePath.objects.create(
+                id=101,
+                other_model=tokyo
+            ),
+            ModelWithRelatedTimeZonePath.objects.create(
+                id=102,
+                other_model=eastern
+            ),
+        ]
+        for parent in parents:
+            ModelWithDeepTimeZonePath.objects.create(parent=parent)
+
+        class ParentSerializer(tz_serializers.TimeZoneModelSerializer):
+            start = tz_serializers.LinkedTZDateTimeField(source='timestamp')
+
+            class Meta:
+                model = ModelWithRelatedTimeZonePath
+                fields = ('start', )
+
+        class ChildSerializer(tz_serializers.TimeZoneModelSerializer):
+            parent = ParentSerializer()
+
+            class Meta:
+                model = ModelWithDeepTimeZonePath
+                fields = ('start', 'parent')
+
+        data = ChildSerializer(
+            ModelWithDeepTimeZonePath.objects.order_by('parent_id'),
+            many=True
+        ).data
+
+        self.assertEqual(
+            [(row['start'], row['parent']['start']) for row in data],
+            [
+                ('2014-01-01T00:00:00+09:00', '2014-01-01T09:00:00+09:00'),
+                ('2013-12-31T00:00:00-05:00', '2013-12-31T19:00:00-05:00'),
+            ]
+        )
+
+    def test_callable_populate_from(self):
+        class Serializer(serializers.Serializer):
+            timestamp = tz_serializers.LinkedTZDateTimeField(
+                populate_from=get_other_model_timezone
+            )
+
+        instance = ModelWithForeignKeyToTimeZone.objects.create(
+            other_model=self.locations[2]
+        )
+
+        self.assertEqual(
+            Serializer(instance).data['timestamp'],
+            '2014-01-01T09:00:00+09:00'
+        )
+
+    def test_format(self):
+        class Serializer(serializers.Serializer):
+            timestamp = tz_serializers.LinkedTZDateTimeField(
+                populate_from='timezone',
+                format='%Y-%m-%d %H:%M %Z'
+            )
+
+        instance = BulkLinkedTZModel.objects.create(timezone='Asia/Tokyo')
+
+        self.assertEqual(
+            Serializer(instance).data['timestamp'],
+            '2014-01-01 09:00 JST'
+        )
+
+    def test_create(self):
+        serializer = self.get_serializer_class(BulkLinkedTZModel)(data={
+            'timezone': 'Asia/Tokyo',
+            'timestamp': '2014-01-01T00:00:00Z',
+            'start': '2014-07-01T12:00:00Z',
+        })
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        instance = serializer.save()
+
+        self.assertEqual(zone_name(instance.timezone), 'Asia/Tokyo')
+        self.assertEqual(
+            serializer.data['start'],
+            '2014-07-01T00:00:00+09:00'
+        )
+
+    def test_time_zone_id_field(self):
+        serializer_class = self.get_serializer_class(LocationTimeZoneID)
+
+        self.assertIsInstance(
+            serializer_class().fields['timezone'],
+            tz_serializers.TimeZoneField
+        )
+
+        instance = LocationTimeZoneID.objects.create(timezone='US/Eastern')
+        self.assertEqual(
+            serializer_class(instance).data['timezone'],
+            'US/Eastern'
+        )
+
+        serializer = serializer_class(data={'timezone': 'Asia/Tokyo'})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(
+            zone_name(serializer.save().timezone),
+            'Asia/Tokyo'
+        )
+
+        serializer = serializer_class(data={'timezone': 'Bad/Worse'})
+        self.assertFalse(serializer.is_valid())
@@ -0,0 +1,214 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from datetime import datetime
+from io import StringIO
+import json
+import os
+import shutil
+import tempfile
+from unittest import mock
+import warnings
+
+# Django
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+
+# App
+from timezone_utils import choices as choices_module
+from timezone_utils.choices import (ChoicesSnapshot, TimeZoneChoices,
+                                    build_choices_snapshot,
+                                    load_choices_snapshot)
+
+
+# ==============================================================================
+# TESTS
+# ==============================================================================
+WINTER = datetime(2014, 1, 1)
+SUMMER = datetime(2014, 7, 1)
+TIMEZONES = ('US/Eastern', 'Europe/London', 'Asia/Tokyo', 'UTC')
+
+
+class SnapshotTestCase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.addCleanup(
+            choices_module.reset_snapshot,
+            'TIMEZONE_UTILS_CHOICES_SNAPSHOT'
+        )
+        self.path = os.path.join(self.directory, 'snapshot.json')
+
+    def write_snapshot(self, snapshot):
+        with open(self.path, 'w') as snapshot_file:
+            json.dump(snapshot.to_dict(), snapshot_file)
+        return self.path
+
+    def get_choices_at(self, choices, now):
+        with mock.patch.object(choices_module, '_utcnow', return_value=now):
+            return tuple(choices)
+
+
+class ChoicesSnapshotTestCase(SnapshotTestCase):
+    def test_lookup(self):
+        snapshot = build_choices_snapshot(TIMEZONES, now=WINTER, days=365)
+
+        self.assertEqual(
+            snapshot.lookup('US/Eastern', WINTER),
+            (-18000, datetime(2014, 3, 9, 7))
+        )
+        self.assertEqual(
+            snapshot.lookup('US/Eastern', SUMMER),
+            (-14400, datetime(2014, 11, 2, 6))
+        )
+        # Without a transition, the offset expires with the snapshot
+        self.assertEqual(
+            snapshot.lookup('Asia/Tokyo', SUMMER),
+            (32400, datetime(2015, 1, 1))
+        )
+
+    def test_lookup_outside_of_snapshot(self):
+        snapshot = build_choices_snapshot(TIMEZONES, now=WINTER, days=30)
+
+        self.assertIsNone(snapshot.lookup('US/Eastern', SUMMER))
+        self.assertIsNone(snapshot.lookup('US/Eastern', datetime(2013, 1, 1)))
+        self.assertIsNone(snapshot.lookup('US/Pacific', WINTER))
+        self.assertIsNone(snapshot.lookup(['US/Eastern'], WINTER))
+        self.assertTrue(snapshot.is_valid(WINTER))
+        self.assertFalse(snapshot.is_valid(SUMMER))
+
+    def test_round_trip(self):
+        snapshot = build_choices_snapshot(TIMEZONES, now=WINTER)
+        loaded = load_choices_snapshot(self.write_snapshot(snapshot))
+
+        self.assertEqual(loaded.to_dict(), snapshot.to_dict())
+        self.assertEqual(
+            loaded.lookup('Europe/London', SUMMER),
+            snapshot.lookup('Europe/London', SUMMER)
+        )
+
+    def test_invalid_snapshot(self):
+        data = build_choices_snapshot(TIMEZONES, now=WINTER).to_dict()
+
+        with self.assertRaises(ValueError):
+            ChoicesSnapshot.from_dict(dict(data, pytz_version='2000.1'))
+
+        with self.assertRaises(ValueError):
+            ChoicesSnapshot.from_dict(dict(data, format=0))
+
+        with self.assertRaises(ValueError):
+            ChoicesSnapshot.from_dict({'format': 1})
+
+    def test_choices_do_not_read_tzfiles(self):
+        expected = self.get_choices_at(TimeZoneChoices(TIMEZONES), WINTER)
+        load_choices_snapshot(self.write_snapshot(
+            build_choices_snapshot(TIMEZONES, now=WINTER, days=365)
+        ))
+        choices = TimeZoneChoices(TIMEZONES)
+
+        with mock.patch.object(
+            choices_module,
+            'utcoffset_at',
+            side_effect=AssertionError
+        ), mock.patch.object(
+            choices_module,
+            'next_transition',
+            side_effect=AssertionError
+        ):
+            self.assertEqual(self.get_choices_at(choices, WINTER), expected)
+            self.assertEqual(choices.expires, datetime(2014, 3, 9, 7))
+
+            self.assertEqual(
+                self.get_choices_at(choices, SUMMER)[0],
+                ('US/Eastern', '(GMT-04:00) US/Eastern')
+            )
+
+    def test_expired_snapshot_falls_back_to_pytz(self):
+        load_choices_snapshot(self.write_snapshot(
+            build_choices_snapshot(TIMEZONES, now=WINTER, days=30)
+        ))
+        choices = TimeZoneChoices(TIMEZONES)
+        self.get_choices_at(choices, WINTER)
+
+        # Every time zone is localized again when the snapshot expires
+        self.assertEqual(choices.expires, datetime(2014, 1, 31))
+
+        with mock.patch.object(
+            choices_module,
+            'utcoffset_at',
+            wraps=choices_module.utcoffset_at
+        ) as utcoffset_at:
+            self.assertEqual(
+                self.get_choices_at(choices, SUMMER)[0],
+                ('US/Eastern', '(GMT-04:00) US/Eastern')
+            )
+            self.assertEqual(utcoffset_at.call_count, len(TIMEZONES))
+
+    def test_setting(self):
+        path = self.write_snapshot(
+            build_choices_snapshot(TIMEZONES, now=WINTER)
+        )
+
+        with override_settings(TIMEZONE_UTILS_CHOICES_SNAPSHOT=path):
+            self.assertEqual(choices_module._get_snapshot().zones.keys(), {
+                'US/Eastern', 'Europe/London', 'Asia/Tokyo', 'UTC'
+            })
+
+        self.assertIsNone(choices_module._get_snapshot())
+
+    def test_unusable_setting_warns(self):
+        missing = os.path.join(self.directory, 'missing.json')
+
+        with override_settings(TIMEZONE_UTILS_CHOICES_SNAPSHOT=missing):
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                self.assertIsNone(choices_module._get_snapshot())
+                self.assertIsNone(choices_module._get_snapshot())
+
+        self.assertEqual(len(caught), 1)
+        self.assertIn('missing.json', str(caught[0].message))
+
+
+class SnapshotCommandTestCase(SnapshotTestCase):
+    def test_writes_snapshot(self):
+        stdout = StringIO()
+        call_command('timezone_choices_snapshot', self.path, stdout=stdout)
+
+        snapshot = load_choices_snapshot(self.path)
+        self.assertEqual(
+            len(snapshot.zones),
+            len(choices_module.ALL_TIMEZONE_NAMES)
+        )
+        self.assertEqual(
+            snapshot.valid_until - snapshot.valid_from,
+            365 * 24 * 60 * 60
+        )
+        self.assertIn(self.path, stdout.getvalue())
+
+    def test_setting_and_days(self):
+        with override_settings(TIMEZONE_UTILS_CHOICES_SNAPSHOT=self.path):
+            call_command(
+                'timezone_choices_snapshot',
+                days=30,
+                stdout=StringIO()
+            )
+
+        snapshot = load_choices_snapshot(self.path)
+        self.assertEqual(
+            snapshot.valid_until - snapshot.valid_from,
+            30 * 24 * 60 * 60
+        )
+
+    def test_standard_output(self):
+        stdout = StringIO()
+        call_command('timezone_choices_snapshot', '-', stdout=stdout)
+
+        self.assertEqual(json.loads(stdout.getvalue())['format'], 1)
+
+    def test_errors(self):
+        with self.assertRaises(CommandError):
+            call_command('timezone_choices_snapshot')
+
+        with self.assertRaises(CommandError):
+            call_command('timezone_choices_snapshot', self.path, days=0)
@@ -0,0 +1,134 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from unittest import mock
+import pytz
+
+# Django
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.forms import ModelForm
+from django.test import TestCase
+
+# App
+from tests.models import LocationTimeZoneID, LocationTimeZoneIDChoices
+from timezone_utils import zone_ids
+from timezone_utils.cache import get_timezone
+
+
+# ==============================================================================
+# TESTS: TimeZoneIDField
+# ==============================================================================
+class TimeZoneIDFieldTestCase(TestCase):
+    def setUp(self):
+        LocationTimeZoneID.objects.create(timezone='US/Eastern')
+        LocationTimeZoneID.objects.create(timezone=pytz.timezone('Asia/Tokyo'))
+        LocationTimeZoneID.objects.create()
+
+    def test_stored_as_integer_id(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT timezone FROM tests_locationtimezoneid '
+                'WHERE timezone IS NOT NULL ORDER BY id'
+            )
+            self.assertEqual(
+                [row[0] for row in cursor.fetchall()],
+                [
+                    zone_ids.get_zone_id('US/Eastern'),
+                    zone_ids.get_zone_id('Asia/Tokyo'),
+                ]
+            )
+
+    def test_loaded_as_tzinfo(self):
+        location = LocationTimeZoneID.objects.get(timezone='US/Eastern')
+        self.assertIs(location.timezone, get_timezone('US/Eastern'))
+
+    def test_null(self):
+        self.assertIsNone(
+            LocationTimeZoneID.objects.get(timezone=None).timezone
+        )
+
+    def test_lookups_by_name_and_tzinfo(self):
+        self.assertEqual(
+            LocationTimeZoneID.objects.filter(
+                timezone__in=['US/Eastern', pytz.timezone('Asia/Tokyo')]
+            ).count(),
+            2
+        )
+        self.assertTrue(
+            LocationTimeZoneID.objects.filter(
+                timezone=pytz.timezone('Asia/Tokyo')
+            ).exists()
+        )
+
+    def test_invalid_timezone(self):
+        with self.assertRaises(ValidationError):
+            LocationTimeZoneID.objects.create(timezone='Bad/Worse')
+
+        with self.assertRaises(ValidationError):
+            LocationTimeZoneID._meta.get_field('timezone').to_python(0)
+
+    def test_unregistered_timezone(self):
+        field = LocationTimeZoneID._meta.get_field('timezone')
+
+        with self.assertRaises(ValidationError) as context:
+            field.get_prep_value(pytz.FixedOffset(60))
+        self.assertEqual(context.exception.code, 'invalid')
+
+        # A time zone added by a newer pytz which is not yet registered
+        with mock.patch.dict(zone_ids.ZONE_IDS):
+            del zone_ids.ZONE_IDS['Asia/Tokyo']
+            with self.assertRaises(ValidationError) as context:
+                field.get_prep_value('Asia/Tokyo')
+        self.assertEqual(context.exception.code, 'unregistered')
+
+    def test_registry(self):
+        self.assertEqual(zone_ids.get_zone_name(1), 'Africa/Abidjan')
+        self.assertEqual(
+            len(set(zone_ids.ZONE_NAMES)),
+            len(zone_ids.ZONE_NAMES)
+        )
+        with self.assertRaises(KeyError):
+            zone_ids.get_zone_name(0)
+        with self.assertRaises(KeyError):
+            zone_ids.get_zone_name(len(zone_ids.ZONE_NAMES))
+
+    def test_form(self):
+        class TimeZoneIDForm(ModelForm):
+            class Meta:
+                model = LocationTimeZoneID
+                fields = ('timezone', )
+
+        form = TimeZoneIDForm(data={'timezone': 'Europe/Paris'})
+        self.assertTrue(form.is_valid())
+        location = form.save()
+        self.assertEqual(
+            LocationTimeZoneID.objects.get(pk=location.pk).timezone,
+            get_timezone('Europe/Paris')
+        )
+
+        form = TimeZoneIDForm(data={'timezone': 'Bad/Value'})
+        self.assertFalse(form.is_valid())
+
+    def test_form_with_choices(self):
+        class TimeZoneIDForm(ModelForm):
+            class Meta:
+                model = LocationTimeZoneIDChoices
+                fields = ('timezone', )
+
+        form = TimeZoneIDForm(data={'timezone': 'Europe/Paris'})
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(
+            form.save().timezone,
+            get_timezone('Europe/Paris')
+        )
+
+        form = TimeZoneIDForm(data={'timezone': 'Bad/Value'})
+        self.assertFalse(form.is_valid())
+
+    def test_full_clean(self):
+        LocationTimeZoneIDChoices(timezone='US/Eastern').full_clean()
+
+        with self.assertRaises(ValidationError):
+            LocationTimeZoneIDChoices(timezone='Bad/Worse').full_clean()
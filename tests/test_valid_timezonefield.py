@@ -8,11 +8,15 @@ import pytz
 
 # Django
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.forms import ModelForm
 from django.test import TestCase
 
 from tests.models import (LocationTimeZone, LocationTimeZoneChoices,
+                          ModelWithForeignKeyToTimeZone,
                           TZWithGoodStringDefault, TZWithGoodTZInfoDefault)
+from timezone_utils.cache import get_timezone
+from timezone_utils.fields import TimeZoneField
 
 
 # ==============================================================================
@@ -55,7 +59,7 @@ class TimeZoneFieldTestCase(TestCase):
         location = LocationTimeZone.objects.get(timezone='US/Eastern')
         self.assertEquals(
             location.timezone,
-            pytz.timezone('US/Eastern'),
+            get_timezone('US/Eastern'),
         )
 
     def test_location_is_none(self):
@@ -118,3 +122,80 @@ class TimeZoneFieldTestCase(TestCase):
             form.is_valid(),
             msg='The choice should not be valid.'
         )
+
+
+class TimeZoneFieldDBConverterTestCase(TestCase):
+    def test_nullable_values(self):
+        LocationTimeZone.objects.create(timezone='US/Eastern')
+        LocationTimeZone.objects.create(timezone=None)
+        LocationTimeZone.objects.create(timezone='')
+
+        self.assertEqual(
+            list(LocationTimeZone.objects.order_by('pk').values_list(
+                'timezone',
+                flat=True
+            )),
+            [get_timezone('US/Eastern'), None, '']
+        )
+
+    def test_not_null_values(self):
+        TZWithGoodStringDefault.objects.create(timezone='US/Pacific')
+
+        self.assertEqual(
+            list(TZWithGoodStringDefault.objects.values_list(
+                'timezone',
+                flat=True
+            )),
+            [get_timezone('US/Pacific')]
+        )
+
+    def test_not_null_column_through_outer_join(self):
+        """NOT NULL columns are still NULL when the outer join finds no
+        row.
+
+        """
+        TZWithGoodStringDefault.objects.create()
+
+        self.assertEqual(
+            list(TZWithGoodStringDefault.objects.values_list(
+                'fk_to_tz__other_model__timezone',
+                flat=True
+            )),
+            [None]
+        )
+        self.assertFalse(ModelWithForeignKeyToTimeZone.objects.exists())
+
+    def test_invalid_stored_value(self):
+        location = LocationTimeZone.objects.create(timezone='US/Eastern')
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'UPDATE {0} SET timezone = %s WHERE id = %s'.format(
+                    LocationTimeZone._meta.db_table
+                ),
+                ['Bad/Value', location.pk]
+            )
+
+        with self.assertRaises(ValidationError):
+            LocationTimeZone.objects.get(pk=location.pk)
+
+    def test_subclass_conversions_are_used(self):
+        class FromDBValueField(TimeZoneField):
+            def from_db_value(self, value, *args):
+                return ('from_db_value', value)
+
+        class ToPythonField(TimeZoneField):
+            def to_python(self, value):
+                return ('to_python', value)
+
+        for field_class, expected in (
+            (FromDBValueField, ('from_db_value', 'US/Eastern')),
+            (ToPythonField, ('to_python', 'US/Eastern')),
+        ):
+            converters = field_class(max_length=63).get_db_converters(
+                connection
+            )
+            value = 'US/Eastern'
+            for converter in converters:
+                value = converter(value, None, connection)
+
+            self.assertEqual(value, expected)
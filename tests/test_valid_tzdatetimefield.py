@@ -2,16 +2,19 @@
 # IMPORTS
 # ==============================================================================
 # Python
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as datetime_time, timedelta
 import pytz
+import threading
 
 # Django
 from django.conf import settings
 from django.test import TestCase
-from django.utils.timezone import make_aware
+from django.utils.timezone import get_default_timezone, make_aware
 
 # App
 from tests.models import TZWithGoodStringDefault
+from timezone_utils.providers import zone_name
 from .models import (ModelWithDateTimeOnly, CallableTimeStampedModel,
                      StaticTimeStampedModel, ModelWithForeignKeyToTimeZone,
                      NullModelWithDateTimeOnly, ModelWithLocalTimeZone,
@@ -122,19 +125,42 @@ class DateTimeWithTimeZoneFieldTestCase(TestCase):
             model_instance.timestamp,
             settings.TEST_DATETIME
         )
+        # Loaded values are in the default timezone, no matter which timezone
+        #   was used by the last save.
         self.assertEqual(
             model_instance.timestamp.tzinfo,
-            pytz.timezone('US/Eastern').normalize(
-                model_instance.timestamp
-            ).tzinfo
+            get_default_timezone()
         )
         self.assertEqual(
             str(model_instance.timestamp),
+            '2014-01-01 00:00:00+00:00'
+        )
+        self.assertEqual(
+            str(model_instance.timestamp.astimezone(
+                model_instance.other_model.timezone
+            )),
             '2013-12-31 19:00:00-05:00'
         )
 
     def test_full_overrides(self):
         model_instance = TZTimeFramedModel.objects.get()
+        tz = model_instance.other_model.timezone
+        self.assertEqual(
+            str(model_instance.start.astimezone(tz)),
+            '2014-01-01 00:00:00-05:00'
+        )
+        self.assertEqual(
+            str(model_instance.end.astimezone(tz)),
+            '2014-12-31 23:59:59.999999-05:00'
+        )
+
+    def test_saved_instance_is_in_linked_timezone(self):
+        location = TZWithGoodStringDefault.objects.create()
+        model_instance = TZTimeFramedModel.objects.create(
+            start=datetime(2014, 1, 1),
+            end=datetime(2014, 12, 31),
+            other_model=location
+        )
         self.assertEqual(
             str(model_instance.start),
             '2014-01-01 00:00:00-05:00'
@@ -143,3 +169,127 @@ class DateTimeWithTimeZoneFieldTestCase(TestCase):
             str(model_instance.end),
             '2014-12-31 23:59:59.999999-05:00'
         )
+
+    def test_field_timezone_is_not_mutated(self):
+        field = ModelWithLocalTimeZone._meta.get_field('timestamp')
+        ModelWithLocalTimeZone.objects.create(timezone='Asia/Tokyo')
+        self.assertFalse(hasattr(field, 'timezone'))
+        self.assertEqual(
+            field.to_python(settings.TEST_DATETIME).tzinfo,
+            get_default_timezone()
+        )
+
+
+class DateTimeWithTimeZoneFieldTimeOverrideTestCase(TestCase):
+    def test_constant_time_override_is_resolved_once(self):
+        field = StaticTimeStampedModel._meta.get_field('start')
+        self.assertEqual(field._constant_time_override, datetime_time(0, 0))
+        self.assertIs(field._get_time_override(), field.time_override)
+
+    def test_callable_time_override_is_called_per_save(self):
+        calls = []
+
+        def time_override():
+            calls.append(None)
+            return datetime_time(12, 30)
+
+        field = CallableTimeStampedModel._meta.get_field('start').clone()
+        field.time_override = time_override
+        field._constant_time_override = None
+
+        for _ in range(2):
+            self.assertEqual(
+                field._convert_values(
+                    values=[datetime(2014, 1, 1)],
+                    tz=pytz.timezone('US/Eastern'),
+                    add=True
+                ),
+                [pytz.timezone('US/Eastern').localize(
+                    datetime(2014, 1, 1, 12, 30)
+                )]
+            )
+
+        self.assertEqual(len(calls), 2)
+
+    def test_override_uses_the_local_date(self):
+        """The date is taken after converting to the time zone."""
+        field = StaticTimeStampedModel._meta.get_field('start')
+        tz = pytz.timezone('US/Pacific')
+
+        self.assertEqual(
+            field._convert_values(
+                values=[pytz.utc.localize(datetime(2014, 1, 1, 3))],
+                tz=tz,
+                add=True
+            ),
+            [tz.localize(datetime(2013, 12, 31))]
+        )
+
+    def test_localized_overrides_are_shared_and_bounded(self):
+        field = StaticTimeStampedModel._meta.get_field('end').clone()
+        field.MAX_LOCALIZED_OVERRIDES = 10
+        tz = pytz.timezone('Europe/Paris')
+
+        first, second = field._convert_values(
+            values=[datetime(2014, 7, 1, 8), datetime(2014, 7, 1, 20)],
+            tz=tz,
+            add=True
+        )
+        self.assertIs(first, second)
+        self.assertEqual(
+            first,
+            tz.localize(datetime(2014, 7, 1, 23, 59, 59, 999999))
+        )
+
+        field._convert_values(
+            values=[
+                datetime(2014, 1, 1) + timedelta(days=days)
+                for days in range(25)
+            ],
+            tz=tz,
+            add=True
+        )
+        self.assertLessEqual(len(field._localized_overrides), 10)
+
+
+class DateTimeWithTimeZoneFieldThreadingTestCase(TestCase):
+    THREADS = 8
+    ITERATIONS = 200
+    TIMEZONES = ('US/Eastern', 'Europe/Paris', 'Asia/Tokyo', 'Australia/ACT',
+                 'America/Sao_Paulo', 'Asia/Kolkata', 'Pacific/Auckland',
+                 'Africa/Cairo')
+
+    def test_concurrent_pre_save_and_to_python(self):
+        """Saving and loading from many threads at once must never mix up the
+        timezones of different model instances.
+
+        """
+        field = ModelWithLocalTimeZone._meta.get_field('timestamp')
+        default_timezone = get_default_timezone()
+        barrier = threading.Barrier(self.THREADS)
+
+        def work(tz_name):
+            errors = []
+            barrier.wait()
+
+            for _ in range(self.ITERATIONS):
+                instance = ModelWithLocalTimeZone(
+                    timezone=tz_name,
+                    timestamp=datetime(2014, 6, 1, 12)
+                )
+                saved = field.pre_save(instance, add=True)
+                loaded = field.to_python(saved)
+
+                if zone_name(saved.tzinfo) != tz_name:
+                    errors.append(('pre_save', saved))
+                if saved.replace(tzinfo=None) != datetime(2014, 6, 1, 12):
+                    errors.append(('pre_save', saved))
+                if loaded.tzinfo != default_timezone or loaded != saved:
+                    errors.append(('to_python', loaded))
+
+            return errors
+
+        with ThreadPoolExecutor(max_workers=self.THREADS) as executor:
+            results = list(executor.map(work, self.TIMEZONES))
+
+        self.assertEqual([error for errors in results for error in errors], [])
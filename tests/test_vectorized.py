@@ -0,0 +1,127 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from datetime import datetime
+import unittest
+import pytz
+
+# Django
+from django.test import TestCase
+
+# App
+from timezone_utils import offsets, zone_ids
+from timezone_utils.vectorized import localize_epochs, numpy
+
+
+# ==============================================================================
+# TESTS
+# ==============================================================================
+EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch(value):
+    return int((value - EPOCH).total_seconds())
+
+
+class LocalizeEpochsTestCase(TestCase):
+    use_numpy = False
+
+    INSTANTS = (
+        datetime(2014, 1, 1, 12),
+        datetime(2014, 3, 9, 6, 59, 59),
+        datetime(2014, 3, 9, 7),
+        datetime(2014, 7, 1, 12),
+        datetime(1960, 1, 1),
+    )
+    ZONES = ('US/Eastern', 'Europe/Paris', 'Asia/Kolkata', 'UTC',
+             'Australia/Lord_Howe')
+
+    def localize(self, epochs, zones):
+        local_epochs, offsets = localize_epochs(
+            epochs,
+            zones,
+            use_numpy=self.use_numpy
+        )
+        return list(map(int, local_epochs)), list(map(int, offsets))
+
+    def test_matches_pytz(self):
+        epochs, zones, expected = [], [], []
+
+        for instant in self.INSTANTS:
+            for zone in self.ZONES:
+                epochs.append(to_epoch(instant))
+                zones.append(zone)
+                local = pytz.utc.localize(instant).astimezone(
+                    pytz.timezone(zone)
+                )
+                expected.append(
+                    (
+                        to_epoch(local.replace(tzinfo=None)),
+                        int(local.utcoffset().total_seconds()),
+                    )
+                )
+
+        local_epochs, offsets = self.localize(epochs, zones)
+        self.assertEqual(list(zip(local_epochs, offsets)), expected)
+
+    def test_zone_ids_and_tzinfo(self):
+        epoch = to_epoch(datetime(2014, 7, 1))
+        self.assertEqual(
+            self.localize(
+                [epoch, epoch],
+                [zone_ids.get_zone_id('US/Eastern'), pytz.timezone('Asia/Tokyo')]
+            ),
+            (
+                [epoch - 4 * 3600, epoch + 9 * 3600],
+                [-4 * 3600, 9 * 3600]
+            )
+        )
+
+    def test_names_mixed_with_zone_ids(self):
+        epoch = to_epoch(datetime(2014, 7, 1))
+        self.assertEqual(
+            self.localize(
+                [epoch, epoch, epoch],
+                ['UTC', zone_ids.get_zone_id('Asia/Tokyo'), 'Asia/Tokyo']
+            ),
+            (
+                [epoch, epoch + 9 * 3600, epoch + 9 * 3600],
+                [0, 9 * 3600, 9 * 3600]
+            )
+        )
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            self.localize([0, 1], ['UTC'])
+
+    def test_unknown_timezone(self):
+        with self.assertRaises(pytz.UnknownTimeZoneError):
+            self.localize([0], ['Bad/Worse'])
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class NumpyLocalizeEpochsTestCase(LocalizeEpochsTestCase):
+    use_numpy = True
+
+    def test_integer_id_arrays(self):
+        epoch = to_epoch(datetime(2014, 7, 1))
+        self.assertEqual(
+            self.localize(
+                numpy.array([epoch]),
+                numpy.array([zone_ids.get_zone_id('US/Eastern')])
+            ),
+            ([epoch - 4 * 3600], [-4 * 3600])
+        )
+
+    def test_returns_arrays(self):
+        local_epochs, offsets = localize_epochs([0], ['Asia/Tokyo'])
+        self.assertIsInstance(local_epochs, numpy.ndarray)
+        self.assertEqual(offsets.tolist(), [9 * 3600])
+
+    def test_arrays_cleared_with_the_offset_index(self):
+        localize_epochs([0], ['Asia/Tokyo'])
+        self.assertIn('Asia/Tokyo', offsets._zone_arrays)
+
+        offsets.offset_cache_clear()
+        self.assertNotIn('Asia/Tokyo', offsets._zone_arrays)
@@ -0,0 +1,138 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+import copy
+from datetime import datetime
+from unittest import mock
+
+# Django
+from django import forms
+from django.test import TestCase
+from django.utils import translation
+
+# App
+from tests.models import LocationTimeZoneChoices
+from timezone_utils import choices as choices_module
+from timezone_utils import widgets
+from timezone_utils.cache import get_timezone
+from timezone_utils.choices import (GROUPED_ALL_TIMEZONES_CHOICES,
+                                    PRETTY_ALL_TIMEZONES_CHOICES,
+                                    TimeZoneChoices)
+from timezone_utils.widgets import TimeZoneSelect
+
+
+# ==============================================================================
+# TESTS
+# ==============================================================================
+class TimeZoneSelectTestCase(TestCase):
+    def setUp(self):
+        widgets._options_cache.clear()
+        self.addCleanup(widgets._options_cache.clear)
+
+    def assertRendersLikeSelect(self, choices, value, **kwargs):
+        widget = TimeZoneSelect(choices=choices)
+        self.assertEqual(
+            widget.render('timezone', value, **kwargs),
+            forms.Select(choices=choices).render(
+                'timezone',
+                value if value is None else str(value),
+                **kwargs
+            )
+        )
+
+    def test_same_output_as_select(self):
+        for choices in (
+            GROUPED_ALL_TIMEZONES_CHOICES,
+            PRETTY_ALL_TIMEZONES_CHOICES,
+            (('', '---------'), ) + PRETTY_ALL_TIMEZONES_CHOICES,
+        ):
+            for value in (None, '', 'US/Eastern', 'Bad/Worse'):
+                self.assertRendersLikeSelect(
+                    choices,
+                    value,
+                    attrs={'id': 'id_timezone', 'class': 'timezone'}
+                )
+
+            self.assertRendersLikeSelect(choices, get_timezone('Asia/Tokyo'))
+
+    def test_options_are_rendered_once(self):
+        widget = TimeZoneSelect(choices=GROUPED_ALL_TIMEZONES_CHOICES)
+        widget.render('timezone', 'US/Eastern')
+
+        with mock.patch.object(
+            TimeZoneSelect,
+            'optgroups',
+            side_effect=AssertionError
+        ):
+            # Another widget (as in another form instance) uses the cache
+            html = TimeZoneSelect(
+                choices=list(GROUPED_ALL_TIMEZONES_CHOICES)
+            ).render('timezone', 'Europe/Paris')
+
+        self.assertIn('<option value="Europe/Paris" selected>', html)
+        self.assertEqual(html.count(' selected'), 1)
+        self.assertEqual(len(widgets._options_cache), 1)
+
+    def test_rendered_per_language(self):
+        widget = TimeZoneSelect(choices=PRETTY_ALL_TIMEZONES_CHOICES)
+        widget.render('timezone', None)
+
+        with translation.override('fr'):
+            widget.render('timezone', None)
+
+        self.assertEqual(len(widgets._options_cache), 2)
+
+    def test_rendered_again_when_offsets_change(self):
+        choices = TimeZoneChoices(['US/Eastern', 'UTC'])
+        widget = TimeZoneSelect(choices=choices)
+
+        for now, label in (
+            (datetime(2014, 1, 1), '(GMT-05:00) US/Eastern'),
+            (datetime(2014, 7, 1), '(GMT-04:00) US/Eastern'),
+        ):
+            with mock.patch.object(
+                choices_module,
+                '_utcnow',
+                return_value=now
+            ):
+                self.assertIn(
+                    '<option value="US/Eastern" selected>{0}</option>'.format(
+                        label
+                    ),
+                    widget.render('timezone', 'US/Eastern')
+                )
+
+        self.assertEqual(len(widgets._options_cache), 2)
+
+        # Form instances deep copy their widgets
+        self.assertIs(copy.deepcopy(widget).choices, choices)
+
+    def test_cache_size(self):
+        with mock.patch.object(widgets, 'OPTIONS_CACHE_SIZE', 2):
+            for name in ('UTC', 'US/Eastern', 'Europe/Paris'):
+                TimeZoneSelect(choices=((name, name), )).render('tz', None)
+
+        self.assertEqual(len(widgets._options_cache), 2)
+
+    def test_unhashable_choices(self):
+        self.assertRendersLikeSelect(
+            [('GMT+00:00', [('UTC', 'UTC')])],
+            'UTC'
+        )
+        self.assertEqual(len(widgets._options_cache), 0)
+
+    def test_model_form(self):
+        class LocationForm(forms.ModelForm):
+            class Meta:
+                model = LocationTimeZoneChoices
+                fields = ('timezone', )
+                widgets = {'timezone': TimeZoneSelect()}
+
+        location = LocationTimeZoneChoices(timezone='Europe/Paris')
+        html = str(LocationForm(instance=location)['timezone'])
+
+        self.assertIn('<option value="Europe/Paris" selected>', html)
+        self.assertTrue(
+            LocationForm(data={'timezone': 'US/Eastern'}).is_valid()
+        )
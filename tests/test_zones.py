@@ -0,0 +1,72 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+import pytz
+
+# Django
+from django.test import TestCase
+
+# App
+from timezone_utils import zones
+
+
+# ==============================================================================
+# TESTS
+# ==============================================================================
+class ZoneRegistryTestCase(TestCase):
+    def test_registry_matches_pytz(self):
+        self.assertEqual(zones.ALL_TIMEZONES, set(pytz.all_timezones))
+        self.assertEqual(zones.COMMON_TIMEZONES, set(pytz.common_timezones))
+        self.assertEqual(zones.ALL_TIMEZONE_NAMES, tuple(pytz.all_timezones))
+        self.assertEqual(zones.PYTZ_VERSION, pytz.VERSION)
+
+    def test_max_length(self):
+        self.assertEqual(zones.MAX_LENGTH, max(map(len, pytz.all_timezones)))
+
+    def test_is_valid_timezone(self):
+        self.assertTrue(zones.is_valid_timezone('US/Eastern'))
+        self.assertFalse(zones.is_valid_timezone('Bad/Worse'))
+        self.assertFalse(zones.is_valid_timezone(None))
+        self.assertFalse(zones.is_valid_timezone(['US/Eastern']))
+
+    def test_invalid_timezones(self):
+        self.assertEqual(
+            zones.invalid_timezones(
+                ['US/Eastern', 'Bad/Worse', '', 'Bad/Worse', 'Nowhere'],
+                ignore=('', )
+            ),
+            ['Bad/Worse', 'Nowhere']
+        )
+
+    def test_is_common_timezone(self):
+        self.assertTrue(zones.is_common_timezone('America/New_York'))
+        self.assertFalse(zones.is_common_timezone('Etc/GMT+5'))
+        self.assertFalse(zones.is_common_timezone([]))
+
+
+class ZoneMetadataTestCase(TestCase):
+    def test_link(self):
+        self.assertEqual(
+            zones.get_zone_metadata('US/Eastern'),
+            zones.ZoneMetadata(
+                name='US/Eastern',
+                length=10,
+                canonical='America/New_York',
+                common=True,
+            )
+        )
+
+    def test_canonical_zone(self):
+        self.assertEqual(
+            zones.get_canonical_name('America/New_York'),
+            'America/New_York'
+        )
+
+    def test_links_point_to_known_zones(self):
+        for name in zones.ALL_TIMEZONE_NAMES:
+            self.assertIn(zones.get_canonical_name(name), zones.ALL_TIMEZONES)
+
+    def test_unknown_zone(self):
+        with self.assertRaises(pytz.UnknownTimeZoneError):
+            zones.get_zone_metadata('Bad/Worse')
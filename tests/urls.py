@@ -0,0 +1,13 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Django
+from django.urls import include, path
+
+
+# ==============================================================================
+# URLS
+# ==============================================================================
+urlpatterns = [
+    path('timezones/', include('timezone_utils.urls')),
+]
@@ -0,0 +1,182 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from collections import OrderedDict, namedtuple
+import threading
+
+import pytz
+
+# Django
+from django.core.signals import setting_changed
+
+# App
+from timezone_utils.providers import get_provider
+from timezone_utils.zones import ALL_TIMEZONES
+
+__all__ = ('CacheInfo', 'TimeZoneCache', 'timezone_cache', 'get_timezone')
+
+
+# ==============================================================================
+# TIME ZONE CACHE
+# ==============================================================================
+CacheInfo = namedtuple('CacheInfo', 'hits misses size unknown max_unknown')
+
+# Marker stored for names which the provider failed to resolve
+_UNKNOWN = object()
+
+
+class TimeZoneCache(object):
+    """
+    Interned map of time zone names to tzinfo instances, resolved by a time
+    zone provider (see `timezone_utils.providers`).
+
+    The map is pre-seeded with every name in pytz.all_timezones, so resolving
+    a known (and previously used) name is a single dictionary lookup. Names
+    which are not in pytz.all_timezones (case variations which the provider
+    accepts or invalid names) are kept in a separate map holding at most
+    `max_unknown` entries, which are evicted by either `'lru'` or `'fifo'`
+    order.
+
+    `provider` is a provider alias, dotted path or instance. It defaults to
+    the `TIMEZONE_UTILS_PROVIDER` setting, which is read on first use.
+    """
+    EVICTION_POLICIES = ('lru', 'fifo')
+
+    def __init__(self, max_unknown=128, eviction='lru', provider=None):
+        if eviction not in self.EVICTION_POLICIES:
+            raise ValueError(
+                'Invalid eviction policy {0!r}. Must be one of {1}.'.format(
+                    eviction,
+                    ', '.join(self.EVICTION_POLICIES)
+                )
+            )
+
+        self.max_unknown = max_unknown
+        self.eviction = eviction
+        self._lock = threading.Lock()
+        self._provider_option = provider
+        self._provider = None
+        self.cache_clear()
+
+    @property
+    def provider(self):
+        """The time zone provider, created on first use."""
+
+        if self._provider is None:
+            self._provider = get_provider(self._provider_option)
+        return self._provider
+
+    def set_provider(self, provider=None):
+        """
+        Switches to another provider (or back to the setting, for None) and
+        clears the cache, which holds the previous provider's instances.
+        """
+        with self._lock:
+            self._provider_option = provider
+            self._provider = None
+
+        self.cache_clear()
+
+    def get(self, name):
+        """
+        Returns the tzinfo instance for `name`.
+
+        Raises pytz.UnknownTimeZoneError if the provider does not know the
+        name.
+        """
+        tz = self._zones.get(name)
+
+        if tz is None:
+            return self._resolve(name)
+
+        self.hits += 1
+        return tz
+
+    def _resolve(self, name):
+        """Slow path: resolves `name` through the provider and stores the
+        result.
+
+        """
+
+        with self._lock:
+            if name in self._zones:
+                tz = self._zones[name]
+                if tz is None:
+                    self.misses += 1
+                    tz = self._zones[name] = self.provider.get(name)
+                else:
+                    self.hits += 1
+                return tz
+
+            try:
+                tz = self._unknown[name]
+            except KeyError:
+                self.misses += 1
+                try:
+                    tz = self.provider.get(name)
+                except pytz.UnknownTimeZoneError:
+                    tz = _UNKNOWN
+                self._store_unknown(name, tz)
+            else:
+                self.hits += 1
+                if self.eviction == 'lru':
+                    self._unknown.move_to_end(name)
+
+        if tz is _UNKNOWN:
+            raise pytz.UnknownTimeZoneError(name)
+
+        return tz
+
+    def _store_unknown(self, name, tz):
+        """Stores a name which is not in pytz.all_timezones, evicting the
+        oldest (or least recently used) entry when the map is full.
+
+        """
+        if self.max_unknown <= 0:
+            return
+
+        while len(self._unknown) >= self.max_unknown:
+            self._unknown.popitem(last=False)
+
+        self._unknown[name] = tz
+
+    def cache_info(self):
+        """Reports the cache statistics."""
+
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            size=sum(1 for tz in self._zones.values() if tz is not None),
+            unknown=len(self._unknown),
+            max_unknown=self.max_unknown,
+        )
+
+    def cache_clear(self):
+        """Clears the cache and its statistics."""
+
+        with self._lock:
+            self._zones = dict.fromkeys(ALL_TIMEZONES)
+            self._unknown = OrderedDict()
+            self.hits = 0
+            self.misses = 0
+
+
+# Shared by the model and form fields
+timezone_cache = TimeZoneCache()
+
+
+def get_timezone(name):
+    """Returns the tzinfo instance for `name` from the shared cache."""
+
+    return timezone_cache.get(name)
+
+
+def reset_provider(setting, **kwargs):
+    """Picks up changes of the TIMEZONE_UTILS_PROVIDER setting (in tests)."""
+
+    if setting == 'TIMEZONE_UTILS_PROVIDER':
+        timezone_cache.set_provider(None)
+
+
+setting_changed.connect(reset_provider)
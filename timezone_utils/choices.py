@@ -2,13 +2,30 @@
 # IMPORTS
 # ==============================================================================
 # Python
-from collections import defaultdict, namedtuple
-from datetime import datetime
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict, namedtuple
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+import json
 from operator import attrgetter
 import pytz
 import re
+import threading
+import warnings
 
-__all__ = ('get_choices', 'ALL_TIMEZONES_CHOICES', 'COMMON_TIMEZONES_CHOICES',
+# Django
+from django.conf import settings
+from django.core.signals import setting_changed
+
+# App
+from timezone_utils.offsets import (EPOCH, SECOND, get_zone_offsets,
+                                    next_transition, utcoffset_at)
+from timezone_utils.zones import ALL_TIMEZONE_NAMES, COMMON_TIMEZONE_NAMES
+
+__all__ = ('get_choices', 'ChoicesCacheInfo', 'ChoicesSnapshot',
+           'build_choices_snapshot', 'load_choices_snapshot',
+           'LazyChoices', 'TimeZoneChoices',
+           'ALL_TIMEZONES_CHOICES', 'COMMON_TIMEZONES_CHOICES',
            'GROUPED_ALL_TIMEZONES_CHOICES', 'GROUPED_COMMON_TIMEZONES_CHOICES',
            'PRETTY_ALL_TIMEZONES_CHOICES', 'PRETTY_COMMON_TIMEZONES_CHOICES')
 
@@ -22,39 +39,69 @@ TIMEZONE_OFFSET_REGEX = re.compile(
 )
 
 
-def get_choices(timezones, grouped=False):
-    """Retrieves timezone choices from any iterable (normally pytz)."""
+# Created a namedtuple to store the "key" for the choices_dict
+TZOffset = namedtuple('TZOffset', 'value offset_string')
 
-    # Created a namedtuple to store the "key" for the choices_dict
-    TZOffset = namedtuple('TZOffset', 'value offset_string')
 
-    choices_dict = defaultdict(list)
+def _utcnow():
+    """Returns the current (naive) UTC datetime."""
+    return datetime.now(pytz.utc).replace(tzinfo=None)
 
-    # Iterate through the timezones and populate the timezone choices
-    for tz in iter(timezones):
-        # Retrieve a datetime object in this time zone
-        now = datetime.now(pytz.timezone(tz))
 
-        # Retrieve the timezone offset ("-0500" / "+0500")
-        offset = now.strftime("%z")
+def _get_offset(tz, now):
+    """Retrieves the TZOffset of the time zone name at `now` (naive UTC)."""
+
+    snapshot_offset = _get_snapshot_offset(tz, now)
+
+    # Retrieve the timezone offset in minutes
+    if snapshot_offset is not None:
+        offset = snapshot_offset[0] // 60
+    else:
+        offset = utcoffset_at(tz, now) // timedelta(minutes=1)
+
+    # Retrieve the offset string ("GMT-12:00" / "GMT+12:00")
+    hours, minutes = divmod(abs(offset), 60)
+    timezone_offset_string = 'GMT{plus_minus}{hours:02d}:{minutes:02d}'.format(
+        plus_minus='-' if offset < 0 else '+',
+        hours=hours,
+        minutes=minutes,
+    )
+
+    return TZOffset(value=offset, offset_string=timezone_offset_string)
 
-        # Retrieve the offset string ("GMT-12:00" / "GMT+12:00")
-        timezone_offset_string = 'GMT{plus_minus}{hours}:{minutes}'.format(
-            **TIMEZONE_OFFSET_REGEX.match(offset).groupdict()
-        )
 
+def _get_next_transition(tz, now):
+    """
+    Retrieves the next instant (naive UTC) after `now` at which the time zone
+    name changes its offset, or None if it never does. Within a choices
+    snapshot, this is the end of the snapshot at the latest.
+    """
+    snapshot_offset = _get_snapshot_offset(tz, now)
+
+    if snapshot_offset is not None:
+        return snapshot_offset[1]
+
+    transition = next_transition(tz, now)
+
+    return transition and transition.replace(tzinfo=None)
+
+
+def _build_choices(zone_offsets, grouped=False):
+    """Builds the choices from an iterable of (tz, TZOffset) pairs."""
+
+    choices_dict = defaultdict(list)
+
+    for tz, tz_offset in zone_offsets:
         if not grouped:
             # Format the timezone display string
             display_string = '({timezone_offset_string}) {tz}'.format(
-                timezone_offset_string=timezone_offset_string,
+                timezone_offset_string=tz_offset.offset_string,
                 tz=tz,
             )
         else:
             display_string = tz
 
-        choices_dict[
-            TZOffset(value=int(offset), offset_string=timezone_offset_string)
-        ].append(
+        choices_dict[tz_offset].append(
             (tz, display_string)
         )
 
@@ -77,25 +124,453 @@ def get_choices(timezones, grouped=False):
     return tuple(choices)
 
 
+def get_choices(timezones, grouped=False):
+    """
+    Retrieves timezone choices from any iterable (normally pytz).
+
+    The choices are memoized per list of time zones and `grouped` until the
+    next offset transition of one of the time zones (see TimeZoneChoices).
+    The `CHOICES_CACHE_SIZE` most recently used lists are kept.
+    """
+    key = (tuple(timezones), bool(grouped))
+
+    with _choices_lock:
+        try:
+            choices = _choices_cache[key]
+        except KeyError:
+            _choices_stats['misses'] += 1
+            choices = _choices_cache[key] = TimeZoneChoices(
+                timezones=key[0],
+                grouped=key[1]
+            )
+
+            while len(_choices_cache) > CHOICES_CACHE_SIZE:
+                _choices_cache.popitem(last=False)
+        else:
+            _choices_stats['hits'] += 1
+            _choices_cache.move_to_end(key)
+
+    return choices._get_choices()
+
+
+def _get_choices_cache_info():
+    """Reports the get_choices cache statistics."""
+
+    return ChoicesCacheInfo(
+        hits=_choices_stats['hits'],
+        misses=_choices_stats['misses'],
+        maxsize=CHOICES_CACHE_SIZE,
+        currsize=len(_choices_cache),
+    )
+
+
+def _get_choices_cache_clear():
+    """Clears the get_choices cache and its statistics."""
+
+    with _choices_lock:
+        _choices_cache.clear()
+        _choices_stats.update(hits=0, misses=0)
+
+
+# Number of (time zones, grouped) combinations memoized by get_choices
+CHOICES_CACHE_SIZE = 32
+
+ChoicesCacheInfo = namedtuple(
+    'ChoicesCacheInfo',
+    'hits misses maxsize currsize'
+)
+
+_choices_cache = OrderedDict()
+_choices_stats = {'hits': 0, 'misses': 0}
+_choices_lock = threading.Lock()
+
+get_choices.cache_info = _get_choices_cache_info
+get_choices.cache_clear = _get_choices_cache_clear
+
+
+# ==============================================================================
+# CHOICES SNAPSHOT
+# ==============================================================================
+SNAPSHOT_FORMAT = 1
+
+
+def _to_timestamp(now):
+    return (now - EPOCH) // SECOND
+
+
+def _from_timestamp(timestamp):
+    return EPOCH + timedelta(seconds=timestamp)
+
+
+class ChoicesSnapshot(object):
+    """
+    The UTC offsets of many time zones over a window of time, which is loaded
+    from a JSON file instead of reading every time zone's tzfile.
+
+    `zones` maps each time zone name to `(offsets, transitions)`: the offset
+    (in seconds) at `valid_from`, followed by the offset which applies from
+    each transition instant (UTC seconds since the epoch) in the window.
+    """
+
+    def __init__(self, pytz_version, valid_from, valid_until, zones):
+        self.pytz_version = pytz_version
+        self.valid_from = valid_from
+        self.valid_until = valid_until
+        self.zones = zones
+
+    def __repr__(self):
+        return '<ChoicesSnapshot: {0} time zones, pytz {1}, {2} - {3}>'.format(
+            len(self.zones),
+            self.pytz_version,
+            _from_timestamp(self.valid_from),
+            _from_timestamp(self.valid_until)
+        )
+
+    def is_valid(self, now):
+        """Whether the snapshot covers `now` (naive UTC)."""
+
+        return self.valid_from <= _to_timestamp(now) < self.valid_until
+
+    def lookup(self, tz, now):
+        """
+        Retrieves `(offset, expires)` of a time zone name at `now` (naive
+        UTC): its offset in seconds, and the instant (naive UTC) of its next
+        transition or of the end of the snapshot. Returns None if the snapshot
+        does not cover the time zone or `now`.
+        """
+        timestamp = _to_timestamp(now)
+
+        if not self.valid_from <= timestamp < self.valid_until:
+            return None
+
+        try:
+            offsets, transitions = self.zones[tz]
+        except (KeyError, TypeError):
+            return None
+
+        index = bisect_right(transitions, timestamp)
+
+        if index < len(transitions):
+            expires = transitions[index]
+        else:
+            expires = self.valid_until
+
+        return offsets[index], _from_timestamp(expires)
+
+    def to_dict(self):
+        """Returns the snapshot as a JSON serializable dict."""
+
+        return {
+            'format': SNAPSHOT_FORMAT,
+            'pytz_version': self.pytz_version,
+            'valid_from': self.valid_from,
+            'valid_until': self.valid_until,
+            'zones': {
+                name: [offsets, transitions]
+                for name, (offsets, transitions) in self.zones.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Creates a snapshot from the dict returned by `to_dict`. Raises
+        ValueError if it is not a snapshot, or was not built with the installed
+        version of pytz.
+        """
+        try:
+            if data['format'] != SNAPSHOT_FORMAT:
+                raise ValueError(
+                    'Unsupported choices snapshot format {0!r}.'.format(
+                        data['format']
+                    )
+                )
+
+            snapshot = cls(
+                pytz_version=data['pytz_version'],
+                valid_from=data['valid_from'],
+                valid_until=data['valid_until'],
+                zones={
+                    name: (offsets, transitions)
+                    for name, (offsets, transitions) in data['zones'].items()
+                }
+            )
+        except (KeyError, TypeError, AttributeError):
+            raise ValueError('Invalid choices snapshot.')
+
+        if snapshot.pytz_version != pytz.__version__:
+            raise ValueError(
+                'The choices snapshot was built with pytz {0}, but pytz {1} '
+                'is installed.'.format(snapshot.pytz_version, pytz.__version__)
+            )
+
+        return snapshot
+
+
+def build_choices_snapshot(timezones=ALL_TIMEZONE_NAMES, now=None, days=365):
+    """
+    Builds the ChoicesSnapshot of the time zones for `days` from `now` (naive
+    UTC), which defaults to the current time.
+    """
+    valid_from = _to_timestamp(now or _utcnow())
+    valid_until = valid_from + int(timedelta(days=days).total_seconds())
+    zones = {}
+
+    for tz in timezones:
+        zone_offsets = get_zone_offsets(tz)
+        start = max(
+            bisect_right(zone_offsets.transitions, valid_from) - 1,
+            0
+        )
+        end = bisect_right(zone_offsets.transitions, valid_until - 1)
+
+        zones[tz] = (
+            list(zone_offsets.offsets[start:end]),
+            list(zone_offsets.transitions[start + 1:end])
+        )
+
+    return ChoicesSnapshot(
+        pytz_version=pytz.__version__,
+        valid_from=valid_from,
+        valid_until=valid_until,
+        zones=zones
+    )
+
+
+def load_choices_snapshot(path):
+    """
+    Loads a choices snapshot written by the `timezone_choices_snapshot`
+    management command, and uses it for the choices while it is valid.
+    Passing None stops using a snapshot.
+
+    Raises ValueError if the file is not a snapshot or was built with another
+    version of pytz.
+    """
+    global _snapshot
+
+    if path is None:
+        snapshot = None
+    else:
+        with open(path) as snapshot_file:
+            snapshot = ChoicesSnapshot.from_dict(json.load(snapshot_file))
+
+    with _snapshot_lock:
+        _snapshot = snapshot
+
+    return snapshot
+
+
+def _get_snapshot():
+    """
+    Retrieves the snapshot in use, loading the one found in the
+    `TIMEZONE_UTILS_CHOICES_SNAPSHOT` setting on first use. A snapshot which
+    cannot be used is reported once with a warning.
+    """
+    global _snapshot
+
+    if _snapshot is not _NOT_LOADED:
+        return _snapshot
+
+    path = None
+    if settings.configured:
+        path = getattr(settings, 'TIMEZONE_UTILS_CHOICES_SNAPSHOT', None)
+
+    try:
+        return load_choices_snapshot(path)
+    except (OSError, ValueError) as e:
+        warnings.warn(
+            'The time zone choices snapshot {0!r} is not used: {1}'.format(
+                path,
+                e
+            )
+        )
+        with _snapshot_lock:
+            _snapshot = None
+        return None
+
+
+def _get_snapshot_offset(tz, now):
+    """Looks up a time zone in the snapshot in use, if there is one."""
+
+    snapshot = _get_snapshot()
+
+    if snapshot is None:
+        return None
+
+    return snapshot.lookup(tz, now)
+
+
+def reset_snapshot(setting, **kwargs):
+    """Picks up changes of the TIMEZONE_UTILS_CHOICES_SNAPSHOT setting (in
+    tests).
+
+    """
+    global _snapshot
+
+    if setting == 'TIMEZONE_UTILS_CHOICES_SNAPSHOT':
+        with _snapshot_lock:
+            _snapshot = _NOT_LOADED
+
+
+_NOT_LOADED = object()
+_snapshot = _NOT_LOADED
+_snapshot_lock = threading.Lock()
+
+setting_changed.connect(reset_snapshot)
+
+
+# ==============================================================================
+# LAZY CHOICES
+# ==============================================================================
+class LazyChoices(Sequence):
+    """
+    A sequence of choices which is computed on first access.
+
+    Building the pretty/grouped choices localizes every time zone, so the
+    constants below are only computed when a form or a check actually reads
+    them. The result is memoized.
+    """
+
+    def __init__(self, function, *args, **kwargs):
+        self._function = function
+        self._args = args
+        self._kwargs = kwargs
+        self._choices = None
+
+    def _get_choices(self):
+        if self._choices is None:
+            self._choices = self._function(*self._args, **self._kwargs)
+        return self._choices
+
+    @property
+    def evaluated(self):
+        """Whether the choices have been computed."""
+        return self._choices is not None
+
+    def __getitem__(self, index):
+        return self._get_choices()[index]
+
+    def __len__(self):
+        return len(self._get_choices())
+
+    def __iter__(self):
+        return iter(self._get_choices())
+
+    def __contains__(self, item):
+        return item in self._get_choices()
+
+    def __eq__(self, other):
+        if isinstance(other, LazyChoices):
+            other = other._get_choices()
+        return self._get_choices() == other
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return self._get_choices() + tuple(other)
+
+    def __radd__(self, other):
+        return tuple(other) + self._get_choices()
+
+    def __repr__(self):
+        return repr(self._get_choices())
+
+
+class TimeZoneChoices(LazyChoices):
+    """
+    Lazy time zone choices which follow the time zones' offset changes.
+
+    The choices are cached for the current offset epoch: the period until the
+    next instant (found in pytz's transition tables) at which any of the time
+    zones changes its UTC offset. Once that instant has passed, only the time
+    zones which went through a transition are localized again.
+    """
+
+    def __init__(self, timezones, grouped=False):
+        super(TimeZoneChoices, self).__init__(None)
+        self.timezones = timezones
+        self.grouped = grouped
+        self.expires = None
+        self._zone_offsets = None
+        self._transitions = None
+        # The constants are shared by the threads of a process
+        self._lock = threading.Lock()
+
+    def _is_stale(self, now):
+        return self._choices is None or (
+            self.expires is not None and now >= self.expires
+        )
+
+    def _get_choices(self):
+        now = _utcnow()
+
+        if self._is_stale(now):
+            with self._lock:
+                if self._is_stale(now):
+                    self._refresh(now)
+
+        return self._choices
+
+    def _refresh(self, now):
+        """Localizes the time zones which changed offset since the last
+        refresh and rebuilds the choices. Must be called with the lock held.
+
+        """
+        if self._zone_offsets is None:
+            timezones = list(self.timezones)
+            zone_offsets = [(tz, _get_offset(tz, now)) for tz in timezones]
+            transitions = [_get_next_transition(tz, now) for tz in timezones]
+        else:
+            zone_offsets = list(self._zone_offsets)
+            transitions = list(self._transitions)
+
+            for index, transition in enumerate(transitions):
+                if transition is not None and transition <= now:
+                    tz = zone_offsets[index][0]
+                    zone_offsets[index] = (tz, _get_offset(tz, now))
+                    transitions[index] = _get_next_transition(tz, now)
+
+        self._zone_offsets = zone_offsets
+        self._transitions = transitions
+        # The choices are set before the expiry, so that a thread which sees
+        #   the new expiry also sees the new choices
+        self._choices = _build_choices(
+            zone_offsets=zone_offsets,
+            grouped=self.grouped
+        )
+        self.expires = min(
+            (
+                transition for transition in transitions
+                if transition is not None
+            ),
+            default=None
+        )
+
+
+def _zip_choices(timezones):
+    """Retrieves unaltered choices from any iterable."""
+    return tuple(zip(timezones, timezones))
+
+
 # ==============================================================================
 # CHOICES CONSTANTS
 # ==============================================================================
 # Standard (unaltered) pytz timezone choices
-ALL_TIMEZONES_CHOICES = tuple(zip(pytz.all_timezones, pytz.all_timezones))
-COMMON_TIMEZONES_CHOICES = tuple(
-    zip(pytz.common_timezones, pytz.common_timezones)
-)
+ALL_TIMEZONES_CHOICES = LazyChoices(_zip_choices, ALL_TIMEZONE_NAMES)
+COMMON_TIMEZONES_CHOICES = LazyChoices(_zip_choices, COMMON_TIMEZONE_NAMES)
 
 # Grouped by timezone offset, with "GMT-05:00" as the group name
-GROUPED_ALL_TIMEZONES_CHOICES = get_choices(
-    timezones=pytz.all_timezones,
+GROUPED_ALL_TIMEZONES_CHOICES = TimeZoneChoices(
+    timezones=ALL_TIMEZONE_NAMES,
     grouped=True
 )
-GROUPED_COMMON_TIMEZONES_CHOICES = get_choices(
-    timezones=pytz.common_timezones,
+GROUPED_COMMON_TIMEZONES_CHOICES = TimeZoneChoices(
+    timezones=COMMON_TIMEZONE_NAMES,
     grouped=True
 )
 
 # Sorted by timezone offset, with "(GMT-05:00) US/Eastern" as the display name
-PRETTY_ALL_TIMEZONES_CHOICES = get_choices(timezones=pytz.all_timezones)
-PRETTY_COMMON_TIMEZONES_CHOICES = get_choices(timezones=pytz.common_timezones)
+PRETTY_ALL_TIMEZONES_CHOICES = TimeZoneChoices(timezones=ALL_TIMEZONE_NAMES)
+PRETTY_COMMON_TIMEZONES_CHOICES = TimeZoneChoices(
+    timezones=COMMON_TIMEZONE_NAMES
+)
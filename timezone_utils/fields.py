@@ -3,6 +3,8 @@
 # =============================================================================
 # Python
 from __future__ import unicode_literals
+import asyncio
+from collections import OrderedDict
 from datetime import datetime, tzinfo, time as datetime_time
 import pytz
 import warnings
@@ -11,15 +13,25 @@ import warnings
 import django
 from django.core import checks
 from django.core.exceptions import ValidationError
-from django.db.models.fields import DateTimeField, CharField
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.fields import (CharField, DateTimeField, IntegerField,
+                                     PositiveSmallIntegerField)
 from django.utils.timezone import get_default_timezone, is_naive, make_aware
 from django.utils.translation import gettext_lazy as _
 
 # App
-from timezone_utils import forms
+from timezone_utils import forms, zone_ids, zones
+from timezone_utils.cache import timezone_cache
+from timezone_utils.lookups import OffsetBetween, UTCOffset
+from timezone_utils.offsets import utc_from_local
+from timezone_utils.providers import zone_name
 
 
-__all__ = ('TimeZoneField', 'LinkedTZDateTimeField')
+__all__ = ('TimeZoneField', 'TimeZoneIDField', 'LinkedTZDateTimeField')
+
+# Model instance attribute which holds the values converted by
+#   LinkedTZQuerySet.bulk_create, for the duration of the insert
+CONVERTED_VALUES_ATTNAME = '_timezone_utils_converted'
 
 
 # =============================================================================
@@ -28,7 +40,7 @@ __all__ = ('TimeZoneField', 'LinkedTZDateTimeField')
 class TimeZoneField(CharField):
     # Enforce the minimum length of max_length to be the length of the longest
     #   pytz timezone string
-    MIN_LENGTH = max(map(len, pytz.all_timezones))
+    MIN_LENGTH = zones.MAX_LENGTH
     default_error_messages = {
         'invalid': _("'%(value)s' is not a valid time zone."),
     }
@@ -80,7 +92,7 @@ class TimeZoneField(CharField):
         value = super(TimeZoneField, self).get_prep_value(value)
 
         if isinstance(value, tzinfo):
-            return value.zone
+            return zone_name(value)
 
         return value
 
@@ -105,6 +117,49 @@ class TimeZoneField(CharField):
                 return self.to_python(value)
             return value
 
+    def get_db_converters(self, connection):
+        """
+        Returns a single converter which maps the names loaded by a query
+        straight to tzinfo instances. Each distinct name is resolved once per
+        query (through the time zone cache), and then found in a local map
+        with no further checks, so NULL and empty values cost the same as
+        names.
+
+        Subclasses which override `from_db_value` or `to_python` use the
+        default converters, so that their conversion is not skipped.
+        """
+        # pylint: disable=newstyle
+        if (
+            type(self).from_db_value is not TimeZoneField.from_db_value or
+            type(self).to_python is not TimeZoneField.to_python
+        ):
+            return super(TimeZoneField, self).get_db_converters(connection)
+
+        get_timezone = timezone_cache.get
+        from_db_value = self.from_db_value
+        resolved = {}
+
+        def resolve(value, args):
+            if value:
+                try:
+                    tz = get_timezone(value)
+                except pytz.UnknownTimeZoneError:
+                    # Raises the ValidationError for the invalid name
+                    return from_db_value(value, *args)
+            else:
+                tz = from_db_value(value, *args)
+
+            resolved[value] = tz
+            return tz
+
+        def convert(value, *args):
+            try:
+                return resolved[value]
+            except KeyError:
+                return resolve(value, args)
+
+        return [convert]
+
     def to_python(self, value):
         """Returns a datetime.tzinfo instance for the value."""
         # pylint: disable=newstyle
@@ -114,7 +169,7 @@ class TimeZoneField(CharField):
             return value
 
         try:
-            return pytz.timezone(str(value))
+            return timezone_cache.get(value)
         except pytz.UnknownTimeZoneError:
             raise ValidationError(
                 message=self.error_messages['invalid'],
@@ -148,12 +203,9 @@ class TimeZoneField(CharField):
         timezone lengths.
         """
 
-        # Retrieve the maximum possible length for the time zone string
-        possible_max_length = max(map(len, pytz.all_timezones))
-
         # Make sure that the max_length attribute will handle the longest time
         #   zone string
-        if self.max_length < possible_max_length:   # pragma: no cover
+        if self.max_length < zones.MAX_LENGTH:   # pragma: no cover
             return [
                 checks.Error(
                     msg=(
@@ -165,8 +217,8 @@ class TimeZoneField(CharField):
                         "length of {value}, although it is recommended that "
                         "you leave room for longer time zone strings to be "
                         "added in the future.".format(
-                            version=pytz.VERSION,
-                            value=possible_max_length
+                            version=zones.PYTZ_VERSION,
+                            value=zones.MAX_LENGTH
                         )
                     ),
                     obj=self,
@@ -177,68 +229,150 @@ class TimeZoneField(CharField):
         return []
 
     def _check_choices_attribute(self):   # pragma: no cover
-        """Checks to make sure that choices contains valid timezone choices."""
+        """
+        Checks to make sure that choices contains valid timezone choices. Every
+        invalid value (including those in optgroups) is reported with its own
+        warning.
+        """
+
+        if not self.choices:
+            return []
 
-        if self.choices:
-            warning_params = {
-                'msg': (
+        return [
+            checks.Warning(
+                msg=(
                     "'choices' contains an invalid time zone value '{value}' "
                     "which was not found as a supported time zone by pytz "
-                    "{version}."
+                    "{version}.".format(
+                        value=value,
+                        version=zones.PYTZ_VERSION
+                    )
                 ),
-                'hint': "Values must be found in pytz.all_timezones.",
-                'obj': self,
-            }
-
-            for option_key, option_value in self.choices:
-                if isinstance(option_value, (list, tuple)):
-                    # This is an optgroup, so look inside the group for
-                    # options.
-                    for optgroup_key in map(lambda x: x[0], option_value):
-                        if optgroup_key not in pytz.all_timezones:
-                            # Make sure we don't raise this error on empty
-                            #   values
-                            if optgroup_key not in self.empty_values:
-                                # Update the error message by adding the value
-                                warning_params.update({
-                                    'msg': warning_params['msg'].format(
-                                        value=optgroup_key,
-                                        version=pytz.VERSION
-                                    )
-                                })
-
-                                # Return the warning
-                                return [
-                                    checks.Warning(**warning_params)
-                                ]
-
-                elif option_key not in pytz.all_timezones:
-                    # Make sure we don't raise this error on empty
-                    #   values
-                    if option_key not in self.empty_values:
-                        # Update the error message by adding the value
-                        warning_params.update({
-                            'msg': warning_params['msg'].format(
-                                value=option_key,
-                                version=pytz.VERSION
-                            )
-                        })
-
-                        # Return the warning
-                        return [
-                            checks.Warning(**warning_params)
-                        ]
+                hint="Values must be found in pytz.all_timezones.",
+                obj=self,
+            )
+            for value in zones.invalid_timezones(
+                names=(value for value, _display in self.flatchoices),
+                ignore=self.empty_values
+            )
+        ]
 
-        # When no error, return an empty list
-        return []
+
+class TimeZoneIDField(PositiveSmallIntegerField):
+    """
+    Stores a time zone as the small integer ID found in
+    `timezone_utils.zone_ids` instead of its name, which keeps rows and
+    indexes small. The model attribute is a tzinfo instance, and values may be
+    assigned and looked up by name or tzinfo instance.
+    """
+    default_error_messages = {
+        'invalid': _("'%(value)s' is not a valid time zone."),
+        'unregistered': _(
+            "'%(value)s' is not a registered time zone (registry version "
+            "%(version)s)."
+        ),
+    }
+
+    def validate(self, value, model_instance):
+        """
+        Validates value and throws ValidationError. Choices are compared by
+        time zone name.
+        """
+        # pylint: disable=newstyle
+        value = self.to_python(value)
+
+        super(TimeZoneIDField, self).validate(
+            value=str(value) if value else value,
+            model_instance=model_instance
+        )
+
+    def run_validators(self, value):
+        # pylint: disable=newstyle
+        super(TimeZoneIDField, self).run_validators(self.get_prep_value(value))
+
+    def get_prep_value(self, value):
+        """Converts time zone names and tzinfo instances to their IDs."""
+
+        tz = self.to_python(value)
+
+        if not tz:
+            return None
+
+        try:
+            return zone_ids.get_zone_id(str(tz))
+        except KeyError:
+            raise ValidationError(
+                message=self.error_messages['unregistered'],
+                code='unregistered',
+                params={'value': tz, 'version': zone_ids.REGISTRY_VERSION}
+            )
+
+    if django.VERSION < (2,):
+        def from_db_value(self, value, expression, connection, context):    # noqa
+            """Converts a time zone ID to a tzinfo instance."""
+            if value is None:
+                return value
+            return self.to_python(value)
+    else:
+        def from_db_value(self, value, expression, connection):
+            """Converts a time zone ID to a tzinfo instance."""
+            if value is None:
+                return value
+            return self.to_python(value)
+
+    def to_python(self, value):
+        """Returns a datetime.tzinfo instance for an ID, name or tzinfo."""
+
+        if value is None or value == '':
+            return None
+
+        try:
+            if isinstance(value, int):
+                return timezone_cache.get(zone_ids.get_zone_name(value))
+
+            return timezone_cache.get(str(value))
+        except (KeyError, pytz.UnknownTimeZoneError):
+            raise ValidationError(
+                message=self.error_messages['invalid'],
+                code='invalid',
+                params={'value': value}
+            )
+
+    # pylint: disable=E0239
+    def formfield(self, **kwargs):
+        """Returns a custom form field for the TimeZoneIDField."""
+
+        defaults = {'form_class': forms.TimeZoneField}
+        defaults.update(**kwargs)
+        # Skip IntegerField.formfield, which adds min_value/max_value
+        # pylint: disable=bad-super-call
+        return super(IntegerField, self).formfield(**defaults)
 
 
 class LinkedTZDateTimeField(DateTimeField):
+    # Number of localized (date, time_override, time zone) combinations kept
+    #   by each field
+    MAX_LOCALIZED_OVERRIDES = 1024
+
     # pylint: disable=newstyle
     def __init__(self, *args, **kwargs):
         self.populate_from = kwargs.pop('populate_from', None)
+        self.apopulate_from = kwargs.pop('apopulate_from', None)
         self.time_override = kwargs.pop('time_override', None)
-        self.timezone = get_default_timezone()
+
+        if self.apopulate_from is not None and self.populate_from is None:
+            raise ValueError(
+                'apopulate_from requires populate_from, which save() uses.'
+            )
+
+        # A constant time_override is resolved once, here. Callables (and
+        #   invalid values, which raise when saving) are resolved per save
+        if isinstance(self.time_override, datetime_time):
+            self._constant_time_override = self.time_override
+        else:
+            self._constant_time_override = None
+
+        self._localized_overrides = {}
 
         super(LinkedTZDateTimeField, self).__init__(*args, **kwargs)
 
@@ -264,14 +398,18 @@ class LinkedTZDateTimeField(DateTimeField):
             return value
 
     def to_python(self, value):
-        """Convert the value to the appropriate timezone."""
+        """
+        Convert the value to the default timezone. The field is shared by all
+        model instances (and threads), so the timezone of a particular model
+        instance is never stored on it.
+        """
         # pylint: disable=newstyle
         value = super(LinkedTZDateTimeField, self).to_python(value)
 
         if not value:
             return value
 
-        return value.astimezone(self.timezone)
+        return value.astimezone(get_default_timezone())
 
     def pre_save(self, model_instance, add):
         """
@@ -288,6 +426,11 @@ class LinkedTZDateTimeField(DateTimeField):
             add=add
         )
 
+        # Values already converted by a bulk_create are saved as they are
+        converted = model_instance.__dict__.get(CONVERTED_VALUES_ATTNAME)
+        if converted and converted.pop(self.attname, None) is value:
+            return value
+
         # Convert the value to the correct time/timezone
         value = self._convert_value(
             value=value,
@@ -299,6 +442,106 @@ class LinkedTZDateTimeField(DateTimeField):
 
         return value
 
+    def pre_save_bulk(self, model_instances, add):
+        """
+        Batch version of `pre_save` for many model instances.
+
+        The model instances are grouped by the time zone found in
+        `populate_from`, each time zone is resolved once and the values of a
+        group are converted together.
+        """
+        pending = self._get_pending_values(model_instances, add)
+
+        if self.populate_from is not None:
+            tz_values = [
+                self._get_populate_from_value(model_instance)
+                for model_instance, _value in pending
+            ]
+        else:
+            tz_values = None
+
+        self._convert_pending_values(pending, add, tz_values)
+
+    async def apre_save_bulk(self, model_instances, add):
+        """
+        Async version of `pre_save_bulk`, which does not block the event loop.
+
+        With `apopulate_from`, the time zones of all model instances are
+        awaited concurrently and the values are converted in the event loop
+        (the conversion itself does no I/O). Otherwise `populate_from`, which
+        may query the database, is called for the whole batch from a single
+        `sync_to_async` call.
+        """
+        if self.apopulate_from is None:
+            # asgiref ships with Django 3.0+
+            from asgiref.sync import sync_to_async
+
+            return await sync_to_async(self.pre_save_bulk)(
+                list(model_instances),
+                add
+            )
+
+        pending = self._get_pending_values(model_instances, add)
+        tz_values = await asyncio.gather(*(
+            self.apopulate_from(model_instance)
+            for model_instance, _value in pending
+        ))
+
+        self._convert_pending_values(pending, add, tz_values)
+
+    def _get_pending_values(self, model_instances, add):
+        """Returns (model instance, value) for the model instances which have
+        a value to convert.
+
+        """
+        # pylint: disable=newstyle
+        pending = []
+
+        for model_instance in model_instances:
+            value = super(
+                LinkedTZDateTimeField,
+                self
+            ).pre_save(
+                model_instance=model_instance,
+                add=add
+            )
+
+            if value:
+                pending.append((model_instance, value))
+
+        return pending
+
+    def _convert_pending_values(self, pending, add, tz_values):
+        """
+        Converts the pending (model instance, value) pairs, where `tz_values`
+        holds the unresolved time zone of each of them (or is None without
+        `populate_from`).
+        """
+        groups = OrderedDict()
+
+        for index, (model_instance, value) in enumerate(pending):
+            if tz_values is None:
+                tz_name = None
+            elif tz_values[index] is None:
+                raise self._get_missing_timezone_error()
+            else:
+                tz_name = str(tz_values[index])
+
+            group = groups.setdefault(tz_name, ([], []))
+            group[0].append(model_instance)
+            group[1].append(value)
+
+        for tz_name, (instances, values) in groups.items():
+            if tz_name is None:
+                tz = get_default_timezone()
+            else:
+                tz = self._resolve_timezone(tz_name)
+
+            values = self._convert_values(values=values, tz=tz, add=add)
+
+            for model_instance, value in zip(instances, values):
+                setattr(model_instance, self.attname, value)
+
     def deconstruct(self):  # pragma: no cover
         """Add our custom keyword arguments for migrations."""
         # pylint: disable=newstyle
@@ -314,6 +557,9 @@ class LinkedTZDateTimeField(DateTimeField):
             #   function that can be parsed
             kwargs['populate_from'] = self.populate_from
 
+        if self.apopulate_from is not None:
+            kwargs['apopulate_from'] = self.apopulate_from
+
         # Only include kwarg if it's not the default
         if self.time_override is not None:
             if hasattr(self.time_override, '__call__'):
@@ -324,33 +570,89 @@ class LinkedTZDateTimeField(DateTimeField):
 
         return name, path, args, kwargs
 
-    def _get_populate_from(self, model_instance):
+    def get_populate_from_path(self):
         """
-        Retrieves the timezone or None from the `populate_from` attribute.
+        Returns the parts of a `populate_from` field name, which may follow
+        relations with double underscores (e.g. `('location', 'timezone')`
+        for `'location__timezone'`), or None if it is a callable.
+        """
+
+        if self.populate_from is None or callable(self.populate_from):
+            return None
+
+        return tuple(self.populate_from.split(LOOKUP_SEP))
+
+    def _get_populate_from_value(self, model_instance):
+        """
+        Retrieves the unresolved time zone value from the `populate_from`
+        attribute. Relations are followed through the model instances'
+        attributes, so related objects which were already loaded (e.g. with
+        `select_related` or `prefetch_populate_from`) are not queried again.
         """
 
         if hasattr(self.populate_from, '__call__'):
-            tz = self.populate_from(model_instance)
+            return self.populate_from(model_instance)
+
+        from_attr = model_instance
+        for name in self.get_populate_from_path():
+            if from_attr is None:
+                # A null relation on the way has no time zone, which
+                #   _resolve_timezone reports
+                return None
+            from_attr = getattr(from_attr, name)
+
+        return callable(from_attr) and from_attr() or from_attr
+
+    def _get_missing_timezone_error(self):
+        """Returns the error for a `populate_from` without a time zone."""
+
+        if callable(self.populate_from):
+            populate_from = getattr(
+                self.populate_from,
+                '__name__',
+                repr(self.populate_from)
+            )
         else:
-            from_attr = getattr(model_instance, self.populate_from)
-            tz = callable(from_attr) and from_attr() or from_attr
+            populate_from = self.populate_from
+
+        return ValueError(
+            '{0}.{1} has no time zone to convert to: its populate_from ({2}) '
+            'is None, for instance because of a null relation.'.format(
+                self.model._meta.label,
+                self.name,
+                populate_from
+            )
+        )
+
+    def _resolve_timezone(self, tz):
+        """Retrieves the tzinfo instance for a time zone name."""
+
+        if tz is None:
+            raise self._get_missing_timezone_error()
 
         try:
-            tz = pytz.timezone(str(tz))
+            return timezone_cache.get(str(tz))
         except pytz.UnknownTimeZoneError:
             # It was a valiant effort. Resistance is futile.
             raise
 
-        # If we have a timezone, set the instance's timezone attribute
-        self.timezone = tz
+    def _get_populate_from(self, model_instance):
+        """
+        Retrieves the timezone or None from the `populate_from` attribute.
+        """
 
-        return tz
+        return self._resolve_timezone(
+            self._get_populate_from_value(model_instance)
+        )
 
     def _get_time_override(self):
         """
         Retrieves the datetime.time or None from the `time_override` attribute.
         """
 
+        if self._constant_time_override is not None:
+            return self._constant_time_override
+
         if callable(self.time_override):
             time_override = self.time_override()
         else:
@@ -379,13 +681,13 @@ class LinkedTZDateTimeField(DateTimeField):
         if self.populate_from is not None:
             tz = self._get_populate_from(model_instance)
 
-        if is_naive(value):
-            value = make_aware(value=value, timezone=tz)
+        return self._convert_values(values=[value], tz=tz, add=add)[0]
 
-        # Convert the value to a datetime object in the correct timezone. This
-        #   insures that we will have the correct date if we are performing a
-        #   time override below.
-        value = value.astimezone(tz)
+    def _convert_values(self, values, tz, add):
+        """
+        Converts values which all belong to the same timezone to the
+        appropriate time as declared by the `time_override` attribute.
+        """
 
         # Do not convert the time to the time override if auto_now or
         #   auto_now_add is set
@@ -394,14 +696,69 @@ class LinkedTZDateTimeField(DateTimeField):
         ):
             # Retrieve the time override
             time_override = self._get_time_override()
+        else:
+            time_override = None
+
+        converted = []
 
-            # Convert the value to the date/time with the appropriate timezone
-            value = make_aware(
-                value=datetime.combine(
+        for value in values:
+            if time_override is not None:
+                # Only the date is kept, so the value is localized once, with
+                #   the overridden time. A naive value already is the local
+                #   date and time.
+                if not is_naive(value):
+                    value = value.astimezone(tz)
+
+                converted.append(self._localize_time_override(
                     date=value.date(),
-                    time=time_override
-                ),
-                timezone=tz
-            )
+                    time_override=time_override,
+                    tz=tz
+                ))
+                continue
+
+            if is_naive(value):
+                value = make_aware(value=value, timezone=tz)
+
+            # Convert the value to a datetime object in the correct timezone
+            converted.append(value.astimezone(tz))
+
+        return converted
+
+    def _localize_time_override(self, date, time_override, tz):
+        """
+        Returns the aware datetime of `date` at `time_override` in `tz`.
+        Datetimes are immutable, so each combination is only localized once
+        and then shared.
+
+        A time skipped by a transition is moved forward by its length, and a
+        repeated time is the first of them (datetime's fold=0), whichever the
+        time zone provider, as timezone_utils.scheduling assumes.
+        """
+        key = (date, time_override, tz)
+
+        try:
+            return self._localized_overrides[key]
+        except KeyError:
+            pass
 
+        value = datetime.combine(date=date, time=time_override)
+
+        try:
+            value = make_aware(value=value, timezone=tz)
+        except (pytz.NonExistentTimeError, pytz.AmbiguousTimeError):
+            # pytz raises where zoneinfo applies fold=0
+            value = utc_from_local(zone_name(tz), value).astimezone(tz)
+
+        if len(self._localized_overrides) >= self.MAX_LOCALIZED_OVERRIDES:
+            self._localized_overrides.clear()
+
+        self._localized_overrides[key] = value
         return value
+
+
+# =============================================================================
+# LOOKUPS
+# =============================================================================
+for field_class in (TimeZoneField, TimeZoneIDField):
+    field_class.register_lookup(UTCOffset)
+    field_class.register_lookup(OffsetBetween)
@@ -14,6 +14,9 @@ except ImportError:
     from django.utils.encoding import force_text
 from django.utils.translation import gettext_lazy as _
 
+# App
+from timezone_utils.cache import timezone_cache
+
 __all__ = ('TimeZoneField', )
 
 
@@ -35,7 +38,7 @@ class TimeZoneField(CharField):
             return value
 
         try:
-            return pytz.timezone(str(value))
+            return timezone_cache.get(value)
         except pytz.UnknownTimeZoneError:
             raise ValidationError(
                 message=self.error_messages['invalid'],
@@ -0,0 +1,263 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+import pytz
+
+# Django
+from django.core.exceptions import FieldDoesNotExist
+from django.db import NotSupportedError
+from django.db.backends.signals import connection_created
+from django.db.models import (DateField, DateTimeField, F, Func, TimeField,
+                              Value)
+from django.db.models.constants import LOOKUP_SEP
+from django.utils.dateparse import parse_datetime
+from django.utils.timezone import is_aware
+
+# App
+from timezone_utils.cache import timezone_cache
+from timezone_utils.fields import LinkedTZDateTimeField
+
+__all__ = ('LocalizedTo', 'LocalDate', 'LocalTime',
+           'register_sqlite_functions')
+
+
+# ==============================================================================
+# SQLITE FUNCTIONS
+# ==============================================================================
+def _sqlite_localize(value, tz_name):
+    """
+    Converts a datetime string, as stored by Django's SQLite backend (naive
+    UTC), to an aware datetime in the time zone `tz_name`.
+    """
+    if value is None or tz_name is None:
+        return None
+
+    value = parse_datetime(value)
+
+    if value is None:
+        return None
+
+    try:
+        tz = timezone_cache.get(tz_name)
+    except pytz.UnknownTimeZoneError:
+        return None
+
+    if not is_aware(value):
+        value = pytz.utc.localize(value)
+
+    return value.astimezone(tz)
+
+
+def _sqlite_localized_to(value, tz_name):
+    value = _sqlite_localize(value, tz_name)
+    return value and value.replace(tzinfo=None).isoformat(' ')
+
+
+def _sqlite_local_date(value, tz_name):
+    value = _sqlite_localize(value, tz_name)
+    return value and value.date().isoformat()
+
+
+def _sqlite_local_time(value, tz_name):
+    value = _sqlite_localize(value, tz_name)
+    return value and value.time().isoformat()
+
+
+SQLITE_FUNCTIONS = (
+    ('timezone_utils_localized_to', _sqlite_localized_to),
+    ('timezone_utils_local_date', _sqlite_local_date),
+    ('timezone_utils_local_time', _sqlite_local_time),
+)
+
+
+# Connection wrapper attribute which holds the database connection the
+#   functions were last registered on
+SQLITE_FUNCTIONS_ATTNAME = '_timezone_utils_functions'
+
+
+def _has_sqlite_functions(connection):
+    return connection.connection is not None and getattr(
+        connection,
+        SQLITE_FUNCTIONS_ATTNAME,
+        None
+    ) is connection.connection
+
+
+def register_sqlite_functions(connection, **kwargs):
+    """
+    Registers the conversion functions on an SQLite connection. They are
+    deterministic, so they may also be used in expression indexes. Each
+    database connection is only set up once.
+    """
+    if connection.vendor != 'sqlite' or _has_sqlite_functions(connection):
+        return
+
+    connection.ensure_connection()
+
+    # ensure_connection() sends connection_created for a new connection,
+    #   which registers the functions
+    if _has_sqlite_functions(connection):
+        return
+
+    for name, function in SQLITE_FUNCTIONS:
+        try:
+            connection.connection.create_function(
+                name,
+                2,
+                function,
+                deterministic=True
+            )
+        except TypeError:   # pragma: no cover
+            # Python < 3.8 does not support deterministic functions
+            connection.connection.create_function(name, 2, function)
+
+    setattr(connection, SQLITE_FUNCTIONS_ATTNAME, connection.connection)
+
+
+connection_created.connect(register_sqlite_functions)
+
+
+# ==============================================================================
+# OUTPUT FIELDS
+# ==============================================================================
+class LocalDateTimeField(DateTimeField):
+    """
+    Output field for naive datetimes in a local time zone. Unlike
+    DateTimeField, naive values are neither made aware in nor converted from
+    the default time zone.
+    """
+
+    def get_prep_value(self, value):
+        # pylint: disable=newstyle
+        return super(DateTimeField, self).get_prep_value(value)
+
+    def from_db_value(self, value, expression, connection):
+        # Some backends label the value with the connection's time zone
+        if value is not None and is_aware(value):
+            return value.replace(tzinfo=None)
+        return value
+
+
+# ==============================================================================
+# EXPRESSIONS
+# ==============================================================================
+class LocalizedTo(Func):
+    """
+    Converts a datetime expression to the local (naive) date and time in a
+    time zone. The time zone is either a field or expression holding time
+    zone names (`tz_field`), or a constant `tzinfo`.
+
+    When neither is given, the expression must name a LinkedTZDateTimeField
+    (possibly through relations) whose `populate_from` is a field name or
+    path, which is then used as `tz_field`.
+
+    Compiles to `AT TIME ZONE` on PostgreSQL and to a registered function on
+    SQLite. Other backends are not supported.
+    """
+    arg_joiner = ' AT TIME ZONE '
+    template = '(%(expressions)s)'
+    sqlite_function = 'timezone_utils_localized_to'
+    output_field = LocalDateTimeField()
+
+    def __init__(self, expression, tz_field=None, tzinfo=None, **extra):
+        if tz_field is not None and tzinfo is not None:
+            raise ValueError('Only one of tz_field and tzinfo may be given.')
+
+        expressions = [expression]
+
+        if tz_field is not None:
+            expressions.append(
+                F(tz_field) if isinstance(tz_field, str) else tz_field
+            )
+        elif tzinfo is not None:
+            expressions.append(Value(str(tzinfo)))
+
+        # pylint: disable=newstyle
+        super(LocalizedTo, self).__init__(*expressions, **extra)
+
+    def resolve_expression(self, query=None, *args, **kwargs):
+        # pylint: disable=newstyle
+        clone = self
+
+        if len(self.source_expressions) == 1:
+            clone = self.copy()
+            clone.set_source_expressions([
+                self.source_expressions[0],
+                F(self._get_populate_from(query))
+            ])
+
+        return super(LocalizedTo, clone).resolve_expression(
+            query,
+            *args,
+            **kwargs
+        )
+
+    def _get_populate_from(self, query):
+        """Retrieves the `populate_from` path of the expression's
+        LinkedTZDateTimeField, from the query's model.
+
+        """
+        expression = self.source_expressions[0]
+        field = None
+
+        if isinstance(expression, F) and query is not None:
+            path = expression.name.split(LOOKUP_SEP)
+            model = query.model
+
+            try:
+                for name in path[:-1]:
+                    model = model._meta.get_field(name).related_model
+                field = model._meta.get_field(path[-1])
+            except (AttributeError, FieldDoesNotExist):
+                field = None
+
+        if not isinstance(field, LinkedTZDateTimeField) or not isinstance(
+            field.populate_from,
+            str
+        ):
+            raise ValueError(
+                '{0} requires tz_field or tzinfo unless the expression is a '
+                'LinkedTZDateTimeField with a field name as '
+                'populate_from.'.format(self.__class__.__name__)
+            )
+
+        return LOOKUP_SEP.join(path[:-1] + [field.populate_from])
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        if not _has_sqlite_functions(connection):
+            register_sqlite_functions(connection)
+
+        return self.as_sql(
+            compiler,
+            connection,
+            function=self.sqlite_function,
+            template='%(function)s(%(expressions)s)',
+            arg_joiner=', ',
+            **extra_context
+        )
+
+    def as_unsupported(self, compiler, connection, **extra_context):
+        raise NotSupportedError(
+            '{0} is not supported on {1}.'.format(
+                self.__class__.__name__,
+                connection.display_name
+            )
+        )
+
+    as_mysql = as_unsupported
+    as_oracle = as_unsupported
+
+
+class LocalDate(LocalizedTo):
+    """The local date of a datetime expression in a time zone."""
+    template = '(%(expressions)s)::date'
+    sqlite_function = 'timezone_utils_local_date'
+    output_field = DateField()
+
+
+class LocalTime(LocalizedTo):
+    """The local time of a datetime expression in a time zone."""
+    template = '(%(expressions)s)::time'
+    sqlite_function = 'timezone_utils_local_time'
+    output_field = TimeField()
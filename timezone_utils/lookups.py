@@ -0,0 +1,123 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from datetime import datetime, timedelta
+from numbers import Number
+
+# Django
+from django.core.exceptions import ValidationError
+from django.db.models.lookups import In
+
+# App
+from timezone_utils.offsets import zones_with_offset
+
+__all__ = ('UTCOffset', 'OffsetBetween')
+
+
+# ==============================================================================
+# LOOKUPS
+# ==============================================================================
+def _to_offset(value):
+    """Converts an offset in minutes (or a timedelta) to a timedelta."""
+
+    if isinstance(value, timedelta):
+        return value
+
+    if isinstance(value, Number) and not isinstance(value, bool):
+        return timedelta(minutes=value)
+
+    raise ValueError(
+        'UTC offsets must be numbers of minutes or timedeltas, not '
+        '{0!r}.'.format(value)
+    )
+
+
+class OffsetLookupMixin(object):
+    """
+    Looks up the time zones whose UTC offset at an instant (by default, when
+    the lookup is built) is in a range. The matching names are found in Python
+    with the offset index, and the lookup compiles to an IN clause on the
+    column, which can use its index.
+    """
+    # The values are converted by get_prep_lookup()
+    prepare_rhs = False
+
+    def get_offset_range(self, value):
+        """Returns (low, high, instant) from the lookup's value."""
+        raise NotImplementedError
+
+    def get_prep_lookup(self):
+        if hasattr(self.rhs, 'resolve_expression'):
+            raise ValueError(
+                'The {0} lookup does not support expressions.'.format(
+                    self.lookup_name
+                )
+            )
+
+        low, high, instant = self.get_offset_range(self.rhs)
+        output_field = self.lhs.output_field
+        values = []
+
+        for name in zones_with_offset(low, high, instant=instant):
+            try:
+                values.append(output_field.get_prep_value(name))
+            except ValidationError:
+                # Time zones which the field cannot store, such as those
+                #   missing from an older TimeZoneIDField registry
+                continue
+
+        self.rhs = values
+
+        # pylint: disable=newstyle
+        return super(OffsetLookupMixin, self).get_prep_lookup()
+
+
+class UTCOffset(OffsetLookupMixin, In):
+    """
+    `timezone__utcoffset=-300` finds the time zones currently at UTC-05:00.
+    The value is a number of minutes or a timedelta, or an (offset, instant)
+    pair.
+    """
+    lookup_name = 'utcoffset'
+
+    def get_offset_range(self, value):
+        instant = None
+
+        if isinstance(value, (list, tuple)):
+            if len(value) != 2 or not isinstance(value[1], datetime):
+                raise ValueError(
+                    'The utcoffset lookup takes an offset or an (offset, '
+                    'instant) pair.'
+                )
+            value, instant = value
+
+        offset = _to_offset(value)
+        return offset, offset, instant
+
+
+class OffsetBetween(OffsetLookupMixin, In):
+    """
+    `timezone__offset_between=(-480, -300)` finds the time zones currently
+    between UTC-08:00 and UTC-05:00 (inclusive). The value is a (low, high) or
+    (low, high, instant) tuple.
+    """
+    lookup_name = 'offset_between'
+
+    def get_offset_range(self, value):
+        if not isinstance(value, (list, tuple)) or len(value) not in (2, 3):
+            raise ValueError(
+                'The offset_between lookup takes a (low, high) or (low, '
+                'high, instant) tuple.'
+            )
+
+        if len(value) == 3 and not isinstance(value[2], datetime):
+            raise ValueError(
+                'The instant of the offset_between lookup must be a datetime.'
+            )
+
+        return (
+            _to_offset(value[0]),
+            _to_offset(value[1]),
+            value[2] if len(value) == 3 else None,
+        )
@@ -0,0 +1,71 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+import json
+
+# Django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# App
+from timezone_utils.choices import build_choices_snapshot
+
+
+# ==============================================================================
+# COMMANDS
+# ==============================================================================
+class Command(BaseCommand):
+    help = (
+        'Writes a snapshot of the UTC offsets of every time zone, which '
+        'the time zone choices use instead of reading the tzfiles while it '
+        'is valid.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'output',
+            nargs='?',
+            help=(
+                'The file to write, or "-" for the standard output. Defaults '
+                'to the TIMEZONE_UTILS_CHOICES_SNAPSHOT setting.'
+            )
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=365,
+            help='The number of days the snapshot is valid for.'
+        )
+
+    def handle(self, *args, **options):
+        output = options['output'] or getattr(
+            settings,
+            'TIMEZONE_UTILS_CHOICES_SNAPSHOT',
+            None
+        )
+
+        if not output:
+            raise CommandError(
+                'Pass the file to write, or set '
+                'TIMEZONE_UTILS_CHOICES_SNAPSHOT.'
+            )
+
+        if options['days'] < 1:
+            raise CommandError('--days must be at least 1.')
+
+        snapshot = build_choices_snapshot(days=options['days'])
+        data = json.dumps(
+            snapshot.to_dict(),
+            sort_keys=True,
+            separators=(',', ':')
+        )
+
+        if output == '-':
+            self.stdout.write(data)
+            return
+
+        with open(output, 'w') as snapshot_file:
+            snapshot_file.write(data)
+
+        self.stdout.write('Wrote {0!r} to {1}.'.format(snapshot, output))
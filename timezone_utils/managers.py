@@ -0,0 +1,334 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from contextlib import contextmanager
+
+# Django
+from django.db import models
+from django.db.models import F, Prefetch, prefetch_related_objects
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.query import ModelIterable
+
+# App
+from timezone_utils.fields import (CONVERTED_VALUES_ATTNAME,
+                                   LinkedTZDateTimeField)
+from timezone_utils.scheduling import due_filter
+
+__all__ = ('prefetch_populate_from', 'bulk_pre_save', 'abulk_pre_save',
+           'LocalizedModelIterable', 'LinkedTZQuerySet', 'LinkedTZManager')
+
+
+# ==============================================================================
+# HELPERS
+# ==============================================================================
+def _get_linked_fields(model_instances, field_names):
+    """Yields the (selected) LinkedTZDateTimeFields of the model."""
+
+    for field in model_instances[0]._meta.concrete_fields:
+        if not isinstance(field, LinkedTZDateTimeField):
+            continue
+
+        if field_names is not None and field.name not in field_names:
+            continue
+
+        yield field
+
+
+@contextmanager
+def _converted_values(model_instances):
+    """
+    Marks the LinkedTZDateTimeField values of the model instances as converted
+    within the block, so the `pre_save` calls of a `bulk_create` save them as
+    they are. The marks are removed when the block exits, and later saves
+    convert the values again.
+    """
+    if model_instances:
+        fields = list(_get_linked_fields(model_instances, None))
+
+    for model_instance in model_instances:
+        model_instance.__dict__[CONVERTED_VALUES_ATTNAME] = {
+            field.attname: getattr(model_instance, field.attname)
+            for field in fields
+        }
+
+    try:
+        yield
+    finally:
+        for model_instance in model_instances:
+            model_instance.__dict__.pop(CONVERTED_VALUES_ATTNAME, None)
+
+
+def prefetch_populate_from(model_instances, field_names=None):
+    """
+    Loads the related objects which the LinkedTZDateTimeFields' `populate_from`
+    paths (e.g. `'location__timezone'`) go through, for many model instances
+    (of the same model) at once.
+
+    Each relation which starts a path is loaded with a single query, which
+    also selects the rest of the path. Model instances whose related objects
+    are already loaded are skipped.
+    """
+    model_instances = list(model_instances)
+
+    if not model_instances:
+        return model_instances
+
+    opts = model_instances[0]._meta
+
+    # First relation -> the relations to select along with it
+    select_related = {}
+
+    for field in _get_linked_fields(model_instances, field_names):
+        path = field.get_populate_from_path()
+
+        if path is None or len(path) < 2:
+            continue
+
+        related = select_related.setdefault(path[0], set())
+        if len(path) > 2:
+            related.add(LOOKUP_SEP.join(path[1:-1]))
+
+    lookups = []
+
+    for name, related in sorted(select_related.items()):
+        queryset = opts.get_field(name).related_model._base_manager.all()
+        if related:
+            queryset = queryset.select_related(*sorted(related))
+        lookups.append(Prefetch(name, queryset=queryset))
+
+    if lookups:
+        prefetch_related_objects(model_instances, *lookups)
+
+    return model_instances
+
+
+def bulk_pre_save(model_instances, add=True, field_names=None):
+    """
+    Converts the LinkedTZDateTimeField values of many model instances (of the
+    same model) at once. The related objects of `populate_from` paths are
+    prefetched and each time zone is only resolved once.
+
+    `field_names` limits the conversion to the named fields.
+    """
+    model_instances = prefetch_populate_from(model_instances, field_names)
+
+    if not model_instances:
+        return model_instances
+
+    for field in _get_linked_fields(model_instances, field_names):
+        field.pre_save_bulk(model_instances=model_instances, add=add)
+
+    return model_instances
+
+
+async def abulk_pre_save(model_instances, add=True, field_names=None):
+    """
+    Async version of `bulk_pre_save`, for ASGI views and async code. Uses
+    `LinkedTZDateTimeField.apre_save_bulk`, so it does not block the event
+    loop.
+    """
+    # asgiref ships with Django 3.0+
+    from asgiref.sync import sync_to_async
+
+    model_instances = await sync_to_async(prefetch_populate_from)(
+        model_instances,
+        field_names
+    )
+
+    if not model_instances:
+        return model_instances
+
+    for field in _get_linked_fields(model_instances, field_names):
+        await field.apre_save_bulk(model_instances=model_instances, add=add)
+
+    return model_instances
+
+
+# ==============================================================================
+# QUERYSETS
+# ==============================================================================
+# Annotation which holds the linked time zone of a field in
+#   LinkedTZQuerySet.localized()
+LOCALIZED_ANNOTATION = 'timezone_utils_{0}_tz'
+
+
+class LocalizedModelIterable(ModelIterable):
+    """
+    Yields model instances whose LinkedTZDateTimeField values are converted to
+    the time zones loaded alongside them by LinkedTZQuerySet.localized(). Each
+    distinct time zone is only resolved once per query.
+    """
+
+    def __iter__(self):
+        # pylint: disable=newstyle
+        localized_fields = self.queryset._localized_fields
+        timezones = {}
+
+        for obj in super(LocalizedModelIterable, self).__iter__():
+            for field, annotation in localized_fields:
+                tz_value = obj.__dict__.pop(annotation, None)
+                value = obj.__dict__.get(field.attname)
+
+                if not value or not tz_value:
+                    continue
+
+                try:
+                    tz = timezones[tz_value]
+                except KeyError:
+                    tz = timezones[tz_value] = field._resolve_timezone(
+                        tz_value
+                    )
+
+                obj.__dict__[field.attname] = value.astimezone(tz)
+
+            yield obj
+
+
+class LinkedTZQuerySet(models.QuerySet):
+    """
+    QuerySet which applies the LinkedTZDateTimeField conversions to
+    `bulk_create` and `bulk_update` (and their async versions) in batch, and
+    can load values in their linked time zones with `localized()`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # pylint: disable=newstyle
+        super(LinkedTZQuerySet, self).__init__(*args, **kwargs)
+        self._localized_fields = ()
+
+    def _clone(self):
+        # pylint: disable=newstyle
+        clone = super(LinkedTZQuerySet, self)._clone()
+        clone._localized_fields = self._localized_fields
+        return clone
+
+    def localized(self, *field_names):
+        """
+        Loads the values of the LinkedTZDateTimeFields (all of them, or those
+        named) in the time zones found in their `populate_from`, which are
+        selected in the same query. `populate_from` must be a field name or a
+        path through relations.
+        """
+        localized_fields = list(self._localized_fields)
+        annotations = {}
+
+        for field in self.model._meta.concrete_fields:
+            if not isinstance(field, LinkedTZDateTimeField):
+                continue
+
+            if field_names and field.name not in field_names:
+                continue
+
+            if field.get_populate_from_path() is None:
+                raise ValueError(
+                    'localized() requires the populate_from of {0} to be a '
+                    'field name or path.'.format(field.name)
+                )
+
+            annotation = LOCALIZED_ANNOTATION.format(field.attname)
+            if (field, annotation) not in localized_fields:
+                annotations[annotation] = F(field.populate_from)
+                localized_fields.append((field, annotation))
+
+        clone = self.annotate(**annotations) if annotations else self._chain()
+        clone._localized_fields = tuple(localized_fields)
+        clone._iterable_class = LocalizedModelIterable
+        return clone
+
+    def due(self, time, start, end, timezone=None, zones=None):
+        """
+        Filters the rows whose local `time` occurs from `start` (inclusive) to
+        `end` (exclusive) in the time zone of their `timezone` field (a name or
+        path), as timezone_utils.scheduling.due_filter() does. `time` is a
+        datetime.time, the name of a TimeField or the name of a
+        LinkedTZDateTimeField with a time_override, whose `populate_from` is
+        then the default `timezone`. Only the time_override of such a field is
+        compared; the dates stored in it are ignored. `zones` limits the time
+        zones looked up (by default, all of them).
+        """
+        if isinstance(time, str) and LOOKUP_SEP not in time:
+            field = self.model._meta.get_field(time)
+
+            if isinstance(field, LinkedTZDateTimeField):
+                if field.time_override is None:
+                    raise ValueError(
+                        'due() requires {0} to have a time_override.'.format(
+                            field.name
+                        )
+                    )
+
+                if timezone is None:
+                    if field.get_populate_from_path() is None:
+                        raise ValueError(
+                            'due() requires the populate_from of {0} to be a '
+                            'field name or path.'.format(field.name)
+                        )
+
+                    timezone = field.populate_from
+
+                time = field._get_time_override()
+
+        if timezone is None:
+            raise ValueError('due() requires the timezone field.')
+
+        if zones is None:
+            return self.filter(due_filter(timezone, time, start, end))
+
+        return self.filter(due_filter(timezone, time, start, end, zones))
+
+    def bulk_create(self, objs, *args, **kwargs):
+        # pylint: disable=newstyle
+        objs = bulk_pre_save(model_instances=objs, add=True)
+
+        with _converted_values(objs):
+            return super(LinkedTZQuerySet, self).bulk_create(
+                objs,
+                *args,
+                **kwargs
+            )
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        # pylint: disable=newstyle
+        objs = bulk_pre_save(
+            model_instances=objs,
+            add=False,
+            field_names=fields
+        )
+        return super(LinkedTZQuerySet, self).bulk_update(
+            objs,
+            fields,
+            *args,
+            **kwargs
+        )
+
+    async def abulk_create(self, objs, *args, **kwargs):
+        from asgiref.sync import sync_to_async
+
+        # pylint: disable=newstyle
+        objs = await abulk_pre_save(model_instances=objs, add=True)
+
+        # The values are converted, so skip this class' bulk_create
+        with _converted_values(objs):
+            return await sync_to_async(
+                super(LinkedTZQuerySet, self).bulk_create
+            )(objs, *args, **kwargs)
+
+    async def abulk_update(self, objs, fields, *args, **kwargs):
+        from asgiref.sync import sync_to_async
+
+        # pylint: disable=newstyle
+        objs = await abulk_pre_save(
+            model_instances=objs,
+            add=False,
+            field_names=fields
+        )
+        return await sync_to_async(
+            super(LinkedTZQuerySet, self).bulk_update
+        )(objs, fields, *args, **kwargs)
+
+
+# ==============================================================================
+# MANAGERS
+# ==============================================================================
+LinkedTZManager = models.Manager.from_queryset(LinkedTZQuerySet)
@@ -0,0 +1,316 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from bisect import bisect_right
+from collections import namedtuple
+from datetime import datetime, timedelta
+import threading
+
+import pytz
+
+# App
+from timezone_utils.zones import ALL_TIMEZONE_NAMES
+
+__all__ = ('ZoneOffsets', 'get_zone_offsets', 'utcoffset_at', 'offsets_at',
+           'next_transition', 'zones_with_offset', 'utc_from_local',
+           'offset_cache_clear')
+
+
+# ==============================================================================
+# OFFSET INDEX
+# ==============================================================================
+EPOCH = datetime(1970, 1, 1)
+SECOND = timedelta(seconds=1)
+
+# Sorted transition instants (UTC seconds since the epoch) of a time zone and
+#   the UTC offset (in seconds) which applies from each of them
+ZoneOffsets = namedtuple('ZoneOffsets', 'zone transitions offsets')
+
+_zone_offsets = {}
+_lock = threading.Lock()
+
+# Time zones grouped by offset: tuple of names -> OffsetGroups of the period
+#   (between two transitions of any of them) which was last looked up
+OffsetGroups = namedtuple('OffsetGroups', 'valid_from valid_until groups')
+
+_offset_groups = {}
+
+# Zone name -> the local (wall clock) times, in seconds since the epoch, from
+#   which each offset of its ZoneOffsets applies to local times. Local times
+#   skipped by a transition keep the earlier offset, and repeated local times
+#   take the first one, as datetime's fold=0 does
+_wall_transitions = {}
+
+# Zone name -> its ZoneOffsets as numpy arrays, filled by
+#   timezone_utils.vectorized and cleared along with the index
+_zone_arrays = {}
+
+
+def _utcnow():
+    """Returns the current (aware) UTC datetime."""
+    return datetime.now(pytz.utc)
+
+
+def _to_timestamp(instant):
+    """Converts an aware or naive (UTC) datetime to UTC seconds since the
+    epoch.
+
+    """
+    if instant.tzinfo is not None:
+        instant = instant.astimezone(pytz.utc).replace(tzinfo=None)
+
+    return (instant - EPOCH) // SECOND
+
+
+def _build_zone_offsets(tz):
+    """Builds the ZoneOffsets of a pytz time zone from its transition
+    tables.
+
+    """
+    transition_times = getattr(tz, '_utc_transition_times', None)
+
+    if not transition_times:
+        return ZoneOffsets(
+            zone=str(tz),
+            transitions=[_to_timestamp(datetime.min)],
+            offsets=[int(tz.utcoffset(datetime.min).total_seconds())]
+        )
+
+    transitions = []
+    offsets = []
+
+    # The first transition is datetime.min, which starts the earliest offset
+    for transition, info in zip(transition_times, tz._transition_info):
+        offset = int(info[0].total_seconds())
+
+        # Skip transitions which only change the DST flag or abbreviation
+        if offsets and offsets[-1] == offset:
+            continue
+
+        transitions.append(_to_timestamp(transition))
+        offsets.append(offset)
+
+    return ZoneOffsets(zone=str(tz), transitions=transitions, offsets=offsets)
+
+
+def get_zone_offsets(zone):
+    """
+    Retrieves the ZoneOffsets of a time zone name or tzinfo instance. The
+    index of a time zone is built once per process, from pytz's transition
+    tables whichever time zone provider is configured.
+    """
+    name = str(zone)
+
+    try:
+        return _zone_offsets[name]
+    except KeyError:
+        pass
+
+    tz = pytz.timezone(name)
+
+    with _lock:
+        if name not in _zone_offsets:
+            _zone_offsets[name] = _build_zone_offsets(tz)
+
+    return _zone_offsets[name]
+
+
+def _get_offset_seconds(zone_offsets, timestamp):
+    index = bisect_right(zone_offsets.transitions, timestamp) - 1
+    return zone_offsets.offsets[max(index, 0)]
+
+
+def utcoffset_at(zone, instant=None):
+    """
+    Retrieves the UTC offset (a timedelta) of a time zone at an aware or naive
+    (UTC) datetime, which defaults to now.
+    """
+    if instant is None:
+        instant = _utcnow()
+
+    return timedelta(seconds=_get_offset_seconds(
+        get_zone_offsets(zone),
+        _to_timestamp(instant)
+    ))
+
+
+def offsets_at(zones, instant=None):
+    """
+    Retrieves the UTC offsets (timedeltas) of many time zones at the same
+    aware or naive (UTC) datetime, which defaults to now.
+    """
+    if instant is None:
+        instant = _utcnow()
+
+    timestamp = _to_timestamp(instant)
+
+    return [
+        timedelta(seconds=_get_offset_seconds(
+            get_zone_offsets(zone),
+            timestamp
+        ))
+        for zone in zones
+    ]
+
+
+def next_transition(zone, instant=None):
+    """
+    Retrieves the next instant (an aware UTC datetime) after `instant` at which
+    the time zone changes its offset, or None if it never does.
+    """
+    if instant is None:
+        instant = _utcnow()
+
+    zone_offsets = get_zone_offsets(zone)
+    index = bisect_right(zone_offsets.transitions, _to_timestamp(instant))
+
+    if index < len(zone_offsets.transitions):
+        return pytz.utc.localize(
+            EPOCH + timedelta(seconds=zone_offsets.transitions[index])
+        )
+
+    return None
+
+
+def _build_offset_groups(zones, timestamp):
+    """Groups the time zones by their offset (in seconds) at `timestamp`."""
+
+    groups = {}
+    valid_from = None
+    valid_until = None
+
+    for zone in zones:
+        zone_offsets = get_zone_offsets(zone)
+        index = bisect_right(zone_offsets.transitions, timestamp)
+
+        groups.setdefault(
+            zone_offsets.offsets[max(index - 1, 0)],
+            []
+        ).append(zone)
+
+        # The groups hold until the next transition of any time zone
+        if index and (
+            valid_from is None or
+            zone_offsets.transitions[index - 1] > valid_from
+        ):
+            valid_from = zone_offsets.transitions[index - 1]
+
+        if index < len(zone_offsets.transitions) and (
+            valid_until is None or
+            zone_offsets.transitions[index] < valid_until
+        ):
+            valid_until = zone_offsets.transitions[index]
+
+    return OffsetGroups(
+        valid_from=valid_from,
+        valid_until=valid_until,
+        groups={offset: tuple(names) for offset, names in groups.items()}
+    )
+
+
+def zones_with_offset(low, high=None, instant=None,
+                      zones=ALL_TIMEZONE_NAMES):
+    """
+    Retrieves the sorted names of the time zones whose UTC offset at an aware
+    or naive (UTC) datetime, which defaults to now, is between the timedeltas
+    `low` and `high` (inclusive; `high` defaults to `low`).
+
+    The time zones are grouped by offset once for the period until the next
+    transition of any of them, so further lookups in that period only compare
+    the few distinct offsets.
+    """
+    if high is None:
+        high = low
+
+    if instant is None:
+        instant = _utcnow()
+
+    timestamp = _to_timestamp(instant)
+    key = tuple(zones)
+    offset_groups = _offset_groups.get(key)
+
+    if offset_groups is None or not (
+        (offset_groups.valid_from is None or
+         offset_groups.valid_from <= timestamp) and
+        (offset_groups.valid_until is None or
+         timestamp < offset_groups.valid_until)
+    ):
+        offset_groups = _build_offset_groups(key, timestamp)
+
+        with _lock:
+            _offset_groups[key] = offset_groups
+
+    low = low.total_seconds()
+    high = high.total_seconds()
+
+    return sorted(
+        name
+        for offset, names in offset_groups.groups.items()
+        if low <= offset <= high
+        for name in names
+    )
+
+
+def get_wall_transitions(zone_offsets):
+    """Retrieves the local transition times of a ZoneOffsets."""
+
+    try:
+        return _wall_transitions[zone_offsets.zone]
+    except KeyError:
+        pass
+
+    transitions = zone_offsets.transitions
+    offsets = zone_offsets.offsets
+    wall_transitions = [transitions[0] + offsets[0]]
+
+    for index in range(1, len(transitions)):
+        # A transition starts at the end of the skipped local times (moving
+        #   forward) or of the repeated ones (moving back)
+        wall_transitions.append(
+            transitions[index] + max(offsets[index - 1], offsets[index])
+        )
+
+    with _lock:
+        _wall_transitions[zone_offsets.zone] = wall_transitions
+
+    return wall_transitions
+
+
+def local_to_timestamp(zone_offsets, local_timestamp):
+    """
+    Converts a local time of the time zone (in seconds since the epoch) to UTC
+    seconds since the epoch.
+    """
+    index = bisect_right(
+        get_wall_transitions(zone_offsets),
+        local_timestamp
+    ) - 1
+
+    return local_timestamp - zone_offsets.offsets[max(index, 0)]
+
+
+def utc_from_local(zone, value):
+    """
+    Converts a naive local datetime of a time zone to an aware UTC datetime.
+    Local times skipped by a transition are moved forward by its length, and
+    repeated local times are the first of them, as with datetime's fold=0.
+    """
+    timestamp = local_to_timestamp(
+        get_zone_offsets(zone),
+        (value.replace(microsecond=0) - EPOCH) // SECOND
+    )
+
+    return pytz.utc.localize(
+        EPOCH + timedelta(seconds=timestamp, microseconds=value.microsecond)
+    )
+
+
+def offset_cache_clear():
+    """Clears the offset index."""
+
+    with _lock:
+        _zone_offsets.clear()
+        _offset_groups.clear()
+        _wall_transitions.clear()
+        _zone_arrays.clear()
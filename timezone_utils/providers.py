@@ -0,0 +1,115 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+import pytz
+
+# Django
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+# App
+from timezone_utils.zones import ALL_TIMEZONE_NAMES
+
+try:
+    import zoneinfo
+except ImportError:     # pragma: no cover
+    try:
+        from backports import zoneinfo
+    except ImportError:
+        zoneinfo = None
+
+__all__ = ('BaseProvider', 'PytzProvider', 'ZoneInfoProvider', 'PROVIDERS',
+           'DEFAULT_PROVIDER', 'get_provider', 'zone_name')
+
+
+# ==============================================================================
+# TIME ZONE PROVIDERS
+# ==============================================================================
+class BaseProvider(object):
+    """
+    Resolves time zone names to tzinfo instances. Every provider raises
+    pytz.UnknownTimeZoneError for names it cannot resolve, so callers do not
+    depend on the library behind it.
+    """
+    name = None
+
+    def get(self, name):
+        """Returns the tzinfo instance for `name`."""
+
+        raise NotImplementedError(
+            'Subclasses of BaseProvider must define get().'
+        )
+
+    def __repr__(self):
+        return '<{0}>'.format(self.__class__.__name__)
+
+
+class PytzProvider(BaseProvider):
+    """Time zones from pytz. This is the default."""
+    name = 'pytz'
+
+    def get(self, name):
+        return pytz.timezone(name)
+
+
+class ZoneInfoProvider(BaseProvider):
+    """
+    Time zones from the standard library's zoneinfo (Python 3.9+, or the
+    backports.zoneinfo package), which caches its instances and does not
+    need `localize`. Names are matched regardless of case, like pytz does.
+    """
+    name = 'zoneinfo'
+
+    def __init__(self):
+        if zoneinfo is None:    # pragma: no cover
+            raise ImportError(
+                'The zoneinfo time zone provider requires Python 3.9+ or the '
+                'backports.zoneinfo package.'
+            )
+
+        self._names = {name.lower(): name for name in ALL_TIMEZONE_NAMES}
+
+    def get(self, name):
+        try:
+            key = self._names.get(name.lower(), name)
+            return zoneinfo.ZoneInfo(key)
+        except (AttributeError, ValueError, zoneinfo.ZoneInfoNotFoundError):
+            # Not a string, a malformed key or no such time zone
+            raise pytz.UnknownTimeZoneError(name)
+
+
+PROVIDERS = {
+    PytzProvider.name: PytzProvider,
+    ZoneInfoProvider.name: ZoneInfoProvider,
+}
+
+DEFAULT_PROVIDER = PytzProvider.name
+
+
+def get_provider(provider=None):
+    """
+    Returns a provider instance for an alias (`'pytz'` or `'zoneinfo'`) or the
+    dotted path of a BaseProvider subclass. Defaults to the
+    `TIMEZONE_UTILS_PROVIDER` setting, and then to pytz.
+    """
+    if provider is None:
+        provider = DEFAULT_PROVIDER
+        if settings.configured:
+            provider = getattr(settings, 'TIMEZONE_UTILS_PROVIDER', provider)
+
+    if isinstance(provider, BaseProvider):
+        return provider
+
+    try:
+        provider_class = PROVIDERS[provider]
+    except KeyError:
+        provider_class = import_string(provider)
+
+    return provider_class()
+
+
+def zone_name(tz):
+    """Returns the name of a pytz or zoneinfo tzinfo instance."""
+
+    return getattr(tz, 'zone', None) or getattr(tz, 'key', None) or str(tz)
@@ -0,0 +1,250 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from bisect import bisect_left, bisect_right
+from datetime import datetime, time as datetime_time, timedelta
+import pytz
+
+# Django
+from django.db.models import Q
+
+# App
+from timezone_utils.offsets import (EPOCH, _to_timestamp, get_wall_transitions,
+                                    get_zone_offsets, local_to_timestamp,
+                                    utcoffset_at)
+from timezone_utils.zones import ALL_TIMEZONE_NAMES
+
+__all__ = ('next_occurrence', 'next_occurrences', 'due_intervals',
+           'due_filter')
+
+
+# ==============================================================================
+# NEXT OCCURRENCES
+# ==============================================================================
+DAY = 24 * 60 * 60
+
+
+def _utcnow():
+    """Returns the current (aware) UTC datetime."""
+    return datetime.now(pytz.utc)
+
+
+def _time_to_seconds(value):
+    """Returns the whole seconds since midnight of a datetime.time."""
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _seconds_to_time(seconds):
+    """Returns the datetime.time of a number of seconds since midnight."""
+    return datetime_time(seconds // 3600, seconds % 3600 // 60, seconds % 60)
+
+
+def next_occurrences(zones, times, after=None):
+    """
+    Retrieves, for each time zone of `zones` and local datetime.time of
+    `times` (or a single time for all of them), the next instant after the
+    aware or naive (UTC) datetime `after`, which defaults to now, at which the
+    local time in the time zone is that time. The instants are aware UTC
+    datetimes, or None for a missing time zone or time.
+
+    Local times skipped by a transition happen that much later, and repeated
+    local times happen the first time, as with LinkedTZDateTimeField's
+    time_override. Each time zone's local date is found once, and each
+    distinct (time zone, time) pair is computed once, with the offset index.
+    """
+    if isinstance(times, datetime_time):
+        zones = list(zones)
+        times = [times] * len(zones)
+    else:
+        zones = list(zones)
+        times = list(times)
+
+        if len(zones) != len(times):
+            raise ValueError('zones and times must have the same length.')
+
+    if after is None:
+        after = _utcnow()
+
+    after_timestamp = _to_timestamp(after)
+    after_key = (after_timestamp, after.microsecond)
+
+    # Time zone name -> (ZoneOffsets, local midnight in seconds)
+    local_days = {}
+    occurrences = {}
+    results = []
+
+    for zone, value in zip(zones, times):
+        if not zone or value is None:
+            results.append(None)
+            continue
+
+        name = str(zone)
+        key = (name, value)
+
+        try:
+            results.append(occurrences[key])
+            continue
+        except KeyError:
+            pass
+
+        try:
+            zone_offsets, midnight = local_days[name]
+        except KeyError:
+            zone_offsets = get_zone_offsets(name)
+            local_now = after_timestamp + int(
+                utcoffset_at(name, after).total_seconds()
+            )
+            midnight = local_now - local_now % DAY
+            local_days[name] = zone_offsets, midnight
+
+        # Yesterday's time may still be ahead when it was skipped by a
+        #   transition, so the days are tried from yesterday on
+        local = midnight - DAY + _time_to_seconds(value)
+        timestamp = local_to_timestamp(zone_offsets, local)
+
+        while (timestamp, value.microsecond) <= after_key:
+            local += DAY
+            timestamp = local_to_timestamp(zone_offsets, local)
+
+        occurrence = occurrences[key] = pytz.utc.localize(EPOCH + timedelta(
+            seconds=timestamp,
+            microseconds=value.microsecond
+        ))
+        results.append(occurrence)
+
+    return results
+
+
+def next_occurrence(zone, value, after=None):
+    """
+    Retrieves the next instant after `after` (by default, now) at which the
+    local time in `zone` is the datetime.time `value`, as an aware UTC
+    datetime.
+    """
+    return next_occurrences([zone], [value], after=after)[0]
+
+
+# ==============================================================================
+# DUE WINDOWS
+# ==============================================================================
+def due_intervals(zone, start, end):
+    """
+    Retrieves the local times of day (as sorted, disjoint (start, end) pairs of
+    seconds since midnight) which occur in a time zone from the aware or naive
+    (UTC) datetime `start` (inclusive) to `end` (exclusive), with the same
+    handling of transitions as next_occurrences().
+    """
+    zone_offsets = get_zone_offsets(zone)
+    wall_transitions = get_wall_transitions(zone_offsets)
+    start = _to_timestamp(start)
+    end = _to_timestamp(end)
+
+    if end <= start:
+        return ()
+
+    intervals = []
+
+    # The local times of a period between two local transitions are its
+    #   UTC times shifted by its offset. Offsets are within a day of UTC.
+    first = max(bisect_right(wall_transitions, start - DAY) - 1, 0)
+    last = bisect_left(wall_transitions, end + DAY)
+
+    for index in range(first, min(last + 1, len(wall_transitions))):
+        offset = zone_offsets.offsets[index]
+        local_start = max(start + offset, wall_transitions[index])
+        local_end = end + offset
+
+        if index + 1 < len(wall_transitions):
+            local_end = min(local_end, wall_transitions[index + 1])
+
+        if local_end <= local_start:
+            continue
+
+        if local_end - local_start >= DAY:
+            return ((0, DAY), )
+
+        seconds = local_start % DAY
+        length = local_end - local_start
+
+        if seconds + length <= DAY:
+            intervals.append((seconds, seconds + length))
+        else:
+            intervals.append((seconds, DAY))
+            intervals.append((0, seconds + length - DAY))
+
+    merged = []
+    for interval_start, interval_end in sorted(intervals):
+        if merged and interval_start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], interval_end))
+        else:
+            merged.append((interval_start, interval_end))
+
+    return tuple(merged)
+
+
+def _time_in_intervals(intervals, value):
+    seconds = _time_to_seconds(value) + value.microsecond / 1e6
+
+    return any(start <= seconds < end for start, end in intervals)
+
+
+def due_filter(timezone, time, start, end, zones=ALL_TIMEZONE_NAMES):
+    """
+    Returns a Q object which selects the rows whose local time occurs from
+    `start` (inclusive) to `end` (exclusive) in their time zone.
+
+    `timezone` is the name (or path) of the field holding the time zone, and
+    `time` either the name (or path) of a TimeField holding the local time or
+    a datetime.time for all rows. The time zones of `zones` are grouped by the
+    local times which are due in them, so the filter is an IN clause on the
+    time zone per group (with a range of the time field).
+    """
+    groups = {}
+
+    for zone in zones:
+        intervals = due_intervals(zone, start, end)
+
+        if isinstance(time, datetime_time):
+            if not _time_in_intervals(intervals, time):
+                continue
+
+            intervals = ((0, DAY), )
+
+        if intervals:
+            groups.setdefault(intervals, []).append(zone)
+
+    timezone_in = '{0}__in'.format(timezone)
+
+    if not groups:
+        return Q(**{timezone_in: []})
+
+    due = Q()
+
+    for intervals, names in groups.items():
+        if isinstance(time, datetime_time):
+            due |= Q(**{timezone_in: names})
+            continue
+
+        if intervals == ((0, DAY), ):
+            due |= Q(**{timezone_in: names}) & Q(**{
+                '{0}__isnull'.format(time): False
+            })
+            continue
+
+        times = Q()
+        for interval_start, interval_end in intervals:
+            in_interval = Q(**{
+                '{0}__gte'.format(time): _seconds_to_time(interval_start)
+            })
+
+            if interval_end < DAY:
+                in_interval &= Q(**{
+                    '{0}__lt'.format(time): _seconds_to_time(interval_end)
+                })
+
+            times |= in_interval
+
+        due |= Q(**{timezone_in: names}) & times
+
+    return due
@@ -0,0 +1,106 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+import threading
+
+# App
+from timezone_utils.choices import get_choices
+from timezone_utils.zones import ALL_TIMEZONE_NAMES
+
+__all__ = ('TimeZoneIndex', 'get_timezone_index', 'search_timezones')
+
+
+# ==============================================================================
+# TIME ZONE SEARCH
+# ==============================================================================
+class TimeZoneIndex(object):
+    """
+    In-memory search index over the pretty choices ("(GMT-05:00) US/Eastern")
+    of some time zones. The index follows the offset changes of the choices,
+    which get_choices memoizes, and is only rebuilt when they change.
+    """
+
+    def __init__(self, timezones=ALL_TIMEZONE_NAMES):
+        self.timezones = tuple(timezones)
+        self._choices = None
+        self._entries = ()
+        self._lock = threading.Lock()
+
+    def _get_entries(self):
+        choices = get_choices(self.timezones)
+
+        if choices is not self._choices:
+            # (name, label, name segments, lowercase label) for each choice.
+            #   Every segment of "America/New_York" starts with a "/" in
+            #   "/america/new/york", so a prefix of any segment is found with
+            #   a single substring test.
+            entries = [
+                (
+                    name,
+                    label,
+                    '/' + name.lower().replace('_', '/'),
+                    label.lower()
+                )
+                for name, label in choices
+            ]
+
+            with self._lock:
+                self._entries = entries
+                self._choices = choices
+
+        return self._entries
+
+    def search(self, term, offset=0, limit=20):
+        """
+        Searches the time zones for `term` and returns `(results, more)`: up
+        to `limit` (name, label) pairs from `offset`, and whether there are
+        more of them.
+
+        Time zones with a name or name segment which starts with `term` (so
+        "york" finds America/New_York) come first, followed by the time zones
+        whose label contains it ("+05:30" finds Asia/Kolkata). Both are in
+        offset order, and an empty `term` matches every time zone.
+        """
+        entries = self._get_entries()
+        term = term.strip().lower().replace(' ', '_')
+
+        if term:
+            prefix = '/' + term.replace('_', '/')
+            starts = []
+            contains = []
+
+            for entry in entries:
+                if prefix in entry[2]:
+                    starts.append(entry)
+                elif term in entry[3]:
+                    contains.append(entry)
+
+            entries = starts + contains
+
+        results = [
+            (name, label)
+            for name, label, _, _ in entries[offset:offset + limit]
+        ]
+
+        return results, offset + limit < len(entries)
+
+
+_indexes = {}
+
+
+def get_timezone_index(timezones=ALL_TIMEZONE_NAMES):
+    """Retrieves the shared TimeZoneIndex of a list of time zones."""
+
+    key = tuple(timezones)
+
+    try:
+        return _indexes[key]
+    except KeyError:
+        return _indexes.setdefault(key, TimeZoneIndex(key))
+
+
+def search_timezones(term, timezones=ALL_TIMEZONE_NAMES, offset=0, limit=20):
+    """Searches the time zones with their shared TimeZoneIndex."""
+
+    return get_timezone_index(timezones).search(term, offset, limit)
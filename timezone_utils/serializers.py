@@ -0,0 +1,226 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from datetime import datetime, tzinfo
+
+import pytz
+
+# Django
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.constants import LOOKUP_SEP
+from django.utils.translation import gettext_lazy as _
+
+# App
+from timezone_utils import fields
+from timezone_utils.cache import timezone_cache
+from timezone_utils.providers import zone_name
+
+try:
+    from rest_framework import ISO_8601, serializers
+    from rest_framework.settings import api_settings
+except ImportError:     # pragma: no cover
+    raise ImportError(
+        'timezone_utils.serializers requires the djangorestframework package.'
+    )
+
+__all__ = ('TimeZoneField', 'LinkedTZDateTimeField',
+           'TimeZoneModelSerializer')
+
+
+# ==============================================================================
+# SERIALIZER FIELDS
+# ==============================================================================
+# Context key of the time zones memoized by LinkedTZDateTimeField for the
+#   objects of a serializer (and so of a response)
+ZONES_CONTEXT_KEY = 'timezone_utils_zones'
+
+
+class TimeZoneField(serializers.CharField):
+    """
+    Serializes a tzinfo instance (or a name) as the time zone name, and
+    deserializes names to tzinfo instances from the shared time zone cache.
+    """
+    default_error_messages = {
+        'invalid': _("'{value}' is not a valid time zone."),
+    }
+
+    def to_representation(self, value):
+        if isinstance(value, tzinfo):
+            return zone_name(value)
+
+        # pylint: disable=newstyle
+        return super(TimeZoneField, self).to_representation(value)
+
+    def run_validation(self, data=serializers.empty):
+        # The name is resolved after the validators (such as the model field's
+        #   max length) have run against it
+        # pylint: disable=newstyle
+        value = super(TimeZoneField, self).run_validation(data)
+
+        if not value:
+            return value
+
+        try:
+            return timezone_cache.get(value)
+        except pytz.UnknownTimeZoneError:
+            self.fail('invalid', value=value)
+
+
+class LinkedTZDateTimeField(serializers.DateTimeField):
+    """
+    Serializes a datetime in the time zone of its object's `populate_from`
+    (a field name, a path through relations or a callable taking the object),
+    which defaults to that of the model's LinkedTZDateTimeField.
+
+    The time zones are memoized in the serializer's context, so every object
+    of a response with the same time zone (or, for a path through a foreign
+    key, the same related object) shares one lookup. Values without a time
+    zone are serialized as DateTimeField serializes them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.populate_from = kwargs.pop('populate_from', None)
+
+        # pylint: disable=newstyle
+        super(LinkedTZDateTimeField, self).__init__(*args, **kwargs)
+
+    def bind(self, field_name, parent):
+        # pylint: disable=newstyle
+        super(LinkedTZDateTimeField, self).bind(field_name, parent)
+
+        if self.populate_from is None:
+            model = getattr(getattr(parent, 'Meta', None), 'model', None)
+
+            try:
+                model_field = model._meta.get_field(self.source)
+            except (AttributeError, FieldDoesNotExist):
+                model_field = None
+
+            if isinstance(model_field, fields.LinkedTZDateTimeField):
+                self.populate_from = model_field.populate_from
+
+        self._memo_attname = None
+
+        if self.populate_from is not None and not callable(self.populate_from):
+            self._path = self.populate_from.split(LOOKUP_SEP)
+
+            # The time zone of a path through a foreign key is memoized by
+            #   the key's value, which is on the object without a query
+            model = getattr(getattr(parent, 'Meta', None), 'model', None)
+            try:
+                first_field = model._meta.get_field(self._path[0])
+            except (AttributeError, FieldDoesNotExist):
+                first_field = None
+
+            if len(self._path) > 1 and getattr(
+                first_field,
+                'many_to_one',
+                False
+            ):
+                self._memo_attname = first_field.attname
+
+    def _get_populate_from_value(self, instance):
+        """Retrieves the value of `populate_from` for the object."""
+
+        if callable(self.populate_from):
+            return self.populate_from(instance)
+
+        value = instance
+        for name in self._path:
+            value = getattr(value, name, None)
+            if value is None:
+                return None
+
+        return value
+
+    def _get_timezone(self, instance):
+        """Retrieves the (memoized) time zone of the object, or None."""
+
+        zones = self.context.setdefault(ZONES_CONTEXT_KEY, {})
+
+        if self._memo_attname is not None:
+            # Nested serializers share the context, so the key is the field
+            #   rather than its (possibly repeated) name
+            key = (id(self), getattr(instance, self._memo_attname, None))
+
+            try:
+                return zones[key]
+            except KeyError:
+                pass
+
+            tz = zones[key] = self._resolve(
+                zones,
+                self._get_populate_from_value(instance)
+            )
+            return tz
+
+        return self._resolve(zones, self._get_populate_from_value(instance))
+
+    def _resolve(self, zones, value):
+        """Resolves a time zone name or instance, memoized by `zones`."""
+
+        if not value or isinstance(value, tzinfo):
+            return value or None
+
+        try:
+            return zones[value]
+        except KeyError:
+            tz = zones[value] = timezone_cache.get(str(value))
+            return tz
+
+    def get_attribute(self, instance):
+        # pylint: disable=newstyle
+        value = super(LinkedTZDateTimeField, self).get_attribute(instance)
+
+        if not isinstance(value, datetime) or self.populate_from is None:
+            return value
+
+        tz = self._get_timezone(instance)
+
+        if tz is None or value.tzinfo is None:
+            return self.enforce_timezone(value)
+
+        return value.astimezone(tz)
+
+    def to_representation(self, value):
+        """
+        Formats the value like DateTimeField, but keeps the time zone of aware
+        values, which get_attribute() has localized.
+        """
+        if not value:
+            return None
+
+        output_format = getattr(self, 'format', api_settings.DATETIME_FORMAT)
+
+        if output_format is None or isinstance(value, str):
+            return value
+
+        if value.tzinfo is None:
+            value = self.enforce_timezone(value)
+
+        if output_format.lower() == ISO_8601:
+            value = value.isoformat()
+            if value.endswith('+00:00'):
+                value = value[:-6] + 'Z'
+            return value
+
+        return value.strftime(output_format)
+
+
+# ==============================================================================
+# SERIALIZERS
+# ==============================================================================
+class TimeZoneModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer which uses the fields above for TimeZoneFields and
+    TimeZoneIDFields (without choices) and LinkedTZDateTimeFields.
+    """
+    serializer_field_mapping = dict(
+        serializers.ModelSerializer.serializer_field_mapping
+    )
+    serializer_field_mapping.update({
+        fields.TimeZoneField: TimeZoneField,
+        fields.TimeZoneIDField: TimeZoneField,
+        fields.LinkedTZDateTimeField: LinkedTZDateTimeField,
+    })
@@ -0,0 +1,84 @@
+/*
+ * Fills the <datalist> of each TimeZoneSearchInput with the time zones which
+ * TimeZoneSearchView finds for what has been typed.
+ */
+(function () {
+    'use strict';
+
+    var DELAY = 150;
+
+    function attach(input) {
+        if (input.getAttribute('data-timezone-search-bound')) {
+            return;
+        }
+        input.setAttribute('data-timezone-search-bound', 'true');
+
+        var list = document.getElementById(input.getAttribute('list'));
+        var url = input.getAttribute('data-timezone-search-url');
+        var minLength = parseInt(
+            input.getAttribute('data-timezone-search-min-length'), 10
+        ) || 0;
+        var timer = null;
+        var controller = null;
+        var lastTerm = null;
+
+        function search() {
+            var term = input.value.trim();
+
+            if (term === lastTerm || term.length < minLength) {
+                return;
+            }
+            lastTerm = term;
+
+            // Only the latest search fills the list
+            if (controller) {
+                controller.abort();
+            }
+            controller = window.AbortController ? new AbortController() : null;
+
+            window.fetch(
+                url + (url.indexOf('?') === -1 ? '?' : '&') +
+                    'term=' + encodeURIComponent(term),
+                {
+                    headers: {'Accept': 'application/json'},
+                    signal: controller ? controller.signal : undefined
+                }
+            ).then(function (response) {
+                return response.json();
+            }).then(function (data) {
+                list.textContent = '';
+                data.results.forEach(function (result) {
+                    var option = document.createElement('option');
+                    option.value = result.id;
+                    option.label = result.text;
+                    list.appendChild(option);
+                });
+            }).catch(function () {
+                // Aborted or failed searches leave the suggestions as they are
+            });
+        }
+
+        input.addEventListener('input', function () {
+            window.clearTimeout(timer);
+            timer = window.setTimeout(search, DELAY);
+        });
+    }
+
+    function init(root) {
+        var inputs = root.querySelectorAll('input[data-timezone-search-url]');
+        Array.prototype.forEach.call(inputs, attach);
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', function () {
+            init(document);
+        });
+    } else {
+        init(document);
+    }
+
+    // Forms added to admin inline formsets
+    document.addEventListener('formset:added', function (event) {
+        init(event.target);
+    });
+})();
@@ -0,0 +1,18 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Django
+from django.urls import path
+
+# App
+from timezone_utils.views import TimeZoneSearchView
+
+app_name = 'timezone_utils'
+
+
+# ==============================================================================
+# URLS
+# ==============================================================================
+urlpatterns = [
+    path('search/', TimeZoneSearchView.as_view(), name='timezone_search'),
+]
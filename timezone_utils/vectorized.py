@@ -0,0 +1,127 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from bisect import bisect_right
+
+# App
+from timezone_utils import zone_ids
+from timezone_utils.offsets import _zone_arrays, get_zone_offsets
+
+try:
+    import numpy
+except ImportError:     # pragma: no cover
+    numpy = None
+
+__all__ = ('localize_epochs', )
+
+
+# ==============================================================================
+# BULK LOCALIZATION
+# ==============================================================================
+def _get_zone_name(zone):
+    """Retrieves the time zone name of a name, tzinfo or TimeZoneIDField ID."""
+
+    if isinstance(zone, str):
+        return zone
+
+    if numpy is not None and isinstance(zone, numpy.integer):
+        zone = int(zone)
+
+    if isinstance(zone, int):
+        return zone_ids.get_zone_name(zone)
+
+    return str(zone)
+
+
+def _get_zone_arrays(name):
+    try:
+        return _zone_arrays[name]
+    except KeyError:
+        zone_offsets = get_zone_offsets(name)
+        arrays = _zone_arrays[name] = (
+            numpy.asarray(zone_offsets.transitions, dtype=numpy.int64),
+            numpy.asarray(zone_offsets.offsets, dtype=numpy.int64),
+        )
+        return arrays
+
+
+def _localize_numpy(epochs, zones):
+    epochs = numpy.asarray(epochs)
+
+    # numpy would make strings of the IDs in a mix of names and IDs
+    if not isinstance(zones, numpy.ndarray):
+        zones = numpy.asarray(zones, dtype=object)
+
+    # tzinfo instances (or a mix of names and IDs) cannot be sorted by
+    #   numpy.unique
+    if zones.dtype == object:
+        zones = numpy.asarray([_get_zone_name(zone) for zone in zones])
+
+    if epochs.shape != zones.shape:
+        raise ValueError('epochs and zones must have the same length.')
+
+    offsets = numpy.zeros(epochs.shape, dtype=numpy.int64)
+
+    # Look up each distinct time zone once, for all of its values at once
+    unique_zones, inverse = numpy.unique(zones, return_inverse=True)
+    inverse = inverse.reshape(zones.shape)
+
+    for index, zone in enumerate(unique_zones.tolist()):
+        mask = inverse == index
+        transitions, zone_offsets = _get_zone_arrays(_get_zone_name(zone))
+        positions = numpy.searchsorted(
+            transitions,
+            epochs[mask],
+            side='right'
+        ) - 1
+        offsets[mask] = zone_offsets[numpy.maximum(positions, 0)]
+
+    return epochs + offsets, offsets
+
+
+def _localize_python(epochs, zones):
+    epochs = list(epochs)
+    zones = list(zones)
+
+    if len(epochs) != len(zones):
+        raise ValueError('epochs and zones must have the same length.')
+
+    offsets = []
+    zone_offsets_memo = {}
+
+    for epoch, zone in zip(epochs, zones):
+        try:
+            zone_offsets = zone_offsets_memo[zone]
+        except KeyError:
+            zone_offsets = zone_offsets_memo[zone] = get_zone_offsets(
+                _get_zone_name(zone)
+            )
+
+        index = bisect_right(zone_offsets.transitions, epoch) - 1
+        offsets.append(zone_offsets.offsets[max(index, 0)])
+
+    return [epoch + offset for epoch, offset in zip(epochs, offsets)], offsets
+
+
+def localize_epochs(epochs, zones, use_numpy=None):
+    """
+    Localizes many UTC timestamps at once.
+
+    `epochs` are UTC seconds since the epoch and `zones` are, for each of
+    them, a time zone name, tzinfo instance or TimeZoneIDField ID. Returns
+    `(local_epochs, offsets)`: the local wall-clock times (as seconds since
+    the epoch) and the UTC offsets in seconds.
+
+    Uses numpy (returning arrays) when it is installed, unless `use_numpy` is
+    False, and falls back to pure Python (returning lists).
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+
+    if use_numpy:
+        if numpy is None:
+            raise ImportError('numpy is required when use_numpy is True.')
+        return _localize_numpy(epochs, zones)
+
+    return _localize_python(epochs, zones)
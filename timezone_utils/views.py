@@ -0,0 +1,49 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Django
+from django.http import JsonResponse
+from django.views.generic import View
+
+# App
+from timezone_utils.search import get_timezone_index
+from timezone_utils.zones import ALL_TIMEZONE_NAMES
+
+__all__ = ('TimeZoneSearchView', )
+
+
+# ==============================================================================
+# VIEWS
+# ==============================================================================
+class TimeZoneSearchView(View):
+    """
+    Serves the time zones matching the `term` query parameter, one `page` at
+    a time, as JSON in the format of the admin's autocomplete views:
+
+        {"results": [{"id": "US/Eastern", "text": "(GMT-05:00) US/Eastern"}],
+         "pagination": {"more": false}}
+
+    Set `timezones` (with as_view() or in a subclass) to search other time
+    zones than pytz.all_timezones.
+    """
+    timezones = ALL_TIMEZONE_NAMES
+    paginate_by = 20
+
+    def get(self, request, *args, **kwargs):
+        try:
+            page = max(int(request.GET.get('page', 1)), 1)
+        except ValueError:
+            page = 1
+
+        results, more = get_timezone_index(self.timezones).search(
+            term=request.GET.get('term', ''),
+            offset=(page - 1) * self.paginate_by,
+            limit=self.paginate_by
+        )
+
+        return JsonResponse({
+            'results': [
+                {'id': name, 'text': label} for name, label in results
+            ],
+            'pagination': {'more': more},
+        })
@@ -0,0 +1,200 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from collections import OrderedDict
+from datetime import tzinfo
+import threading
+
+# Django
+from django.forms import Select, TextInput, Widget
+from django.forms.renderers import get_default_renderer
+from django.urls import reverse
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+# App
+from timezone_utils.choices import LazyChoices
+from timezone_utils.providers import zone_name
+
+__all__ = ('TimeZoneSearchInput', 'TimeZoneSelect')
+
+
+# ==============================================================================
+# WIDGETS
+# ==============================================================================
+class TimeZoneSearchInput(TextInput):
+    """
+    A text input which suggests time zones from TimeZoneSearchView as the
+    user types, instead of rendering an <option> for each time zone.
+
+    `url` defaults to the `timezone_utils:timezone_search` URL, and
+    `min_length` is the number of characters typed before searching.
+    """
+    template_name = 'timezone_utils/widgets/timezone_search.html'
+
+    class Media:
+        js = ('timezone_utils/js/timezone-search.js', )
+
+    def __init__(self, attrs=None, url=None, min_length=1):
+        # pylint: disable=newstyle
+        super(TimeZoneSearchInput, self).__init__(attrs)
+        self.url = url
+        self.min_length = min_length
+
+    def format_value(self, value):
+        if isinstance(value, tzinfo):
+            value = zone_name(value)
+
+        # pylint: disable=newstyle
+        return super(TimeZoneSearchInput, self).format_value(value)
+
+    def get_context(self, name, value, attrs):
+        # pylint: disable=newstyle
+        context = super(TimeZoneSearchInput, self).get_context(
+            name,
+            value,
+            attrs
+        )
+        widget_attrs = context['widget']['attrs']
+        list_id = '{0}_list'.format(widget_attrs.get('id') or name)
+
+        widget_attrs.setdefault('autocomplete', 'off')
+        widget_attrs.update({
+            'list': list_id,
+            'data-timezone-search-url': str(
+                self.url or reverse('timezone_utils:timezone_search')
+            ),
+            'data-timezone-search-min-length': self.min_length,
+        })
+        context['widget']['list_id'] = list_id
+        return context
+
+
+# (widget class, option template, choices, language) -> rendered <option>s
+_options_cache = OrderedDict()
+_options_lock = threading.Lock()
+
+# Number of rendered option lists kept by TimeZoneSelect
+OPTIONS_CACHE_SIZE = 16
+
+
+class TimeZoneSelect(Select):
+    """
+    A Select which renders its <option> elements once per choices and
+    language, and then only marks the selected option on each render.
+
+    The choices are part of the cache key, so the options are rendered again
+    when the offsets in the labels change. LazyChoices (such as
+    GROUPED_ALL_TIMEZONES_CHOICES) are kept as they are rather than copied to
+    a list, so they follow the offset changes too. The output is the same as
+    Select's.
+    """
+    template_name = 'timezone_utils/widgets/timezone_select.html'
+    options_template_name = (
+        'timezone_utils/widgets/timezone_select_options.html'
+    )
+
+    def __init__(self, attrs=None, choices=()):
+        lazy = isinstance(choices, LazyChoices)
+
+        # pylint: disable=newstyle
+        super(TimeZoneSelect, self).__init__(attrs, () if lazy else choices)
+
+        if lazy:
+            # Not evaluated until the widget is rendered
+            self.choices = choices
+
+    def __deepcopy__(self, memo):
+        # pylint: disable=newstyle
+        obj = super(TimeZoneSelect, self).__deepcopy__(memo)
+
+        if isinstance(self.choices, LazyChoices):
+            obj.choices = self.choices
+
+        return obj
+
+    def format_value(self, value):
+        if isinstance(value, tzinfo):
+            value = zone_name(value)
+
+        # pylint: disable=newstyle
+        return super(TimeZoneSelect, self).format_value(value)
+
+    def get_context(self, name, value, attrs):
+        # Skip building the options (ChoiceWidget.get_context), which is what
+        #   the cache avoids
+        context = Widget.get_context(self, name, value, attrs)
+
+        if self.allow_multiple_selected:
+            context['widget']['attrs']['multiple'] = True
+
+        return context
+
+    def render(self, name, value, attrs=None, renderer=None):
+        try:
+            key = (
+                self.__class__,
+                self.option_template_name,
+                tuple(self.choices),
+                get_language(),
+            )
+            hash(key)
+        except TypeError:
+            # Unhashable choices are rendered every time, as Select does
+            # pylint: disable=newstyle
+            return self._render(
+                super(TimeZoneSelect, self).template_name,
+                super(TimeZoneSelect, self).get_context(name, value, attrs),
+                renderer
+            )
+
+        context = self.get_context(name, value, attrs)
+        context['widget']['options'] = mark_safe(self._select_options(
+            self._get_options_html(key, name, renderer),
+            context['widget']['value']
+        ))
+        return self._render(self.template_name, context, renderer)
+
+    def _get_options_html(self, key, name, renderer):
+        """Retrieves (or renders) the <option>s, none of them selected."""
+
+        with _options_lock:
+            try:
+                _options_cache.move_to_end(key)
+                return _options_cache[key]
+            except KeyError:
+                pass
+
+        # Not renderer.render(), which strips the whitespace around the
+        #   options that Select renders
+        html = (renderer or get_default_renderer()).get_template(
+            self.options_template_name
+        ).render({'widget': {'optgroups': self.optgroups(name, [])}})
+
+        with _options_lock:
+            _options_cache[key] = html
+
+            while len(_options_cache) > OPTIONS_CACHE_SIZE:
+                _options_cache.popitem(last=False)
+
+        return html
+
+    def _select_options(self, html, values):
+        """Marks the options of `values` as selected, like optgroups()."""
+
+        for value in values:
+            option = '<option value="{0}">'.format(escape(value))
+            index = html.find(option)
+
+            if index == -1:
+                continue
+
+            index += len(option) - 1
+            html = html[:index] + ' selected' + html[index:]
+
+            if not self.allow_multiple_selected:
+                break
+
+        return html
@@ -0,0 +1,145 @@
+# ==============================================================================
+# IMPORTS
+# ==============================================================================
+# Python
+from collections import namedtuple
+import threading
+
+import pytz
+
+__all__ = ('PYTZ_VERSION', 'ALL_TIMEZONE_NAMES', 'COMMON_TIMEZONE_NAMES',
+           'ALL_TIMEZONES', 'COMMON_TIMEZONES', 'MAX_LENGTH', 'ZoneMetadata',
+           'is_valid_timezone', 'is_common_timezone', 'invalid_timezones',
+           'get_canonical_name', 'get_zone_metadata')
+
+
+# ==============================================================================
+# ZONE REGISTRY
+# ==============================================================================
+# Everything here is computed once per process from the installed pytz
+PYTZ_VERSION = pytz.VERSION
+
+# Sorted names, as in pytz.all_timezones and pytz.common_timezones
+ALL_TIMEZONE_NAMES = tuple(pytz.all_timezones)
+COMMON_TIMEZONE_NAMES = tuple(pytz.common_timezones)
+
+# Set versions of the names, for membership tests
+ALL_TIMEZONES = frozenset(ALL_TIMEZONE_NAMES)
+COMMON_TIMEZONES = frozenset(COMMON_TIMEZONE_NAMES)
+
+# Length of the longest time zone name
+MAX_LENGTH = max(map(len, ALL_TIMEZONE_NAMES))
+
+ZoneMetadata = namedtuple('ZoneMetadata', 'name length canonical common')
+
+_links = None
+_links_lock = threading.Lock()
+
+
+def is_valid_timezone(name):
+    """Returns whether `name` is found in pytz.all_timezones."""
+
+    try:
+        return name in ALL_TIMEZONES
+    except TypeError:
+        # Unhashable values are not time zone names
+        return False
+
+
+def is_common_timezone(name):
+    """Returns whether `name` is found in pytz.common_timezones."""
+
+    try:
+        return name in COMMON_TIMEZONES
+    except TypeError:
+        return False
+
+
+def invalid_timezones(names, ignore=()):
+    """
+    Returns the names which are not found in pytz.all_timezones, in order and
+    without duplicates, skipping the values in `ignore`.
+    """
+    names = list(names)
+
+    # Fast path: every name is valid
+    try:
+        if ALL_TIMEZONES.issuperset(names):
+            return []
+    except TypeError:
+        pass
+
+    invalid = []
+
+    for name in names:
+        if name in ignore or name in invalid or is_valid_timezone(name):
+            continue
+
+        invalid.append(name)
+
+    return invalid
+
+
+def _load_links():
+    """
+    Parses the links (alias -> target zone) from the `tzdata.zi` file which
+    pytz ships. Returns an empty map if this version of pytz does not ship it.
+    """
+    links = {}
+
+    try:
+        resource = pytz.open_resource('tzdata.zi')
+    except (IOError, OSError, ValueError):     # pragma: no cover
+        return links
+
+    with resource:
+        for line in resource:
+            if not line.startswith(b'L '):
+                continue
+
+            _marker, target, link = line.decode('ascii').split()[:3]
+            links[link] = target
+
+    return links
+
+
+def get_canonical_name(name):
+    """
+    Returns the name of the zone which the time zone `name` links to (e.g.
+    'America/New_York' for 'US/Eastern'), or `name` itself for a canonical
+    zone.
+
+    Raises pytz.UnknownTimeZoneError if `name` is not in pytz.all_timezones.
+    """
+    global _links
+
+    if not is_valid_timezone(name):
+        raise pytz.UnknownTimeZoneError(name)
+
+    if _links is None:
+        with _links_lock:
+            if _links is None:
+                _links = _load_links()
+
+    # Follow chained links, without looping on a malformed file
+    seen = set()
+    while name in _links and name not in seen:
+        seen.add(name)
+        name = _links[name]
+
+    return name
+
+
+def get_zone_metadata(name):
+    """
+    Returns the ZoneMetadata (name, length, canonical name and whether it is
+    a common time zone) of the time zone `name`.
+
+    Raises pytz.UnknownTimeZoneError if `name` is not in pytz.all_timezones.
+    """
+    return ZoneMetadata(
+        name=name,
+        length=len(name),
+        canonical=get_canonical_name(name),
+        common=is_common_timezone(name),
+    )